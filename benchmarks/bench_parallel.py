@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright Sylvain Bouveret, Yann Chevaleyre and François Durand
+sylvain.bouveret@imag.fr, yann.chevaleyre@dauphine.fr, fradurand@gmail.com
+
+This file is part of Whalrus.
+
+Whalrus is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Whalrus is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
+
+Compare :func:`evaluate_in_parallel` with a single call of the rule, on a large profile of :class:`BallotOrder`
+objects. Usage::
+
+    python benchmarks/bench_parallel.py --n-voters 200000 --n-candidates 8 --n-jobs 4
+"""
+import argparse
+import os
+import time
+from whalrus import evaluate_in_parallel, GeneratorImpartialCulture, Profile, RuleBorda, RuleSchulze
+
+
+def timed(f, repeat: int) -> float:
+    """Best time of `repeat` calls of `f`, in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        f()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare evaluate_in_parallel with a single call of the rule.')
+    parser.add_argument('--n-voters', type=int, default=200000)
+    parser.add_argument('--n-candidates', type=int, default=8)
+    parser.add_argument('--n-jobs', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    candidates = ['c%s' % i for i in range(args.n_candidates)]
+    generator = GeneratorImpartialCulture(candidates=candidates, seed=42)
+    profile = Profile(generator(n_voters=args.n_voters).ballots)
+    print('%s voters, %s candidates, %s jobs.' % (args.n_voters, args.n_candidates, args.n_jobs))
+    for x in [RuleBorda(), RuleSchulze()]:
+        sequential = timed(lambda: x(profile).winner_, args.repeat)
+        parallel = timed(lambda: evaluate_in_parallel(x, profile, n_jobs=args.n_jobs).winner_, args.repeat)
+        print('%s: sequential %.3f s, parallel %.3f s (speedup %.2f).'
+              % (type(x).__name__, sequential, parallel, sequential / parallel))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright Sylvain Bouveret, Yann Chevaleyre and François Durand
+sylvain.bouveret@imag.fr, yann.chevaleyre@dauphine.fr, fradurand@gmail.com
+
+This file is part of Whalrus.
+
+Whalrus is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Whalrus is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
+
+Measure the time of ``import whalrus`` and of loading a simple rule in a fresh interpreter, compared with the import of
+numpy (which is only loaded by the rules that need it). Usage::
+
+    python benchmarks/bench_startup.py --repeat 10
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STATEMENTS = ['import whalrus', 'import whalrus; from whalrus import RulePlurality',
+              'import whalrus; from whalrus import RuleBorda', 'import numpy']
+
+
+def import_time(statement: str, repeat: int) -> float:
+    """Best time of `statement` over `repeat` cold starts, in seconds."""
+    code = 'from time import perf_counter; start = perf_counter(); %s; print(perf_counter() - start)' % statement
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT, os.environ.get('PYTHONPATH', '')]))
+    return min(float(subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                                    cwd=ROOT, env=env).stdout)
+               for _ in range(repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the startup time of whalrus.')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    for statement in STATEMENTS:
+        print('%s: %.1f ms.' % (statement, 1000 * import_time(statement, args.repeat)))
+
+
+if __name__ == '__main__':
+    main()
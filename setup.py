@@ -11,7 +11,7 @@ with open('README.rst') as readme_file:
 with open('HISTORY.rst') as history_file:
     history = history_file.read()
 
-requirements = ['Click>=6.0', 'numpy', 'toolz', 'pyparsing']
+requirements = ['Click>=6.0', 'numpy>=1.20', 'toolz']
 
 setup_requirements = ['pytest-runner', ]
 
@@ -26,7 +26,6 @@ setup(
         'License :: OSI Approved :: GNU General Public License v3 (GPLv3)',
         'Natural Language :: English',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3.8',
     ],
@@ -43,6 +42,7 @@ setup(
     keywords='whalrus',
     name='whalrus',
     packages=find_packages(),
+    python_requires='>=3.7',
     setup_requires=setup_requirements,
     test_suite='tests',
     tests_require=test_requirements,
@@ -19,7 +19,7 @@ This file is part of Whalrus.
     along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
 """
 import pytest
-from pyparsing import ParseException
+from whalrus.utils.utils import WeakOrderParseError
 from whalrus import BallotOrder
 from whalrus import Priority
 
@@ -35,7 +35,7 @@ def test_create_ballot():
     assert repr(BallotOrder(({'A', 'B'}, 'C'))) == \
         "BallotOrder([{'A', 'B'}, 'C'], candidates={'A', 'B', 'C'})"
 
-    with pytest.raises(ParseException):
+    with pytest.raises(WeakOrderParseError):
         # Try to parse the string, but fails.
         BallotOrder('A * B')
 
@@ -111,3 +111,16 @@ def test_type_error():
     with pytest.raises(TypeError):
         ballot.last(candidates={'a', 'b'}, priority=Priority.ASCENDING, include_unordered=True,
                     unexpected_argument=42)
+
+
+def test_restriction_cache():
+    ballot = BallotOrder('a > b ~ c > d')
+    restricted = ballot.restrict(candidates={'a', 'c', 'e'})
+    assert restricted == BallotOrder('a > c')
+    assert ballot.restrict(candidates=frozenset({'a', 'c', 'e'})) is restricted
+    assert BallotOrder('a > b ~ c > d').restrict(candidates={'a', 'c', 'e'}) is not restricted
+    maxsize = BallotOrder.restriction_cache.maxsize
+    BallotOrder.restriction_cache.maxsize = 0
+    BallotOrder.restriction_cache.clear()
+    assert ballot.restrict(candidates={'a', 'c', 'e'}) is not ballot.restrict(candidates={'a', 'c', 'e'})
+    BallotOrder.restriction_cache.maxsize = maxsize
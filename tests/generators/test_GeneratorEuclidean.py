@@ -0,0 +1,10 @@
+from whalrus import GeneratorEuclidean
+
+
+def test_random_positions():
+    generator = GeneratorEuclidean(candidates={'a', 'b', 'c', 'd'}, n_dimensions=2, seed=0)
+    profile = generator(50)
+    assert generator.positions_.shape == (4, 2)
+    assert profile.is_strict
+    generator(50)
+    assert generator.positions_.shape == (4, 2)
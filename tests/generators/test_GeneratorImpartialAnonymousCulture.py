@@ -0,0 +1,18 @@
+from collections import Counter
+from whalrus import GeneratorImpartialAnonymousCulture
+
+
+def test_anonymous_profiles_are_uniform():
+    # With 2 candidates and 3 voters, the number of voters preferring `a` is uniform in {0, 1, 2, 3}.
+    generator = GeneratorImpartialAnonymousCulture(candidates={'a', 'b'}, seed=0)
+    counts = Counter(int((profile.ranks[:, 0] == 0).sum()) for profile in generator.iterate(3, 4000))
+    assert sorted(counts) == [0, 1, 2, 3]
+    assert all(900 < n < 1100 for n in counts.values())
+
+
+def test_many_candidates():
+    generator = GeneratorImpartialAnonymousCulture(candidates=list(range(200)), seed=0)
+    profile = generator(n_voters=3)
+    assert profile.ranks.shape == (3, 200)
+    # With so many candidates, two voters have the same order with a negligible probability.
+    assert len(profile.compressed()) == 3
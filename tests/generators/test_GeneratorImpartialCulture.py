@@ -0,0 +1,17 @@
+import numpy as np
+from whalrus import GeneratorImpartialCulture, RuleBorda
+
+
+def test_seed():
+    profiles_1 = list(GeneratorImpartialCulture(candidates={'a', 'b', 'c', 'd'}, seed=1).iterate(10, 3))
+    profiles_2 = list(GeneratorImpartialCulture(candidates={'a', 'b', 'c', 'd'}, seed=1).iterate(10, 3))
+    for profile_1, profile_2 in zip(profiles_1, profiles_2):
+        assert np.array_equal(profile_1.ranks, profile_2.ranks)
+    assert not np.array_equal(profiles_1[0].ranks, profiles_1[1].ranks)
+
+
+def test_uniform():
+    profile = GeneratorImpartialCulture(candidates={'a', 'b', 'c'}, seed=0)(6000, compress=True)
+    assert len(profile) == 6
+    assert all(900 < w < 1100 for w in profile.weights)
+    assert RuleBorda(profile).candidates_ == {'a', 'b', 'c'}
@@ -0,0 +1,14 @@
+from whalrus import GeneratorMallows
+
+
+def test_phi_0():
+    profile = GeneratorMallows(candidates={'a', 'b', 'c', 'd'}, phi=0, reference=['c', 'a', 'd', 'b'])(20,
+                                                                                                      compress=True)
+    assert len(profile) == 1
+    assert profile[0].as_strict_order == ['c', 'a', 'd', 'b']
+
+
+def test_phi_1_is_uniform():
+    profile = GeneratorMallows(candidates={'a', 'b', 'c'}, phi=1, seed=0)(6000, compress=True)
+    assert len(profile) == 6
+    assert all(900 < w < 1100 for w in profile.weights)
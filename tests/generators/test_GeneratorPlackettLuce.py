@@ -0,0 +1,10 @@
+from whalrus import GeneratorPlackettLuce
+
+
+def test_first_choice():
+    generator = GeneratorPlackettLuce(candidates={'a', 'b', 'c'}, weights={'a': 3, 'b': 1, 'c': 1}, seed=0)
+    ranks = generator(10000).ranks
+    assert 5700 < (ranks[:, 0] == 0).sum() < 6300
+    # Given that `a` is first, `b` and `c` are equally likely to be second.
+    a_first = ranks[:, 0] == 0
+    assert abs((ranks[a_first, 1] == 1).mean() - .5) < .05
@@ -0,0 +1,22 @@
+from whalrus import GeneratorSinglePeaked
+
+
+def _is_single_peaked(order, axis):
+    positions = [axis.index(c) for c in order]
+    left = right = positions[0]
+    for p in positions[1:]:
+        if p == left - 1:
+            left = p
+        elif p == right + 1:
+            right = p
+        else:
+            return False
+    return True
+
+
+def test_single_peaked_and_uniform():
+    axis = ['d', 'b', 'a', 'e', 'c']
+    profile = GeneratorSinglePeaked(candidates=set(axis), axis=axis, seed=0)(3200, compress=True)
+    assert len(profile) == 2 ** 4
+    assert all(_is_single_peaked(ballot.as_strict_order, axis) for ballot in profile)
+    assert all(150 < w < 250 for w in profile.weights)
@@ -1,4 +1,4 @@
-from whalrus import Matrix, ConverterBallotGeneral
+from whalrus import Matrix, MatrixWeightedMajority, ConverterBallotGeneral
 import logging
 
 LOGGER = logging.getLogger(__name__)
@@ -18,3 +18,15 @@ def test_check_profile(caplog):
     matrix = Matrix()
     matrix(['a > b > c', 'a > b'])
     assert 'Some ballots do not have the same set of candidates as the whole election.' in caplog.text
+
+
+def test_rows_and_columns():
+    matrix = MatrixWeightedMajority(['a > b > c', 'c > a > b', 'b ~ c > a'], weights=[3, 2, 1], antisymmetric=True)
+    as_dict = matrix.as_dict_
+    candidates = matrix.candidates_as_list_
+    for c in candidates:
+        assert matrix.row(c) == {d: as_dict[(c, d)] for d in candidates}
+        assert matrix.column(c) == {d: as_dict[(d, c)] for d in candidates}
+        assert matrix.row_sums_[c] == sum(as_dict[(c, d)] for d in candidates if d != c)
+        assert matrix.row_mins_[c] == min(as_dict[(c, d)] for d in candidates if d != c)
+    assert matrix.beats_all(matrix.row_mins_['a']) == {'a'}
@@ -1,4 +1,5 @@
-from whalrus import MatrixMajority
+from fractions import Fraction
+from whalrus import MatrixMajority, MatrixWeightedMajority
 
 
 def test():
@@ -7,3 +8,20 @@ def test():
         >>> matrix.candidates_indexes_
         {'a': 0, 'b': 1, 'c': 2}
     """
+
+
+def test_same_as_pairwise_comparisons():
+    ballots = ['a > b > c > d', 'b > a > d > c', 'c > d', 'd > c ~ a', 'a > d']
+    weights = [1, 1, Fraction(1, 3), Fraction(1, 3), Fraction(1, 2)]
+    for policy in ['exact', 'integer', 'float']:
+        for antisymmetric in [False, True]:
+            matrix = MatrixMajority(ballots, weights=weights, numeric_policy=policy, equal=Fraction(1, 3),
+                                    matrix_weighted_majority=MatrixWeightedMajority(antisymmetric=antisymmetric))
+            weighted = matrix.matrix_weighted_majority_.as_dict_
+            for (c, d), value in matrix.as_dict_.items():
+                if c == d:
+                    assert value == Fraction(1, 2) if policy == 'exact' else value == 0.5
+                elif weighted[(c, d)] == weighted[(d, c)]:
+                    assert value == Fraction(1, 3) if policy == 'exact' else abs(value - 1 / 3) < 1e-12
+                else:
+                    assert value == (1 if weighted[(c, d)] > weighted[(d, c)] else 0)
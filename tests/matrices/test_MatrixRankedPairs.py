@@ -8,3 +8,16 @@ def test():
         ['a', 'b', 'c']
     """
     pass
+
+
+def test_transitive_closure():
+    import numpy as np
+    from whalrus import Priority
+    matrix = MatrixRankedPairs(
+        ['f > b > a > e > d > c', 'c > d > f > a > e > b', 'a > e > d > b > c > f', 'e > d > b > c > f > a'],
+        tie_break=Priority.DESCENDING)
+    reach = matrix.as_array_.astype(bool)
+    # The locked graph must stay acyclic, and the result must be its transitive closure.
+    assert not (reach & reach.T).any()
+    assert (reach == (reach | (reach.astype(int) @ reach.astype(int) > 0))).all()
+    assert list(reach.sum(axis=1)) == [0, 3, 2, 4, 5, 1]
@@ -8,3 +8,30 @@ def test():
         ['a', 'b', 'c']
     """
     pass
+
+
+def test_widest_paths():
+    import random
+    import numpy as np
+    from fractions import Fraction
+    from whalrus.matrices.matrix_schulze import _widest_paths
+
+    def naive_widest_paths(weights):
+        widest_path = np.copy(weights)
+        n = weights.shape[0]
+        for i in range(n):
+            for j in range(n):
+                for k in range(n):
+                    if len({i, j, k}) == 3:
+                        widest_path[j, k] = max(widest_path[j, k], min(widest_path[j, i], widest_path[i, k]))
+        return widest_path
+
+    random.seed(0)
+    for _ in range(50):
+        n = random.randint(1, 6)
+        weights = [[Fraction(random.randint(0, 6), random.randint(1, 3)) for _ in range(n)] for _ in range(n)]
+        for array in [np.array(weights, dtype=object), np.array(weights, dtype=float),
+                      np.array([[int(6 * x) for x in row] for row in weights])]:
+            result = _widest_paths(array)
+            assert result.dtype == array.dtype
+            assert (result == naive_widest_paths(array)).all()
@@ -1,4 +1,6 @@
-from whalrus import MatrixWeightedMajority, BallotOrder, Profile
+from fractions import Fraction
+import numpy as np
+from whalrus import MatrixWeightedMajority, BallotOrder, Profile, Election, RuleMaximin
 
 
 def test():
@@ -42,3 +44,105 @@ def test():
                [ 0,  0, 42,  0]])
     """
     pass
+
+
+def test_vectorized_engine_is_exact():
+    import random
+    from fractions import Fraction
+    random.seed(42)
+    candidates = ['a', 'b', 'c', 'd']
+
+    def random_ballot():
+        ordered = random.sample(candidates, random.randint(0, 4))
+        order = []
+        for c in ordered:
+            if order and random.random() < .3:
+                order[-1].add(c)
+            else:
+                order.append({c})
+        return BallotOrder(order, candidates=set(ordered) | set(random.sample(candidates, random.randint(0, 4))))
+
+    values = [None, 0, 1, Fraction(1, 2), -3]
+    names = ['higher_vs_lower', 'lower_vs_higher', 'indifference', 'ordered_vs_unordered', 'unordered_vs_ordered',
+             'unordered_vs_unordered', 'ordered_vs_absent', 'absent_vs_ordered', 'unordered_vs_absent',
+             'absent_vs_unordered', 'absent_vs_absent']
+    for _ in range(50):
+        ballots = [random_ballot() for _ in range(random.randint(0, 6))]
+        weights = [random.choice([1, 2, Fraction(1, 3)]) for _ in ballots]
+        matrix = MatrixWeightedMajority(**{name: random.choice(values) for name in names})
+        matrix(ballots, weights=weights, candidates=set(candidates))
+        assert matrix._gross_and_weights_vectorized() == matrix._gross_and_weights_iterative()
+
+
+def test_incremental_updates():
+    import random
+    from fractions import Fraction
+    from whalrus import MatrixMajority, MatrixSchulze, MatrixRankedPairs, RuleSchulze, RuleMaximin, RuleCopeland, \
+        RuleRankedPairs, RuleCondorcet, Priority, ProfileArray
+    random.seed(0)
+    candidates = {'a', 'b', 'c', 'd'}
+
+    def random_ballot():
+        return BallotOrder(random.sample(sorted(candidates), random.randint(1, 4)), candidates=candidates)
+
+    factories = [
+        lambda: MatrixWeightedMajority(ordered_vs_absent=1, absent_vs_ordered=0),
+        MatrixMajority, MatrixSchulze, lambda: MatrixRankedPairs(tie_break=Priority.ASCENDING),
+        lambda: RuleSchulze(tie_break=Priority.ASCENDING), lambda: RuleMaximin(tie_break=Priority.ASCENDING),
+        lambda: RuleCopeland(tie_break=Priority.ASCENDING), lambda: RuleRankedPairs(tie_break=Priority.ASCENDING),
+        lambda: RuleCondorcet(tie_break=Priority.ASCENDING)
+    ]
+    for factory in factories:
+        for given_candidates in [candidates, None]:
+            ballots = [random_ballot() for _ in range(5)]
+            weights = [random.choice([1, 2, Fraction(1, 2)]) for _ in ballots]
+            obj = factory()(ProfileArray(ballots) if given_candidates else ballots, weights=weights,
+                            candidates=given_candidates)
+            _ = obj.as_dict_ if hasattr(obj, 'as_dict_') else obj.order_
+            for _ in range(12):
+                event = random.randint(0, 2) if len(ballots) > 1 else 0
+                if event == 0:
+                    ballot, weight = random_ballot(), random.choice([1, Fraction(2, 3)])
+                    obj.add_ballot(ballot, weight=weight)
+                    ballots.append(ballot)
+                    weights.append(weight)
+                elif event == 1:
+                    i = random.randrange(len(ballots))
+                    obj._remove_ballot_at(i)
+                    del ballots[i]
+                    del weights[i]
+                else:
+                    i, ballot = random.randrange(len(ballots)), random_ballot()
+                    obj.replace_ballot(i, ballot)
+                    ballots[i] = ballot
+                expected = factory()(ballots, weights=weights, candidates=given_candidates)
+                if hasattr(obj, 'as_dict_'):
+                    assert obj.as_dict_ == expected.as_dict_
+                else:
+                    assert obj.order_ == expected.order_
+    # The weighted majority matrix is updated, not computed again.
+    rule = RuleSchulze(['a > b > c', 'b > c > a'], candidates={'a', 'b', 'c'}, tie_break=Priority.ASCENDING)
+    weighted_majority = rule.matrix_schulze_.matrix_weighted_majority_
+    _ = rule.winner_
+    rule.add_ballot('a > c > b')
+    assert rule.matrix_schulze_.matrix_weighted_majority_ is weighted_majority
+    assert '_gross_and_weights_' in weighted_majority._cached_properties
+    assert rule.winner_ == 'a'
+
+
+def test_numeric_policies():
+    ballots = ['a > b > c', 'b ~ c > a', 'c > a', 'a > b ~ c']
+    weights = [3, 2, Fraction(1, 2), 1]
+    exact = MatrixWeightedMajority(ballots, weights=weights, antisymmetric=True)
+    for policy in ['integer', 'float']:
+        matrix = MatrixWeightedMajority(ballots, weights=weights, antisymmetric=True, numeric_policy=policy)
+        assert matrix.as_array_.dtype == float
+        assert np.allclose(matrix.as_array_, exact.as_array_of_floats_)
+        assert all(abs(v - exact.as_dict_[k]) < 1e-12 for k, v in matrix.as_dict_.items())
+    # The sub-objects of a rule use its policy, also when they are shared through an election.
+    election = Election(ballots, weights=weights)
+    rule_exact = RuleMaximin(election)
+    rule_float = RuleMaximin(election, numeric_policy='float')
+    assert rule_float.matrix_weighted_majority_.as_array_.dtype == float
+    assert rule_exact.matrix_weighted_majority_.as_array_.dtype == object
+    assert rule_float.cowinners_ == rule_exact.cowinners_
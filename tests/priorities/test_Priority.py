@@ -95,3 +95,14 @@ def test_user_defined_priority():
         ['b', 'a']
     """
     pass
+
+
+def test_sort_pairs_rp_with_keys():
+    import random
+    from whalrus.priorities.priority import Priority as Base
+    random.seed(0)
+    for _ in range(100):
+        pairs = {(random.randint(0, 5), random.randint(0, 5)) for _ in range(random.randint(2, 10))}
+        for priority in [Priority.ASCENDING, Priority.DESCENDING]:
+            for reverse in [False, True]:
+                assert priority.sort_pairs_rp(pairs, reverse=reverse) == Base._sort_pairs_rp(priority, pairs, reverse)
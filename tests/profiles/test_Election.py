@@ -0,0 +1,64 @@
+import pytest
+from whalrus import (
+    Election, ProfileArray, RuleSchulze, RuleRankedPairs, RuleCopeland, RuleMaximin, RuleCondorcet, RuleBlack,
+    MatrixWeightedMajority, Priority)
+
+
+BALLOTS = ['a > b > c > d', 'b > c > a > d', 'c > a > b > d', 'd > a > b > c']
+WEIGHTS = [4, 3, 2, 1]
+
+
+def _rules():
+    return [RuleSchulze(), RuleRankedPairs(tie_break=Priority.ASCENDING), RuleCopeland(), RuleMaximin(),
+            RuleCondorcet(), RuleBlack()]
+
+
+def test_same_results():
+    election = Election(BALLOTS, weights=WEIGHTS)
+    for rule_election, rule in zip(_rules(), _rules()):
+        assert rule_election(election).order_ == rule(BALLOTS, weights=WEIGHTS).order_
+
+
+def test_weighted_majority_matrix_is_shared():
+    election = Election(BALLOTS, weights=WEIGHTS)
+    rules = [rule(election) for rule in _rules()]
+    matrices = [
+        rules[0].matrix_schulze_.matrix_weighted_majority_,
+        rules[1].matrix_.matrix_weighted_majority_,
+        rules[2].matrix_.matrix_weighted_majority_,
+        rules[3].matrix_weighted_majority_,
+        rules[4].matrix_majority_.matrix_weighted_majority_,
+        rules[5].rule_condorcet_.matrix_majority_.matrix_weighted_majority_,
+    ]
+    assert all(matrix is matrices[0] for matrix in matrices)
+    # With other parameters, the matrix is not shared.
+    rule = RuleMaximin(matrix_weighted_majority=MatrixWeightedMajority(antisymmetric=True))(election)
+    assert rule.matrix_weighted_majority_ is not matrices[0]
+
+
+def test_parameters_are_not_modified():
+    matrix_weighted_majority = MatrixWeightedMajority()
+    rule = RuleMaximin(matrix_weighted_majority=matrix_weighted_majority)
+    Election(BALLOTS, weights=WEIGHTS).evaluate(rule)
+    assert rule.profile_original_ is None
+    assert matrix_weighted_majority.profile_original_ is None
+
+
+def test_candidates():
+    election = Election(BALLOTS, weights=WEIGHTS, candidates={'a', 'b', 'c', 'd', 'e'})
+    assert RuleMaximin()(election).candidates_ == {'a', 'b', 'c', 'd', 'e'}
+    assert RuleMaximin()(election, candidates={'a', 'b'}).cowinners_ == {'a'}
+
+
+def test_profile_array():
+    election = Election(ProfileArray(BALLOTS, weights=WEIGHTS))
+    assert isinstance(election.profile_, ProfileArray)
+    assert RuleSchulze()(election).order_ == RuleSchulze(BALLOTS, weights=WEIGHTS).order_
+
+
+def test_ballots_cannot_be_changed():
+    rule = RuleMaximin()(Election(BALLOTS, weights=WEIGHTS))
+    with pytest.raises(ValueError):
+        rule.add_ballot('a > b > c > d')
+    with pytest.raises(ValueError):
+        rule.remove_ballot('a > b > c > d')
@@ -77,5 +77,27 @@ def test_remove():
         >>> print(profile)
         Alice: a > b
         Bob: b > a
+        >>> profile.remove(ballot='b > a', voter='Alice')
+        Traceback (most recent call last):
+        ...
+        ValueError: There is no such ballot in the profile: ballot='b > a', voter='Alice'.
     """
     pass
+
+
+def test_compressed():
+    from whalrus.ballots.ballot_levels import BallotLevels
+    from whalrus.ballots.ballot_plurality import BallotPlurality
+    from whalrus.rules.rule_borda import RuleBorda
+    ballots = [
+        'a > b ~ c', 'a > c ~ b', BallotOrder('a > b ~ c', candidates={'a', 'b', 'c', 'd'}),
+        BallotLevels({'a': 1, 'b': 0}), BallotLevels({'a': 1, 'b': 0}),
+        BallotPlurality('a', candidates={'a', 'b'}), BallotPlurality('a', candidates={'a', 'b'})
+    ]
+    profile = Profile(ballots, voters=['v%s' % i for i in range(7)])
+    compressed = profile.compressed()
+    assert compressed.weights == [2, 1, 2, 2]
+    assert compressed.voters == [('v0', 'v1'), ('v2',), ('v3', 'v4'), ('v5', 'v6')]
+    assert Profile(ballots, compress=True).voters == [None] * 4
+    ballots = ['a > b > c', 'b > c > a', 'a > b > c', 'c > a > b', 'b > c > a', 'a > b > c']
+    assert RuleBorda(Profile(ballots, compress=True)).scores_ == RuleBorda(ballots).scores_
@@ -0,0 +1,143 @@
+import pytest
+from fractions import Fraction
+import numpy as np
+from whalrus.profiles.profile import Profile
+from whalrus.profiles.profile_array import ProfileArray
+from whalrus.ballots.ballot_order import BallotOrder
+from whalrus.ballots.ballot_levels import BallotLevels
+from whalrus.converters_ballot.converter_ballot_to_plurality import ConverterBallotToPlurality
+from whalrus.converters_ballot.converter_ballot_to_strict_order import ConverterBallotToStrictOrder
+from whalrus.priorities.priority import Priority
+from whalrus.rules.rule_borda import RuleBorda
+from whalrus.rules.rule_plurality import RulePlurality
+from whalrus.rules.rule_schulze import RuleSchulze
+from whalrus.rules.rule_irv import RuleIRV
+
+
+BALLOTS = ['a > b ~ c > d', 'c > a', 'b > a > c', 'd ~ a > b > c', BallotOrder('c > d', candidates={'a', 'c', 'd'})]
+
+
+def test_same_ballots_as_profile():
+    profile = Profile(BALLOTS, weights=[2, 1, 1, 3, 1], voters=['v1', 'v2', 'v3', 'v4', 'v5'])
+    profile_array = ProfileArray(profile)
+    assert len(profile_array) == len(profile)
+    assert profile_array.ballots == profile.ballots
+    assert list(profile_array) == profile.ballots
+    assert profile_array.weights == profile.weights
+    assert profile_array.voters == profile.voters
+    assert str(profile_array) == str(profile)
+    assert profile_array.candidates == profile.candidates
+    assert profile_array[-1] == profile[-1]
+    assert profile_array[1:3] == profile[1:3]
+    for (b, w, v), (b2, w2, v2) in zip(profile_array.items(), profile.items()):
+        assert (b, w, v) == (b2, w2, v2)
+
+
+def test_levels_are_stored_as_orders():
+    profile = ProfileArray([BallotLevels({'a': 10, 'b': 7, 'c': 7})])
+    assert profile[0] == BallotOrder('a > b ~ c')
+
+
+def test_table_with_more_candidates():
+    profile = ProfileArray(['a > b'], candidates={'a', 'b', 'c'})
+    assert profile.candidates_as_list == ['a', 'b', 'c']
+    assert profile.candidates == {'a', 'b'}
+    assert profile[0] == BallotOrder('a > b')
+    try:
+        ProfileArray(['a > b > c'], candidates={'a', 'b'})
+        assert False
+    except ValueError:
+        pass
+
+
+def test_from_ranks():
+    profile = ProfileArray.from_ranks(np.array([[3, 3, 7, -2], [-1, 0, 5, 1]]), candidates=['a', 'b', 'c', 'd'],
+                                      weights=[1, 2])
+    assert profile.ranks.tolist() == [[0, 0, 1, -2], [-1, 0, 2, 1]]
+    assert profile[0] == BallotOrder('a ~ b > c')
+    assert profile[1] == BallotOrder('b > d > c', candidates={'a', 'b', 'c', 'd'})
+    assert profile.weights == [1, 2]
+
+
+def test_restrict_and_convert():
+    profile = ProfileArray(BALLOTS)
+    restricted = profile.restrict({'a', 'c', 'e'})
+    assert isinstance(restricted, ProfileArray)
+    assert restricted.ballots == [b.restrict({'a', 'c', 'e'}) for b in Profile(BALLOTS).ballots]
+    converted = profile.convert(ConverterBallotToPlurality(priority=Priority.ASCENDING))
+    assert not isinstance(converted, ProfileArray)
+    assert converted.ballots == Profile(BALLOTS).convert(ConverterBallotToPlurality(priority=Priority.ASCENDING)).ballots
+    converter = ConverterBallotToStrictOrder(priority=Priority.ASCENDING)
+    assert profile.convert(converter).ballots == Profile(BALLOTS).convert(converter).ballots
+    assert isinstance(ProfileArray(['a > b > c']).convert(converter), ProfileArray)
+
+
+def test_ballots_have_candidates():
+    assert ProfileArray(['a > b', 'b ~ a']).ballots_have_candidates({'a', 'b'})
+    assert not ProfileArray(['a > b', 'b ~ a']).ballots_have_candidates({'a', 'b', 'c'})
+    assert not ProfileArray(['a > b', 'c > a']).ballots_have_candidates({'a', 'b'})
+    assert ProfileArray([]).ballots_have_candidates({'a'})
+
+
+def test_list_like_behavior():
+    profile = ProfileArray(['a > b', 'b > a'], voters=['Alice', 'Bob'])
+    profile.append('c > a', weight=2, voter='Cate')
+    assert profile.candidates_as_list == ['a', 'b', 'c']
+    assert str(profile) == 'Alice (1): a > b\nBob (1): b > a\nCate (2): c > a'
+    profile[0] = 'a ~ b ~ c'
+    assert profile[0] == BallotOrder('a ~ b ~ c')
+    profile.remove('b > a')
+    assert str(profile) == 'Alice (1): a ~ b ~ c\nCate (2): c > a'
+    profile.remove(voter='Cate')
+    assert str(profile) == 'Alice: a ~ b ~ c'
+    del profile[0]
+    assert len(profile) == 0
+    profile = ProfileArray(['a > b']) + ProfileArray(['c > d'], weights=[Fraction(1, 2)])
+    assert profile.weights == [1, Fraction(1, 2)]
+    assert profile[1] == BallotOrder('c > d')
+    assert (profile * 2).weights == [2, 1]
+
+
+def test_modified_in_place():
+    profile = ProfileArray(['a > b', 'b > a'], weights=[1, 2], voters=['Alice', 'Bob'])
+    shared, restricted = ProfileArray(profile), profile.restrict({'a'})
+    for i in range(20):
+        profile.append('b > a', voter=i)
+    profile.append('a > b', weight=Fraction(1, 2), voter='Cate')
+    profile[0] = 'b ~ a'
+    del profile[1]
+    assert profile.weights == [1] * 21 + [Fraction(1, 2)]
+    assert profile.voters == ['Alice'] + list(range(20)) + ['Cate']
+    assert profile.index('a > b') == 21
+    assert str(shared) == 'Alice (1): a > b\nBob (2): b > a'
+    assert str(restricted) == 'Alice (1): a\nBob (2): a'
+    with pytest.raises(ValueError):
+        profile.remove('a > b', voter='Alice')
+
+
+def test_rules():
+    ballots = ['a > b > c > d', 'b > c > a > d', 'c > a > b ~ d', 'd > c > b > a', 'a > c > b > d']
+    weights = [3, 2, 2, 1, 1]
+    for rule in [RuleBorda, RulePlurality, RuleSchulze, RuleIRV]:
+        expected = rule(ballots, weights=weights)
+        actual = rule(ProfileArray(ballots, weights=weights))
+        assert actual.order_ == expected.order_
+        actual = rule(ProfileArray(ballots, weights=weights), candidates={'a', 'b', 'c'})
+        expected = rule(ballots, weights=weights, candidates={'a', 'b', 'c'})
+        assert actual.order_ == expected.order_
+
+
+
+def test_compressed():
+    ballots = ['a > b > c', 'b > a', 'a > b > c', BallotOrder('b > a', candidates={'a', 'b', 'c'}), 'b > a']
+    weights = [1, Fraction(1, 2), 2, 1, 3]
+    voters = ['v1', 'v2', 'v3', 'v4', 'v5']
+    profile = ProfileArray(ballots, weights=weights, voters=voters)
+    compressed = profile.compressed()
+    assert isinstance(compressed, ProfileArray)
+    assert compressed.ballots == Profile(ballots, weights=weights, voters=voters).compressed().ballots
+    assert compressed.weights == [3, Fraction(7, 2), 1]
+    assert compressed.voters == [('v1', 'v3'), ('v2', 'v5'), ('v4',)]
+    assert profile.compressed(keep_voters=False).voters == [None, None, None]
+    assert len(ProfileArray(ballots, compress=True)) == 3
+    assert len(ProfileArray([]).compressed()) == 0
@@ -0,0 +1,21 @@
+import numpy as np
+from whalrus.profiles.profile import Profile
+from whalrus.profiles.profile_array import ProfileArray
+from whalrus.profiles.profile_batch import ProfileBatch
+from whalrus.ballots.ballot_levels import BallotLevels
+
+
+def test_weighted_sums():
+    batch = ProfileBatch([ProfileArray(['a > b', 'b > a'], weights=[2, 3]), [], ['b > a']])
+    assert batch.ranks is None
+    batch = ProfileBatch([ProfileArray(['a > b', 'b > a'], weights=[2, 3]), [], ['b > a']], candidates={'a', 'b'})
+    assert batch.n_elections == 3
+    assert not batch.same_candidates
+    assert np.array_equal(batch.weighted_sums(lambda rows: batch.ranks[rows] == 0, shape=(2, )),
+                          [[2, 3], [0, 0], [0, 1]])
+
+
+def test_not_an_array():
+    assert ProfileBatch([[BallotLevels({'a': 1, 'b': 0})]]).ranks is None
+    assert ProfileBatch([Profile(['a > b'], weights=[.5])]).ranks is None
+    assert ProfileBatch([['a > b'], ['a > c']], candidates={'a', 'b'}).ranks is None
@@ -1,3 +1,78 @@
+import logging
+import pytest
+from whalrus.generators.generator_impartial_culture import GeneratorImpartialCulture
+from whalrus.profiles.profile_array import ProfileArray
+from whalrus.profiles.profile_batch import ProfileBatch
+from whalrus.priorities.priority import Priority
+from whalrus.matrices.matrix_majority import MatrixMajority
+from whalrus.matrices.matrix_weighted_majority import MatrixWeightedMajority
+from whalrus.rules.rule_approval import RuleApproval
+from whalrus.rules.rule_borda import RuleBorda
+from whalrus.rules.rule_condorcet import RuleCondorcet
+from whalrus.rules.rule_copeland import RuleCopeland
+from whalrus.rules.rule_irv import RuleIRV
+from whalrus.rules.rule_k_approval import RuleKApproval
+from whalrus.rules.rule_maximin import RuleMaximin
+from whalrus.rules.rule_plurality import RulePlurality
+from whalrus.rules.rule_range_voting import RuleRangeVoting
+from whalrus.rules.rule_schulze import RuleSchulze
+from whalrus.rules.rule_score_positional import RuleScorePositional
+from whalrus.rules.rule_veto import RuleVeto
+
+RULES = [RulePlurality(), RuleBorda(), RuleScorePositional(points_scheme=[3, 1, 1]), RuleKApproval(k=2), RuleVeto(),
+         RuleApproval(), RuleRangeVoting(), RuleCopeland(), RuleCopeland(matrix=MatrixMajority(equal=0)),
+         RuleMaximin(), RuleMaximin(matrix_weighted_majority=MatrixWeightedMajority(antisymmetric=True)),
+         RuleCondorcet(), RuleSchulze()]
+CANDIDATES = {'a', 'b', 'c', 'd'}
+
+
 def test():
     # No test is necessary.
     pass
+
+
+@pytest.mark.parametrize('rule', RULES)
+def test_same_as_each_election(rule):
+    elections = list(GeneratorImpartialCulture(candidates=CANDIDATES, seed=42).iterate(5, 200))
+    batch = ProfileBatch(elections)
+    assert rule._cowinners_batch(batch) is not None
+    assert rule.evaluate_batch(batch) == [rule(election).cowinners_ for election in elections]
+
+
+@pytest.mark.parametrize('rule', [RuleBorda(), RuleApproval(), RuleCopeland(), RuleMaximin(), RuleCondorcet(),
+                                  RuleSchulze()])
+def test_weak_orders_and_weights(rule):
+    logging.disable(logging.WARNING)
+    elections = [ProfileArray.from_ranks([[0, 0, 1, -1], [2, 1, 0, 0], [0, 1, 2, 3]], candidates=sorted(CANDIDATES),
+                                         weights=weights)
+                 for weights in [[1, 1, 1], [3, 2, 1], [1, 2, 2], [0, 0, 0], [-1, 2, 1]]]
+    try:
+        assert rule.evaluate_batch(elections) == [rule(election).cowinners_ for election in elections]
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+def test_fall_back_on_each_election():
+    rule = RuleIRV(tie_break=Priority.ASCENDING)
+    assert rule._cowinners_batch(ProfileBatch([['a > b']])) is None
+    assert rule.evaluate_batch([['a > b', 'b > a'], ['b > a']]) == [{'a'}, {'b'}]
+
+
+def test_change_of_parameters():
+    rule = RuleBorda(['a > b > c', 'b > a > c', 'c > a > b', 'c > b > a'], tie_break=Priority.ASCENDING)
+    scores = rule.scores_
+    assert rule.strict_order_ == ['a', 'b', 'c']
+    # The tie-breaking rule only affects the results that depend on it.
+    rule.tie_break = Priority.DESCENDING
+    assert 'strict_order_' not in rule._cached_properties
+    assert rule.scores_ is scores
+    assert rule.strict_order_ == ['c', 'b', 'a']
+    # Other parameters affect everything.
+    rule.converter = rule.converter
+    assert 'scores_' not in rule._cached_properties
+    # In the iterated eliminations, the tie-breaking rule is propagated to the rounds.
+    rule = RuleIRV(['a > b > c', 'b > a > c', 'c > a > b', 'c > b > a'], tie_break=Priority.ASCENDING)
+    assert rule.winner_ == 'a'
+    rule.tie_break = Priority.DESCENDING
+    assert 'eliminations_' not in rule._cached_properties
+    assert rule.winner_ == 'c'
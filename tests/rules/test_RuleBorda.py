@@ -1,3 +1,43 @@
+import random
+import logging
+from fractions import Fraction
+from whalrus.rules.rule_borda import RuleBorda
+from whalrus.scorers.scorer_borda import ScorerBorda
+from whalrus.rules.rule_black import RuleBlack
+
+
+class ScorerBordaBallotByBallot(ScorerBorda):
+    pass
+
+
 def test():
     # The doctest is sufficient for the moment.
     pass
+
+
+def test_scores_from_matrix():
+    logging.disable(logging.WARNING)
+    random.seed(5)
+    for _ in range(100):
+        candidates = ['a', 'b', 'c', 'd', 'e'][:random.randint(1, 5)]
+        ballots = []
+        for _ in range(random.randint(0, 6)):
+            ballot = random.sample(candidates, random.randint(0, len(candidates)))
+            separators = [random.choice([' > ', ' ~ ']) for _ in ballot[1:]]
+            ballots.append(ballot[0] + ''.join(s + c for s, c in zip(separators, ballot[1:])) if ballot else '')
+        weights = [random.choice([1, 2, Fraction(1, 3)]) for _ in ballots]
+        election_candidates = set(random.sample(candidates, random.randint(1, len(candidates))))
+        rule = RuleBorda(ballots, weights=weights, candidates=election_candidates)
+        rule_ballot_by_ballot = RuleBorda(ballots, weights=weights, candidates=election_candidates,
+                                          scorer=ScorerBordaBallotByBallot())
+        assert rule._can_use_matrix() and not rule_ballot_by_ballot._can_use_matrix()
+        assert rule.gross_scores_ == rule_ballot_by_ballot.gross_scores_
+        assert rule.weights_ == rule_ballot_by_ballot.weights_
+    logging.disable(logging.NOTSET)
+
+
+def test_matrix_shared_in_black():
+    rule = RuleBlack(['a > b > c', 'b > c > a', 'c > a > b'], weights=[3, 2, 2])
+    matrix = rule.rule_condorcet_.matrix_majority_.matrix_weighted_majority_
+    assert rule.rule_borda_._borda_matrix_ is matrix
+    assert rule.rule_borda_.gross_scores_ == {'a': 8, 'b': 7, 'c': 6}
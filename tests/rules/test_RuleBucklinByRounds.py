@@ -0,0 +1,30 @@
+import random
+import logging
+from fractions import Fraction
+from whalrus import RuleBucklinByRounds, ScorerBucklin, BallotOrder
+
+
+class ScorerBucklinBallotByBallot(ScorerBucklin):
+    pass
+
+
+def test_one_pass():
+    logging.disable(logging.WARNING)
+    random.seed(2)
+    for trial in range(150):
+        candidates = ['a', 'b', 'c', 'd', 'e'][:random.randint(1, 5)]
+        ballots = []
+        for _ in range(random.randint(1, 6)):
+            ballot = random.sample(candidates, random.randint(0, len(candidates)))
+            separators = [random.choice([' > ', ' ~ ']) for _ in ballot[1:]]
+            string = ballot[0] + ''.join(s + c for s, c in zip(separators, ballot[1:])) if ballot else ''
+            # Some candidates of the election may be unordered or absent in the ballot.
+            ballots.append(BallotOrder(string, candidates=set(ballot) | set(random.sample(candidates, 1))))
+        weights = [random.choice([1, 2, Fraction(1, 2)]) for _ in ballots]
+        options = dict(unordered_receive_points=random.choice([True, False, None]),
+                       absent_receive_points=random.choice([True, False, None]))
+        rule, rule_ballot_by_ballot = [
+            RuleBucklinByRounds(ballots, weights=weights, candidates=set(candidates), scorer=scorer_class(**options))
+            for scorer_class in (ScorerBucklin, ScorerBucklinBallotByBallot)]
+        assert rule.detailed_scores_ == rule_ballot_by_ballot.detailed_scores_
+    logging.disable(logging.NOTSET)
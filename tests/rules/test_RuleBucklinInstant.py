@@ -31,3 +31,12 @@ def test_scores_as_floats():
         {'a': ('Very Good', 1.0), 'b': ('Acceptable', 1.0)}
     """
     pass
+
+
+def test_weighted_profile():
+    rule = RuleBucklinInstant(['a > b > c', 'b > c > a', 'c > a > b', 'a ~ b > c', 'c'], weights=[3, 2, 2, 1, 1])
+    assert rule.tally_.histograms == {'a': {2: 3, 0: 2, 1: 2, 1.5: 1}, 'b': {1: 3, 2: 2, 0: 2, 1.5: 1},
+                                      'c': {0: 4, 1: 2, 2: 3}}
+    assert rule.scores_ == {'a': (1, 6), 'b': (1, 6), 'c': (1, 5)}
+    rule.add_ballot('b > a > c')
+    assert rule.scores_ == RuleBucklinInstant(rule.profile_original_).scores_
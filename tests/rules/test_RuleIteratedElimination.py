@@ -1,5 +1,13 @@
+import random
+import logging
 from whalrus.rules.rule_iterated_elimination import RuleIteratedElimination
 from whalrus.rules.rule_plurality import RulePlurality
+from whalrus.rules.rule_veto import RuleVeto
+from whalrus.rules.rule_borda import RuleBorda
+from whalrus.eliminations.elimination_last import EliminationLast
+from whalrus.eliminations.elimination_below_average import EliminationBelowAverage
+from whalrus.converters_ballot.converter_ballot_to_plurality import ConverterBallotToPlurality
+from whalrus.converters_ballot.converter_ballot_to_veto import ConverterBallotToVeto
 from whalrus.priorities.priority import Priority
 
 
@@ -22,3 +30,66 @@ def test():
     ], weights=[1, 1, 3, 4])
     assert irv.order_ == [{'b'}, {'c'}, {'a'}, {'d'}]
     assert irv.winner_ == 'b'
+
+
+def test_transfer_of_ballots():
+    class RulePluralityRecount(RulePlurality):
+        pass
+
+    class RuleVetoRecount(RuleVeto):
+        pass
+
+    logging.disable(logging.WARNING)
+    random.seed(11)
+    for trial in range(100):
+        candidates = ['a', 'b', 'c', 'd', 'e', 'f'][:random.randint(1, 6)]
+        ballots = []
+        for _ in range(random.randint(0, 8)):
+            ballot = random.sample(candidates, random.randint(1, len(candidates)))
+            separators = [random.choice([' > ', ' ~ ']) for _ in ballot[1:]]
+            ballots.append(ballot[0] + ''.join(s + c for s, c in zip(separators, ballot[1:])))
+        weights = [random.choice([1, 2, 3]) for _ in ballots]
+        priority = random.choice([Priority.ASCENDING, Priority.DESCENDING])
+        k = random.choice([1, 2, -1])
+        if trial % 2:
+            rule_classes = (RulePlurality, RulePluralityRecount)
+            converter = ConverterBallotToPlurality(priority=priority)
+        else:
+            rule_classes = (RuleVeto, RuleVetoRecount)
+            converter = ConverterBallotToVeto(priority=priority)
+        rule, rule_recount = [
+            RuleIteratedElimination(ballots, weights=weights, candidates=set(candidates), tie_break=priority,
+                                    base_rule=rule_class(converter=converter), elimination=EliminationLast(k=k))
+            for rule_class in rule_classes]
+        assert rule._can_transfer_ballots() and not rule_recount._can_transfer_ballots()
+        assert len(rule.eliminations_) == len(rule_recount.eliminations_)
+        for elimination, elimination_recount in zip(rule.eliminations_, rule_recount.eliminations_):
+            assert elimination.rule_.gross_scores_ == elimination_recount.rule_.gross_scores_
+            assert elimination.rule_.weights_ == elimination_recount.rule_.weights_
+            assert elimination.eliminated_order_ == elimination_recount.eliminated_order_
+        assert rule.order_ == rule_recount.order_
+        assert rule.strict_order_ == rule_recount.strict_order_
+    logging.disable(logging.NOTSET)
+
+
+def test_borda_matrix_for_subsets():
+    class RuleBordaBallotByBallot(RuleBorda):
+        pass
+
+    logging.disable(logging.WARNING)
+    random.seed(7)
+    for trial in range(50):
+        candidates = ['a', 'b', 'c', 'd', 'e', 'f'][:random.randint(1, 6)]
+        ballots = [' > '.join(random.sample(candidates, random.randint(1, len(candidates))))
+                   for _ in range(random.randint(1, 8))]
+        weights = [random.choice([1, 2, 3]) for _ in ballots]
+        elimination = EliminationBelowAverage() if trial % 2 else EliminationLast(k=1)
+        rule, rule_ballot_by_ballot = [
+            RuleIteratedElimination(ballots, weights=weights, candidates=set(candidates), tie_break=Priority.ASCENDING,
+                                    base_rule=rule_class(), elimination=elimination)
+            for rule_class in (RuleBorda, RuleBordaBallotByBallot)]
+        for elimination, elimination_ballot_by_ballot in zip(rule.eliminations_, rule_ballot_by_ballot.eliminations_):
+            assert elimination.rule_.gross_scores_ == elimination_ballot_by_ballot.rule_.gross_scores_
+            assert elimination.eliminated_order_ == elimination_ballot_by_ballot.eliminated_order_
+        assert rule.strict_order_ == rule_ballot_by_ballot.strict_order_
+    logging.disable(logging.NOTSET)
@@ -30,3 +30,18 @@ def test_compare():
         1
     """
     pass
+
+
+def test_incremental_update():
+    """
+        >>> rule = RuleMajorityJudgment(scale=ScaleRange(0, 2))
+        >>> rule([{'a': 2, 'b': 0}, {'a': 0, 'b': 1}], candidates={'a', 'b'}).scores_as_floats_
+        {'a': (0.0, 0.5, 0.0), 'b': (0.0, 0.5, 0.0)}
+        >>> rule.add_ballot({'a': 2, 'b': 2}).scores_as_floats_
+        {'a': (2.0, -0.3333333333333333, 0.0), 'b': (1.0, -0.3333333333333333, 0.3333333333333333)}
+        >>> rule.remove_ballot({'a': 0, 'b': 1}).tally_
+        TallyLevels(histograms={'a': {2: 2}, 'b': {0: 1, 2: 1}})
+        >>> rule.scores_ == RuleMajorityJudgment([{'a': 2, 'b': 0}, {'a': 2, 'b': 2}], scale=ScaleRange(0, 2)).scores_
+        True
+    """
+    pass
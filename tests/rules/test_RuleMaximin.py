@@ -10,3 +10,11 @@ def test():
     assert rule1.matrix_weighted_majority_.as_dict_[('a', 'b')] == 1
     assert rule2.matrix_weighted_majority_.as_dict_[('a', 'b')] == 0
     assert rule1.matrix_weighted_majority_.as_dict_[('a', 'b')] == 1
+
+
+def test_scores_are_not_the_matrix_cache():
+    rule = RuleMaximin(ballots=['a > b > c', 'b > a > c'])
+    rule.scores_['a'] = 42
+    assert rule.matrix_weighted_majority_.row_mins_['a'] != 42
+    rule = RuleMaximin(ballots=['a > b > c', 'b > a > c'], numeric_policy='float')
+    assert all(isinstance(score, float) for score in rule.scores_.values())
@@ -0,0 +1,23 @@
+import random
+import logging
+from whalrus import RuleSchulze, MatrixSchulze, MatrixWeightedMajority
+
+
+def test_cowinners_with_smith_set():
+    logging.disable(logging.WARNING)
+    random.seed(3)
+    for trial in range(200):
+        candidates = ['a', 'b', 'c', 'd', 'e', 'f'][:random.randint(1, 6)]
+        ballots = []
+        for _ in range(random.randint(1, 7)):
+            ballot = random.sample(candidates, len(candidates))
+            ballots.append(' > '.join(ballot[:random.randint(1, len(ballot))] if trial % 3 == 0 else ballot))
+        weights = [random.choice([1, 2, 3]) for _ in ballots]
+        matrix_weighted_majority = MatrixWeightedMajority(
+            antisymmetric=(trial % 5 == 0), ordered_vs_absent=(1 if trial % 7 == 0 else None))
+        rule = RuleSchulze(ballots, weights=weights, candidates=set(candidates),
+                           matrix_schulze=MatrixSchulze(matrix_weighted_majority=matrix_weighted_majority))
+        cowinners = rule.cowinners_
+        rule.delete_cache()
+        assert cowinners == rule.order_[0]
+    logging.disable(logging.NOTSET)
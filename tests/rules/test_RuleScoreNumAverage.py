@@ -0,0 +1,91 @@
+import pytest
+import random
+from fractions import Fraction
+from whalrus import RuleBorda, RulePlurality, RuleVeto, RuleApproval, RuleRangeVoting, RuleKApproval, RuleIRV, \
+    ProfileArray, BallotOrder, ScorerVeto, Priority, ConverterBallotToStrictOrder, RuleScorePositional
+
+
+CANDIDATES = {'a', 'b', 'c', 'd'}
+
+
+def random_ballot():
+    candidates = sorted(CANDIDATES)
+    random.shuffle(candidates)
+    return BallotOrder(candidates[:random.randint(2, 4)])
+
+
+def test_incremental_updates():
+    random.seed(42)
+    rules = [
+        RuleBorda, RulePlurality, RuleVeto, RuleApproval, RuleRangeVoting, lambda *a, **k: RuleKApproval(
+            *a, k=2, converter=ConverterBallotToStrictOrder(priority=Priority.ASCENDING), **k),
+        lambda *a, **k: RuleVeto(*a, scorer=ScorerVeto(count_abstention=True), **k),
+        lambda *a, **k: RuleScorePositional(
+            *a, points_scheme=[3, 1], converter=ConverterBallotToStrictOrder(priority=Priority.ASCENDING), **k)
+    ]
+    for rule_class in rules:
+        for profile_class in [list, ProfileArray]:
+            ballots = [random_ballot() for _ in range(6)]
+            weights = [random.choice([1, 2, Fraction(1, 2)]) for _ in range(6)]
+            rule = rule_class(profile_class(ballots), weights=weights, candidates=CANDIDATES)
+            _ = rule.scores_
+            for _ in range(15):
+                event = random.randint(0, 2) if ballots else 0
+                if event == 0:
+                    ballot, weight = random_ballot(), random.choice([1, 3, Fraction(2, 3)])
+                    rule.add_ballot(ballot, weight=weight)
+                    ballots.append(ballot)
+                    weights.append(weight)
+                elif event == 1:
+                    i = random.randrange(len(ballots))
+                    rule.remove_ballot(ballots[i])
+                    i = ballots.index(ballots[i])
+                    del ballots[i]
+                    del weights[i]
+                else:
+                    i, ballot = random.randrange(len(ballots)), random_ballot()
+                    rule.replace_ballot(i, ballot)
+                    ballots[i] = ballot
+                # The tallies were updated, not deleted.
+                assert '_gross_scores_and_weights_' in rule._cached_properties
+                expected = rule_class(ballots, weights=weights, candidates=CANDIDATES)
+                assert rule.gross_scores_ == expected.gross_scores_
+                assert rule.weights_ == expected.weights_
+                assert rule.order_ == expected.order_
+
+
+def test_candidates_not_given():
+    rule = RuleBorda(['a > b', 'b > a'])
+    assert rule.add_ballot('c > a > b').candidates_ == {'a', 'b', 'c'}
+    assert rule.scores_ == RuleBorda(['a > b', 'b > a', 'c > a > b']).scores_
+    assert rule.remove_ballot('c > a > b').candidates_ == {'a', 'b'}
+    assert rule.replace_ballot(0, 'b > a').winner_ == 'b'
+
+
+def test_voters_and_other_rules():
+    rule = RulePlurality(['a', 'b'], voters=['Alice', 'Bob'], candidates={'a', 'b'})
+    rule.add_ballot('b', voter='Cate')
+    rule.remove_ballot(voter='Alice')
+    assert rule.profile_original_.voters == ['Bob', 'Cate']
+    assert rule.scores_ == {'a': 0, 'b': 1}
+    rule = RulePlurality(ProfileArray(['a > b', 'b', 'a']), candidates={'a', 'b'})
+    assert rule.remove_ballot('b').scores_ == {'a': 1, 'b': 0}
+    with pytest.raises(ValueError):
+        rule.remove_ballot('b')
+    rule = RuleIRV(['a > b > c', 'b > a > c', 'c > b > a'], candidates={'a', 'b', 'c'}, tie_break=Priority.ASCENDING)
+    assert rule.winner_ == 'b'
+    rule.add_ballot('a > b > c', weight=2)
+    assert rule.winner_ == 'a'
+
+
+def test_failed_change_of_ballot():
+    rule = RulePlurality(['a > b', 'b > a', 'a > b'])
+    assert rule.gross_scores_ == {'a': 2, 'b': 1}
+    # The plurality converter cannot choose between a and b: the object is left unchanged.
+    with pytest.raises(ValueError):
+        rule.add_ballot('a ~ b')
+    with pytest.raises(ValueError):
+        rule.replace_ballot(1, 'a ~ b')
+    assert len(rule.profile_original_) == len(rule.profile_converted_) == 3
+    assert str(rule.profile_original_[1]) == 'b > a'
+    assert rule.add_ballot('b').gross_scores_ == {'a': 2, 'b': 2}
@@ -0,0 +1,59 @@
+import random
+from fractions import Fraction
+from whalrus import Scorer, ScorerBorda, ScorerBucklin, ScorerPositional, ScorerPlurality, ScorerVeto, \
+    ScorerLevels, Profile, ProfileArray, BallotOrder, BallotPlurality, BallotVeto, BallotLevels
+
+
+def _random_orders(n_ballots, candidates, strict=False):
+    ballots = []
+    for _ in range(n_ballots):
+        ballot_candidates = [c for c in candidates if random.random() < .8]
+        ordered = [c for c in ballot_candidates if random.random() < .7]
+        random.shuffle(ordered)
+        weak_order = []
+        for c in ordered:
+            if weak_order and not strict and random.random() < .3:
+                weak_order[-1].add(c)
+            else:
+                weak_order.append({c})
+        ballots.append(BallotOrder(weak_order, candidates=set(ballot_candidates)))
+    return ballots
+
+
+def _check(scorer, profile, candidates):
+    # ``Scorer.score_profile`` scores the ballots one by one.
+    assert scorer.score_profile(profile, candidates) == Scorer.score_profile(scorer, profile, candidates)
+
+
+def test_score_profile_is_like_scoring_ballot_by_ballot():
+    random.seed(42)
+    candidates = {'a', 'b', 'c', 'd', 'e'}
+    orders = _random_orders(60, sorted(candidates))
+    strict_orders = _random_orders(60, sorted(candidates), strict=True)
+    weights = [random.choice([1, 2, Fraction(1, 3)]) for _ in range(60)]
+    for options in [dict(), dict(absent_receive_points=None, unordered_give_points=False),
+                    dict(absent_give_points=False, absent_receive_points=False, unordered_receive_points=None),
+                    dict(unordered_receive_points=False)]:
+        _check(ScorerBorda(**options), Profile(orders, weights=weights), candidates)
+    for k in [1, 2, 4, 7]:
+        for options in [dict(), dict(unordered_receive_points=False, absent_receive_points=None),
+                        dict(unordered_receive_points=None)]:
+            _check(ScorerBucklin(k=k, **options), Profile(orders, weights=weights), candidates)
+    for options in [dict(points_scheme=[3, 2, 1]), dict(points_scheme=[Fraction(1, 2), .25], points_fill=None),
+                    dict(points_scheme=[1], points_unordered=None, points_absent=-1)]:
+        _check(ScorerPositional(**options), Profile(strict_orders, weights=weights), candidates)
+        _check(ScorerPositional(**options), ProfileArray(strict_orders, weights=weights, candidates=candidates),
+               candidates)
+    plurality = [BallotPlurality(random.choice(['a', 'b', None]), candidates=candidates) for _ in range(20)]
+    veto = [BallotVeto(random.choice(['a', 'b', None]), candidates=candidates) for _ in range(20)]
+    for count_abstention in [False, True]:
+        _check(ScorerPlurality(count_abstention=count_abstention), Profile(plurality), candidates)
+        _check(ScorerVeto(count_abstention=count_abstention), Profile(veto), candidates)
+    levels = [BallotLevels({c: random.randint(0, 3) for c in 'abc' if random.random() < .7},
+                           candidates={'a', 'b', 'c', 'd'}) for _ in range(20)]
+    _check(ScorerLevels(level_absent=0, level_ungraded=1), Profile(levels, weights=weights[:20]), candidates)
+
+
+def test_float_weights():
+    profile = Profile(['a > b > c', 'b > c > a'], weights=[.1, .2])
+    _check(ScorerBorda(), profile, {'a', 'b', 'c'})
@@ -0,0 +1,36 @@
+import json
+from fractions import Fraction
+from whalrus import Tally, TallyScores, TallyMatrix, TallyLevels, RuleRangeVoting, MatrixWeightedMajority, \
+    RuleMajorityJudgment
+
+
+def test_json_round_trip():
+    tallies = [
+        RuleRangeVoting([{'a': 1, 'b': 0}, {'a': 0, 'b': 1}], weights=[2, 1]).tally_,
+        MatrixWeightedMajority(['a > b > c', 'c > a'], candidates={'a', 'b', 'c'}, indifference=None).tally_,
+        RuleMajorityJudgment([{'a': 1, 'b': 0}, {'a': 1, 'b': 1}]).tally_,
+        # Fractions, in the numbers and in the levels.
+        RuleRangeVoting(['a > b > c']).tally_,
+        MatrixWeightedMajority(['a > b ~ c']).tally_,
+        RuleMajorityJudgment(['a > b > c'], weights=[Fraction(1, 2)]).tally_
+    ]
+    for tally in tallies:
+        tally_loaded = Tally.from_dict(json.loads(json.dumps(tally.to_dict())))
+        assert type(tally_loaded) is type(tally)
+        assert tally_loaded == tally
+
+
+def test_merge_is_associative():
+    parts = [TallyScores({'a': 1, 'b': 2}, {'a': 1, 'b': 1}),
+             TallyScores({'a': 3}, {'a': 2}),
+             TallyScores({'a': 0, 'b': 5}, {'a': 1, 'b': 3})]
+    assert (parts[0] + parts[1]) + parts[2] == parts[0] + (parts[1] + parts[2])
+    assert sum(parts) == TallyScores({'a': 4, 'b': 7}, {'a': 4, 'b': 4})
+    assert parts[1] == TallyScores({'a': 3}, {'a': 2})
+
+
+def test_copy():
+    tally = TallyMatrix({('a', 'b'): 1, ('b', 'a'): 0}, {('a', 'b'): 1, ('b', 'a'): 1})
+    assert tally.copy() == tally
+    assert tally.copy() is not tally
+    assert TallyLevels().add({'a': 1}) != TallyLevels().add({'a': 2})
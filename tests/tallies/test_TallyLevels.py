@@ -0,0 +1,43 @@
+from fractions import Fraction
+from whalrus import TallyLevels, ScaleFromList, RuleMajorityJudgment
+
+
+def test_median_with_scale():
+    scale = ScaleFromList(['Bad', 'Medium', 'Good'])
+    tally = TallyLevels(scale=scale).add({'a': 'Good'}, weight=Fraction(1, 2)).add({'a': 'Bad'}).add({'a': 'Medium'})
+    assert tally.median('a') == 'Medium'
+    assert tally.weight_above('a', 'Medium') == Fraction(1, 2)
+    assert tally.weight_below('a', 'Medium') == 1
+
+
+def test_merge_is_like_a_single_tally():
+    scores = [{'a': 1, 'b': 2}, {'a': 2}, {'a': 2, 'b': 0}, {'b': 1}]
+    full = TallyLevels()
+    for s in scores:
+        full.add(s)
+    left = TallyLevels().add(scores[0]).add(scores[1])
+    right = TallyLevels().add(scores[2]).add(scores[3])
+    merged = left + right
+    assert merged.histograms == full.histograms
+    assert merged.counts == full.counts
+    assert left.histograms == {'a': {1: 1, 2: 1}, 'b': {2: 1}}
+
+
+def test_remove_all_ballots():
+    tally = TallyLevels().add({'a': 1}, weight=0)
+    assert tally.median('a') == 1
+    tally.remove({'a': 1}, weight=0)
+    assert tally.n_ballots('a') == 0
+    assert tally.median('a', default='nothing') == 'nothing'
+
+
+def test_majority_judgment_precincts():
+    scale = ScaleFromList(['Bad', 'Medium', 'Good'])
+    ballots = [{'a': 'Good', 'b': 'Bad'}, {'a': 'Bad', 'b': 'Medium'}, {'a': 'Medium', 'b': 'Good'},
+               {'a': 'Good', 'b': 'Medium'}, {'a': 'Bad'}]
+    rule = RuleMajorityJudgment(scale=scale)
+    tally = rule(ballots[:2], candidates={'a', 'b'}).tally_ + rule(ballots[2:], candidates={'a', 'b'}).tally_
+    rule.load_tally(tally)
+    rule_whole = RuleMajorityJudgment(ballots, scale=scale)
+    assert rule.scores_ == rule_whole.scores_
+    assert rule.winner_ == rule_whole.winner_
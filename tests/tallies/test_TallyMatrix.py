@@ -0,0 +1,14 @@
+from whalrus import MatrixWeightedMajority
+
+
+def test_precincts_are_like_the_whole_profile():
+    ballots = ['a > b > c', 'b > a', 'c > a ~ b', 'b > c > a', 'a']
+    weights = [3, 2, 1, 4, 2]
+    candidates = {'a', 'b', 'c'}
+    matrix = MatrixWeightedMajority(ordered_vs_absent=1, absent_vs_ordered=0)
+    tally = sum(matrix(ballots[i:i + 2], weights=weights[i:i + 2], candidates=candidates).tally_
+                for i in range(0, len(ballots), 2))
+    matrix_whole = MatrixWeightedMajority(ballots, weights=weights, candidates=candidates,
+                                          ordered_vs_absent=1, absent_vs_ordered=0)
+    assert matrix.load_tally(tally).as_dict_ == matrix_whole.as_dict_
+
@@ -0,0 +1,22 @@
+from whalrus import RuleBorda, Profile
+
+
+def test_precincts_are_like_the_whole_profile():
+    ballots = ['a > b > c > d', 'b > a > d > c', 'c > d > a > b', 'd > a ~ b > c', 'a > c', 'b > d > c > a']
+    weights = [3, 2, 1, 4, 2, 1]
+    candidates = {'a', 'b', 'c', 'd'}
+    rule = RuleBorda()
+    tally = sum(rule(Profile(ballots[i:i + 2], weights=weights[i:i + 2]), candidates=candidates).tally_
+                for i in range(0, len(ballots), 2))
+    rule_whole = RuleBorda(ballots, weights=weights, candidates=candidates)
+    rule.load_tally(tally)
+    assert rule.scores_ == rule_whole.scores_
+    assert rule.order_ == rule_whole.order_
+    assert rule.winner_ == rule_whole.winner_
+
+
+def test_add_ballot_after_load_tally():
+    rule = RuleBorda()
+    rule.load_tally(rule(['a > b > c'], candidates={'a', 'b', 'c'}).tally_)
+    rule.add_ballot('c > b > a')
+    assert rule.gross_scores_ == RuleBorda(['a > b > c', 'c > b > a']).gross_scores_
@@ -0,0 +1,31 @@
+import os
+import subprocess
+import sys
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code: str) -> str:
+    """Run some code in a fresh interpreter (so that no module is already imported) and return its output."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT, os.environ.get('PYTHONPATH', '')]))
+    return subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True, cwd=ROOT,
+                          env=env).stdout.strip()
+
+
+def test_import_is_lazy():
+    assert _run("import sys, whalrus; print(sorted(m for m in sys.modules if m.startswith('whalrus')))") \
+        == "['whalrus']"
+
+
+def test_plurality_does_not_load_numpy():
+    assert _run("import sys; from whalrus import RulePlurality; print(RulePlurality(['a', 'b', 'a']).winner_, "
+                "'numpy' in sys.modules)") == 'a False'
+
+
+def test_public_names():
+    import whalrus
+    assert 'RuleBorda' in dir(whalrus)
+    assert whalrus.RuleBorda is whalrus.rules.rule_borda.RuleBorda
+    with pytest.raises(AttributeError):
+        whalrus.NotAName
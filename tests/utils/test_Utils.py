@@ -1,14 +1,31 @@
+import pickle
 import pytest
-from pyparsing import ParseException
-from whalrus.utils.utils import parse_weak_order, set_to_str, dict_to_str, set_to_list, dict_to_items, take_closest, \
-    my_division
+import random
+import threading
+import weakref
+from whalrus.utils.utils import cached_property, DeleteCacheMixin
+from whalrus.utils.utils import parse_weak_order, parse_weak_orders, WeakOrderParseError, set_to_str, dict_to_str, set_to_list, dict_to_items, take_closest, \
+    my_division, RestrictionCache, numeric_policy, get_numeric_policy, apply_numeric_policy
 
 
 def test_parse_weak_order():
     assert parse_weak_order('') == []
     assert parse_weak_order('  ') == []
-    with pytest.raises(ParseException):
+    with pytest.raises(WeakOrderParseError) as info:
         parse_weak_order('a * b')
+    assert isinstance(info.value, ValueError)
+    error = pickle.loads(pickle.dumps(info.value))
+    assert (type(error), error.loc, str(error)) == (WeakOrderParseError, 2, str(info.value))
+    assert parse_weak_order(' a~b >>c\t') == [{'a', 'b'}, {'c'}]
+    for s in ['a b', 'a >', '> a', 'a ~> b', 'a > é']:
+        with pytest.raises(WeakOrderParseError):
+            parse_weak_order(s)
+
+
+def test_parse_weak_orders():
+    parsed = parse_weak_orders(['a > b', 'b ~ c', 'a > b'])
+    assert parsed == [[{'a'}, {'b'}], [{'b', 'c'}], [{'a'}, {'b'}]]
+    assert parsed[0][0] is not parsed[2][0]
 
 
 def test_set_to_list():
@@ -50,3 +67,175 @@ def test_my_division():
     with pytest.raises(NotImplementedError):
         # noinspection PyTypeChecker
         _ = my_division(1, 'a')
+
+
+def test_restriction_cache():
+    class Ballot(list):
+        pass
+
+    cache = RestrictionCache(maxsize=2)
+    ballots = [Ballot(['a', 'b', 'c']), Ballot(['c', 'b', 'a']), Ballot(['b', 'a', 'c'])]
+
+    def restrict_function(ballot):
+        return lambda candidates: [c for c in ballot if c in candidates]
+
+    results = [cache.get(ballot, {'a', 'b'}, restrict_function(ballot)) for ballot in ballots]
+    assert results == [['a', 'b'], ['b', 'a'], ['b', 'a']]
+    assert (cache.hits, cache.misses) == (0, 3)
+    # The least recently used entry (the first ballot) was discarded.
+    assert cache.get(ballots[2], frozenset({'a', 'b'}), restrict_function(ballots[2])) is results[2]
+    assert cache.get(ballots[0], {'a', 'b'}, restrict_function(ballots[0])) is not results[0]
+    assert (cache.hits, cache.misses) == (1, 4)
+    # Other candidates.
+    assert cache.get(ballots[2], {'a', 'c'}, restrict_function(ballots[2])) == ['a', 'c']
+    # The cache does not keep the ballots alive.
+    ballot_ref = weakref.ref(ballots[2])
+    del ballots[2]
+    assert ballot_ref() is None
+    # Disabled cache.
+    cache = RestrictionCache(maxsize=0)
+    assert cache.get(ballots[0], {'a'}, restrict_function(ballots[0])) is not cache.get(
+        ballots[0], {'a'}, restrict_function(ballots[0]))
+
+
+def test_restriction_cache_threads():
+    class Ballot(list):
+        pass
+
+    cache = RestrictionCache(maxsize=50)
+    ballots = [Ballot([i, i + 1, i + 2]) for i in range(100)]
+    errors = []
+
+    def work():
+        for _ in range(20):
+            for ballot in ballots:
+                if cache.get(ballot, {ballot[0], ballot[2]}, lambda c: [x for x in ballot if x in c]) != [
+                        ballot[0], ballot[2]]:
+                    errors.append(ballot)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert len(cache._entries) == 50
+    assert cache.hits + cache.misses == 4 * 20 * 100
+
+
+def test_numeric_policy():
+    assert get_numeric_policy() == 'exact'
+    with numeric_policy('float'):
+        assert get_numeric_policy() == 'float'
+        with numeric_policy('integer'):
+            assert my_division(3, 2) == 1.5
+            assert apply_numeric_policy(3) == 3
+        assert apply_numeric_policy(3) == 3.0 and isinstance(apply_numeric_policy(3), float)
+    assert get_numeric_policy() == 'exact'
+    with pytest.raises(ValueError):
+        with numeric_policy('double'):
+            pass
+
+
+
+def test_numeric_policy_is_recorded_at_call():
+    from whalrus import RuleRangeVoting
+    ballots = [{'a': 0.1, 'b': 0.2}, {'a': 0.2, 'b': 0.1}, {'a': 0.3, 'b': 0.3}]
+    with numeric_policy('integer'):
+        rule = RuleRangeVoting(ballots)
+    # The scores are computed outside of the context manager, but with the policy of the call.
+    assert rule.numeric_policy_ == 'integer'
+    assert rule.scores_ == RuleRangeVoting(ballots, numeric_policy='integer').scores_ == {'a': 0.2, 'b': 0.2}
+    assert rule.cowinners_ == {'a', 'b'}
+
+
+def _random_ballot(rng, candidates):
+    candidates = rng.sample(candidates, rng.randint(1, len(candidates)))
+    return candidates[0] + ''.join(rng.choice([' > ', ' > ', ' ~ ']) + c for c in candidates[1:])
+
+
+def test_integer_policy_gives_the_exact_order():
+    from whalrus import Priority, RuleBaldwin, RuleBlack, RuleBorda, RuleBucklinByRounds, RuleBucklinInstant, \
+        RuleCopeland, RuleMajorityJudgment, RuleMaximin, RuleNanson, RuleRangeVoting, RuleRankedPairs, RuleSchulze, \
+        RuleSimplifiedDodgson
+    # With the policy 'float', these ballots do not give a tie between 'a' and 'c' for RuleSimplifiedDodgson.
+    ballots = ['c > b > a > d', 'b > d > c > a', 'a > c > b > d', 'd > b > c > a', 'b > a > d > c',
+               'b > c > a > d', 'd > a > c > b', 'b > a > d > c']
+    weights = [2, 1, 3, 1, 2, 2, 2, 2]
+    rule = RuleSimplifiedDodgson(ballots, weights=weights, numeric_policy='integer')
+    assert rule.scores_['a'] == rule.scores_['c']
+    assert rule.order_ == RuleSimplifiedDodgson(ballots, weights=weights).order_ == [{'b'}, {'a', 'c'}, {'d'}]
+    # The grades given by the converter are exact, even inside the context manager.
+    ballots, weights = ['d > a > c > b', 'c > b > d > a'], [1, 3]
+    with numeric_policy('integer'):
+        assert RuleRangeVoting(ballots, weights=weights).order_ == [{'c'}, {'b', 'd'}, {'a'}]
+    rng = random.Random(42)
+    candidates = ['a', 'b', 'c', 'd', 'e']
+    for _ in range(50):
+        n_voters = rng.randint(5, 9)
+        ballots = [_random_ballot(rng, candidates) for _ in range(n_voters)]
+        weights = [rng.randint(1, 4) for _ in range(n_voters)]
+        for rule in [RuleBaldwin, RuleBlack, RuleBorda, RuleBucklinByRounds, RuleBucklinInstant, RuleCopeland,
+                     RuleMajorityJudgment, RuleMaximin, RuleNanson, RuleRangeVoting, RuleRankedPairs, RuleSchulze,
+                     RuleSimplifiedDodgson]:
+            kwargs = dict(weights=weights, candidates=set(candidates), tie_break=Priority.ASCENDING)
+            expected = rule(ballots, **kwargs).order_
+            assert rule(ballots, numeric_policy='integer', **kwargs).order_ == expected
+            with numeric_policy('integer'):
+                assert rule(ballots, **kwargs).order_ == expected
+
+
+def test_cached_property_dependencies():
+    class Example(DeleteCacheMixin):
+        def __init__(self):
+            self.factor = 2
+            self.shift = 1
+            self._values = [1, 2]
+
+        @cached_property(depends_on=['_values', 'factor'])
+        def doubled_(self):
+            return [self.factor * v for v in self._values]
+
+        @cached_property(depends_on=['doubled_'])
+        def total_(self):
+            return sum(self.doubled_)
+
+        @cached_property
+        def shifted_(self):
+            return [v + self.shift for v in self._values]
+
+    a = Example()
+    assert (a.total_, a.shifted_) == (6, [2, 3])
+    assert 'total_' in a.__dict__
+    assert set(a._cached_properties) == {'doubled_', 'total_', 'shifted_'}
+    # ``shifted_`` does not declare its dependencies: it depends on all the parameters.
+    a.shift = 0
+    assert set(a._cached_properties) == {'doubled_', 'total_'}
+    a.factor = 3
+    assert set(a._cached_properties) == set()
+    assert (a.total_, a.shifted_) == (9, [1, 2])
+    # Private attributes only affect the properties that depend on them explicitly.
+    a._values.append(3)
+    a.invalidate('_values')
+    assert set(a._cached_properties) == {'shifted_'}
+    assert a.total_ == 18
+    a.invalidate('doubled_')
+    assert set(a._cached_properties) == {'shifted_'}
+    a.delete_cache()
+    assert len(a._cached_properties) == 0
+    # A computed variable only affects the properties that depend on it, even if it was set before they were defined.
+    a.extra_ = 1
+    a.total_
+
+    class Other(DeleteCacheMixin):
+        @cached_property(depends_on=['extra_'])
+        def twice_(self):
+            return 2 * self.extra_
+
+    b = Other()
+    b.extra_ = 1
+    assert b.twice_ == 2
+    b.extra_ = 2
+    assert b.twice_ == 4
+    a.extra_ = 2
+    assert 'total_' in a._cached_properties
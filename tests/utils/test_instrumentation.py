@@ -0,0 +1,83 @@
+import os
+import subprocess
+import sys
+import pytest
+from whalrus.matrices.matrix_weighted_majority import MatrixWeightedMajority
+from whalrus.rules.rule import Rule
+from whalrus.rules.rule_borda import RuleBorda
+from whalrus.rules.rule_maximin import RuleMaximin
+from whalrus.scorers.scorer import Scorer
+from whalrus.scorers.scorer_borda import ScorerBorda
+from whalrus.ballots.ballot_order import BallotOrder
+from whalrus.utils.instrumentation import Instrumentation
+from whalrus.utils.utils import _CachedProperty
+
+
+def test():
+    call = Rule.__call__
+    with Instrumentation() as outer:
+        rule = RuleMaximin(['a > b > c', 'b > a > c', 'a > c > b'])
+        with Instrumentation() as inner:
+            assert rule.winner_ == 'a'
+            assert rule.winner_ == 'a'
+        rule.cowinners_
+    # Outside of the context, everything is restored.
+    assert Rule.__call__ is call
+    assert not hasattr(_CachedProperty, '__set__')
+    rule.delete_cache()
+    assert rule.winner_ == 'a'
+    report = outer.report()
+    # ``super().__call__`` is not counted twice.
+    assert report['RuleMaximin']['__call__']['calls'] == 1
+    assert report['MatrixWeightedMajority']['__call__']['calls'] == 1
+    assert report['RuleMaximin']['cowinners_'] == {
+        'calls': 0, 'hits': 1, 'misses': 1, 'time': report['RuleMaximin']['cowinners_']['time']}
+    assert report['RuleMaximin']['cowinners_']['time'] > 0
+    inner_report = inner.report()
+    assert 'RuleMaximin' not in inner_report or '__call__' not in inner_report['RuleMaximin']
+    assert inner_report['RuleMaximin']['winner_']['hits'] == 1
+    inner.reset()
+    assert inner.report() == dict()
+
+
+def test_exception():
+    with pytest.raises(ValueError):
+        with Instrumentation() as instrumentation:
+            RuleBorda(['a > b', 'b > a']).winner_
+    assert not hasattr(_CachedProperty, '__set__')
+    assert instrumentation.report()['RuleBorda']['winner_']['misses'] == 1
+    # Setting a cached value and deleting it still work while the instrumentation is active.
+    with Instrumentation():
+        matrix = MatrixWeightedMajority(['a > b'])
+        matrix.as_array_
+        matrix.delete_cache()
+        assert 'as_array_' not in matrix._cached_properties
+
+
+def test_classes_defined_in_the_context():
+    with Instrumentation() as instrumentation:
+        class MyScorer(ScorerBorda):
+            def __call__(self, ballot, voter=None, candidates=None):
+                self.ballot_ = ballot
+                return self
+
+        MyScorer()(ballot=BallotOrder('a > b'))
+    assert instrumentation.report()['MyScorer']['__call__']['calls'] == 1
+    assert '__wrapped__' not in vars(MyScorer.__call__)
+    assert '__init_subclass__' not in vars(Scorer)
+
+
+def test_modules_imported_in_the_context():
+    # In a fresh interpreter, the converters of RuleApproval are only loaded when it is imported.
+    code = ("import sys; from whalrus.utils.instrumentation import Instrumentation\n"
+            "assert 'whalrus.converters_ballot.converter_ballot_to_grades' not in sys.modules\n"
+            "with Instrumentation() as instrumentation:\n"
+            "    from whalrus import RuleApproval\n"
+            "    RuleApproval([{'a': 1, 'b': 0}, {'a': 1, 'b': 1}]).winner_\n"
+            "report = instrumentation.report()\n"
+            "print(sorted(cls for cls in report if cls.startswith('ConverterBallotTo')))")
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([root, os.environ.get('PYTHONPATH', '')]))
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True, cwd=root,
+                            env=env).stdout.strip()
+    assert output == "['ConverterBallotToGrades', 'ConverterBallotToLevelsInterval', 'ConverterBallotToLevelsRange']"
@@ -0,0 +1,69 @@
+from whalrus import evaluate_in_parallel, Profile, RuleBorda, RuleMajorityJudgment, RuleMaximin, RuleSchulze, \
+    RulePlurality, MatrixWeightedMajority, ScaleRange, ProfileArray
+from whalrus.utils.parallel import _shards, _blank_copy
+
+
+def test_same_results_as_a_single_call():
+    profile = Profile(['a > b > c > d', 'b > a ~ c > d', 'd > c', 'c > a > b > d', 'b > d > a > c'] * 3,
+                      weights=[1, 2, 3, 1, 4] * 3)
+    candidates = {'a', 'b', 'c', 'd', 'e'}
+    for x in [RuleBorda(), RulePlurality(), RuleMaximin(), RuleSchulze(),
+              MatrixWeightedMajority(ordered_vs_absent=1, absent_vs_ordered=0)]:
+        expected = x(profile, candidates=candidates).tally_
+        result = evaluate_in_parallel(x, profile, candidates=candidates, n_jobs=2, chunk_size=4)
+        assert result.tally_ == expected
+        assert result.candidates_ == candidates
+
+
+def test_majority_judgment():
+    ballots = [{'a': 2, 'b': 0}, {'a': 0, 'b': 1}, {'a': 1, 'b': 2}, {'a': 2}]
+    rule = RuleMajorityJudgment(scale=ScaleRange(0, 2))
+    assert evaluate_in_parallel(rule, ballots, n_jobs=1, chunk_size=3).scores_ == rule(ballots).scores_
+
+
+def test_empty_profile():
+    assert evaluate_in_parallel(RuleBorda(), [], candidates={'a', 'b'}, n_jobs=2).scores_ == {'a': 0, 'b': 0}
+
+
+def test_shards_are_arrays():
+    profile = Profile(['a > b > c', 'b > a > c', 'a > b > c', 'c > a > b'] * 5)
+    shards = _shards(profile, candidates={'a', 'b', 'c', 'd'}, n_jobs=2)
+    # Equal ballots are grouped, then split in two slices of the array.
+    assert [type(shard) for shard in shards] == [ProfileArray, ProfileArray]
+    assert sum(len(shard) for shard in shards) == 3
+    assert sum(sum(shard.weights) for shard in shards) == 20
+    assert shards[0].candidates_as_list == ['a', 'b', 'c', 'd']
+    # With voters, the ballots are not grouped.
+    shards = _shards(Profile(profile, voters=list(range(20))), candidates={'a', 'b', 'c'}, n_jobs=2)
+    assert [len(shard) for shard in shards] == [10, 10]
+    assert shards[1].voters == list(range(10, 20))
+    # Other ballots are sent as they are.
+    shards = _shards(Profile([{'a': 1, 'b': 0}, {'a': 0}]), candidates={'a', 'b'}, n_jobs=1)
+    assert [type(shard) for shard in shards] == [Profile]
+
+
+def test_profile_array():
+    profile = ProfileArray(['a > b > c', 'b > c ~ a', 'c > a'] * 4, weights=[1, 2, 3] * 4)
+    for x in [RuleBorda(), RuleMaximin()]:
+        expected = x(profile).tally_
+        assert evaluate_in_parallel(x, profile, n_jobs=2, chunk_size=2).tally_ == expected
+
+
+def test_blank_copy_of_parameters():
+    rule = RuleSchulze()
+    rule(['a > b > c', 'b > a > c', 'a > c > b']).winner_
+    blank = _blank_copy(rule)
+    assert blank.matrix_schulze is not rule.matrix_schulze
+    assert blank.matrix_schulze.profile_converted_ is None
+    assert rule.matrix_schulze.profile_converted_ is not None
+
+
+def test_numeric_policy_of_the_caller():
+    from whalrus.utils.utils import numeric_policy
+    ballots = ['a > b > c', 'b > a > c', 'a > c > b']
+    with numeric_policy('float'):
+        rule = evaluate_in_parallel(RuleBorda(), ballots, n_jobs=2)
+    assert rule.scores_ == {'a': 5 / 3, 'b': 1.0, 'c': 1 / 3}
+    assert all(isinstance(score, float) for score in rule.gross_scores_.values())
+    rule = evaluate_in_parallel(RuleBorda(numeric_policy='integer'), ballots, n_jobs=2)
+    assert rule.gross_scores_ == {'a': 5, 'b': 3, 'c': 1}
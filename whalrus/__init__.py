@@ -6,102 +6,134 @@ __author__ = """Sylvain Bouveret, Yann Chevaleyre and François Durand"""
 __email__ = 'fradurand@gmail.com'
 __version__ = '0.4.6'
 
-# Utils
-from .utils.utils import cached_property, DeleteCacheMixin, parse_weak_order, set_to_list, set_to_str, dict_to_items, \
-    dict_to_str, NiceSet, NiceDict, my_division, convert_number, take_closest
+import importlib
 
-# Scales
-from .scales.scale import Scale
-from .scales.scale_from_list import ScaleFromList
-from .scales.scale_from_set import ScaleFromSet
-from .scales.scale_range import ScaleRange
-from .scales.scale_interval import ScaleInterval
+# The public names of the package, by module. They are imported on first access (cf. PEP 562, Python 3.7+), so that
+# ``import whalrus`` is fast and only the modules that are actually used are loaded.
+_NAMES_BY_MODULE = {
+    # Utils
+    '.utils.utils': ['cached_property', 'DeleteCacheMixin', 'parse_weak_order', 'parse_weak_orders',
+                     'WeakOrderParseError', 'set_to_list', 'set_to_str', 'dict_to_items', 'dict_to_str', 'NiceSet',
+                     'NiceDict', 'my_division', 'convert_number', 'take_closest', 'RestrictionCache',
+                     'NUMERIC_POLICIES', 'numeric_policy', 'get_numeric_policy', 'check_numeric_policy',
+                     'apply_numeric_policy', 'apply_numeric_policy_to_total'],
+    '.utils.parallel': ['evaluate_in_parallel'],
+    '.utils.instrumentation': ['Instrumentation'],
+    # Scales
+    '.scales.scale': ['Scale'],
+    '.scales.scale_from_list': ['ScaleFromList'],
+    '.scales.scale_from_set': ['ScaleFromSet'],
+    '.scales.scale_range': ['ScaleRange'],
+    '.scales.scale_interval': ['ScaleInterval'],
+    # Priority
+    '.priorities.priority': ['Priority', 'PriorityUnambiguous', 'PriorityAbstain', 'PriorityAscending',
+                             'PriorityDescending', 'PriorityRandom'],
+    # Ballots
+    '.ballots.ballot': ['Ballot'],
+    '.ballots.ballot_order': ['BallotOrder'],
+    '.ballots.ballot_levels': ['BallotLevels'],
+    '.ballots.ballot_one_name': ['BallotOneName'],
+    '.ballots.ballot_plurality': ['BallotPlurality'],
+    '.ballots.ballot_veto': ['BallotVeto'],
+    # Ballot Converters
+    '.converters_ballot.converter_ballot': ['ConverterBallot'],
+    '.converters_ballot.converter_ballot_general': ['ConverterBallotGeneral'],
+    '.converters_ballot.converter_ballot_to_order': ['ConverterBallotToOrder'],
+    '.converters_ballot.converter_ballot_to_strict_order': ['ConverterBallotToStrictOrder'],
+    '.converters_ballot.converter_ballot_to_plurality': ['ConverterBallotToPlurality'],
+    '.converters_ballot.converter_ballot_to_veto': ['ConverterBallotToVeto'],
+    '.converters_ballot.converter_ballot_to_levels_interval': ['ConverterBallotToLevelsInterval'],
+    '.converters_ballot.converter_ballot_to_levels_range': ['ConverterBallotToLevelsRange'],
+    '.converters_ballot.converter_ballot_to_levels_list_numeric': ['ConverterBallotToLevelsListNumeric'],
+    '.converters_ballot.converter_ballot_to_levels_list_non_numeric': ['ConverterBallotToLevelsListNonNumeric'],
+    '.converters_ballot.converter_ballot_to_grades': ['ConverterBallotToGrades'],
+    '.converters_ballot.converter_ballot_to_levels': ['ConverterBallotToLevels'],
+    # Profile
+    '.profiles.profile': ['Profile'],
+    '.profiles.profile_array': ['ProfileArray'],
+    '.profiles.profile_batch': ['ProfileBatch'],
+    '.profiles.election': ['Election'],
+    # Tallies
+    '.tallies.tally': ['Tally'],
+    '.tallies.tally_scores': ['TallyScores'],
+    '.tallies.tally_matrix': ['TallyMatrix'],
+    '.tallies.tally_levels': ['TallyLevels'],
+    # Generators
+    '.generators.generator': ['Generator'],
+    '.generators.generator_impartial_culture': ['GeneratorImpartialCulture'],
+    '.generators.generator_impartial_anonymous_culture': ['GeneratorImpartialAnonymousCulture'],
+    '.generators.generator_mallows': ['GeneratorMallows'],
+    '.generators.generator_plackett_luce': ['GeneratorPlackettLuce'],
+    '.generators.generator_euclidean': ['GeneratorEuclidean'],
+    '.generators.generator_single_peaked': ['GeneratorSinglePeaked'],
+    # Matrix
+    '.matrices.matrix': ['Matrix'],
+    '.matrices.matrix_weighted_majority': ['MatrixWeightedMajority'],
+    '.matrices.matrix_majority': ['MatrixMajority'],
+    '.matrices.matrix_ranked_pairs': ['MatrixRankedPairs'],
+    '.matrices.matrix_schulze': ['MatrixSchulze'],
+    # Elimination algorithms
+    '.eliminations.elimination': ['Elimination'],
+    '.eliminations.elimination_last': ['EliminationLast'],
+    '.eliminations.elimination_below_average': ['EliminationBelowAverage'],
+    # Scorers
+    '.scorers.scorer': ['Scorer'],
+    '.scorers.scorer_borda': ['ScorerBorda'],
+    '.scorers.scorer_bucklin': ['ScorerBucklin'],
+    '.scorers.scorer_levels': ['ScorerLevels'],
+    '.scorers.scorer_plurality': ['ScorerPlurality'],
+    '.scorers.scorer_positional': ['ScorerPositional'],
+    '.scorers.scorer_veto': ['ScorerVeto'],
+    # Voting Rules 1: General
+    '.rules.rule': ['Rule'],
+    '.rules.rule_score': ['RuleScore'],
+    '.rules.rule_score_num': ['RuleScoreNum'],
+    '.rules.rule_score_num_average': ['RuleScoreNumAverage'],
+    '.rules.rule_score_num_row_sum': ['RuleScoreNumRowSum'],
+    '.rules.rule_score_positional': ['RuleScorePositional'],
+    '.rules.rule_iterated_elimination': ['RuleIteratedElimination'],
+    '.rules.rule_sequential_elimination': ['RuleSequentialElimination'],
+    '.rules.rule_sequential_tie_break': ['RuleSequentialTieBreak'],
+    # Voting Rules 2: Particular
+    '.rules.rule_approval': ['RuleApproval'],
+    '.rules.rule_baldwin': ['RuleBaldwin'],
+    '.rules.rule_black': ['RuleBlack'],
+    '.rules.rule_borda': ['RuleBorda'],
+    '.rules.rule_bucklin_by_rounds': ['RuleBucklinByRounds'],
+    '.rules.rule_bucklin_instant': ['RuleBucklinInstant'],
+    '.rules.rule_condorcet': ['RuleCondorcet'],
+    '.rules.rule_coombs': ['RuleCoombs'],
+    '.rules.rule_copeland': ['RuleCopeland'],
+    '.rules.rule_irv': ['RuleIRV'],
+    '.rules.rule_k_approval': ['RuleKApproval'],
+    '.rules.rule_kim_roush': ['RuleKimRoush'],
+    '.rules.rule_majority_judgment': ['RuleMajorityJudgment'],
+    '.rules.rule_maximin': ['RuleMaximin'],
+    '.rules.rule_nanson': ['RuleNanson'],
+    '.rules.rule_plurality': ['RulePlurality'],
+    '.rules.rule_range_voting': ['RuleRangeVoting'],
+    '.rules.rule_ranked_pairs': ['RuleRankedPairs'],
+    '.rules.rule_schulze': ['RuleSchulze'],
+    '.rules.rule_simplified_dodgson': ['RuleSimplifiedDodgson'],
+    '.rules.rule_two_round': ['RuleTwoRound'],
+    '.rules.rule_veto': ['RuleVeto'],
+}
 
-# Priority
-from .priorities.priority import Priority
-from .priorities.priority import PriorityUnambiguous
-from .priorities.priority import PriorityAbstain
-from .priorities.priority import PriorityAscending
-from .priorities.priority import PriorityDescending
-from .priorities.priority import PriorityRandom
+_MODULE_OF_NAME = {name: module for module, names in _NAMES_BY_MODULE.items() for name in names}
 
-# Ballots
-from .ballots.ballot import Ballot
-from .ballots.ballot_order import BallotOrder
-from .ballots.ballot_levels import BallotLevels
-from .ballots.ballot_one_name import BallotOneName
-from .ballots.ballot_plurality import BallotPlurality
-from .ballots.ballot_veto import BallotVeto
+__all__ = list(_MODULE_OF_NAME)
 
-# Ballot Converters
-from .converters_ballot.converter_ballot import ConverterBallot
-from .converters_ballot.converter_ballot_general import ConverterBallotGeneral
-from .converters_ballot.converter_ballot_to_order import ConverterBallotToOrder
-from .converters_ballot.converter_ballot_to_strict_order import ConverterBallotToStrictOrder
-from .converters_ballot.converter_ballot_to_plurality import ConverterBallotToPlurality
-from .converters_ballot.converter_ballot_to_veto import ConverterBallotToVeto
-from .converters_ballot.converter_ballot_to_levels_interval import ConverterBallotToLevelsInterval
-from .converters_ballot.converter_ballot_to_levels_range import ConverterBallotToLevelsRange
-from .converters_ballot.converter_ballot_to_levels_list_numeric import ConverterBallotToLevelsListNumeric
-from .converters_ballot.converter_ballot_to_levels_list_non_numeric import ConverterBallotToLevelsListNonNumeric
-from .converters_ballot.converter_ballot_to_grades import ConverterBallotToGrades
-from .converters_ballot.converter_ballot_to_levels import ConverterBallotToLevels
 
-# Profile
-from .profiles.profile import Profile
+def __getattr__(name: str) -> object:
+    try:
+        module = _MODULE_OF_NAME[name]
+    except KeyError:
+        raise AttributeError('module %r has no attribute %r' % (__name__, name)) from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    # Later accesses do not call this function.
+    globals()[name] = value
+    return value
 
-# Matrix
-from .matrices.matrix import Matrix
-from .matrices.matrix_weighted_majority import MatrixWeightedMajority
-from .matrices.matrix_majority import MatrixMajority
-from .matrices.matrix_ranked_pairs import MatrixRankedPairs
-from .matrices.matrix_schulze import MatrixSchulze
 
-# Elimination algorithms
-from .eliminations.elimination import Elimination
-from .eliminations.elimination_last import EliminationLast
-from .eliminations.elimination_below_average import EliminationBelowAverage
-
-# Scorers
-from .scorers.scorer import Scorer
-from .scorers.scorer_borda import ScorerBorda
-from .scorers.scorer_bucklin import ScorerBucklin
-from .scorers.scorer_levels import ScorerLevels
-from .scorers.scorer_plurality import ScorerPlurality
-from .scorers.scorer_positional import ScorerPositional
-from .scorers.scorer_veto import ScorerVeto
-
-# Voting Rules 1: General
-from .rules.rule import Rule
-from .rules.rule_score import RuleScore
-from .rules.rule_score_num import RuleScoreNum
-from .rules.rule_score_num_average import RuleScoreNumAverage
-from .rules.rule_score_num_row_sum import RuleScoreNumRowSum
-from .rules.rule_score_positional import RuleScorePositional
-from .rules.rule_iterated_elimination import RuleIteratedElimination
-from .rules.rule_sequential_elimination import RuleSequentialElimination
-from .rules.rule_sequential_tie_break import RuleSequentialTieBreak
-
-# Voting Rules 2: Particular
-from .rules.rule_approval import RuleApproval
-from .rules.rule_baldwin import RuleBaldwin
-from .rules.rule_black import RuleBlack
-from .rules.rule_borda import RuleBorda
-from .rules.rule_bucklin_by_rounds import RuleBucklinByRounds
-from .rules.rule_bucklin_instant import RuleBucklinInstant
-from .rules.rule_condorcet import RuleCondorcet
-from .rules.rule_coombs import RuleCoombs
-from .rules.rule_copeland import RuleCopeland
-from .rules.rule_irv import RuleIRV
-from .rules.rule_k_approval import RuleKApproval
-from .rules.rule_kim_roush import RuleKimRoush
-from .rules.rule_majority_judgment import RuleMajorityJudgment
-from .rules.rule_maximin import RuleMaximin
-from .rules.rule_nanson import RuleNanson
-from .rules.rule_plurality import RulePlurality
-from .rules.rule_range_voting import RuleRangeVoting
-from .rules.rule_ranked_pairs import RuleRankedPairs
-from .rules.rule_schulze import RuleSchulze
-from .rules.rule_simplified_dodgson import RuleSimplifiedDodgson
-from .rules.rule_two_round import RuleTwoRound
-from .rules.rule_veto import RuleVeto
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -128,6 +128,9 @@ class BallotLevels(BallotOrder):
             raise TypeError("restrict() got an unexpected keyword argument %r" % list(kwargs.keys())[0])
         if candidates is None:
             return self
+        return self.restriction_cache.get(self, candidates, self._restrict_without_cache)
+
+    def _restrict_without_cache(self, candidates: set) -> 'BallotLevels':
         return BallotLevels({k: v for k, v in self.as_dict.items() if k in candidates},
                             candidates=NiceSet(self.candidates & candidates), scale=self.scale)
 
@@ -20,7 +20,7 @@ along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
 """
 from typing import Iterable
 from whalrus.ballots.ballot import Ballot
-from whalrus.utils.utils import parse_weak_order, cached_property, set_to_list, NiceSet
+from whalrus.utils.utils import parse_weak_order, cached_property, set_to_list, NiceSet, RestrictionCache
 from whalrus.priorities.priority import Priority
 
 
@@ -75,6 +75,11 @@ class BallotOrder(Ballot):
         c
     """
 
+    #: RestrictionCache: The cache used by :meth:`restrict`, shared by all the ballots of this class and its
+    #: subclasses (and by all the threads). It does not keep the ballots alive. For example,
+    #: ``BallotOrder.restriction_cache.maxsize = 0`` disables it.
+    restriction_cache = RestrictionCache()
+
     # Core features: ballot and candidates
     # ====================================
 
@@ -286,11 +291,21 @@ class BallotOrder(Ballot):
 
         In the last example above, note that `d` is not in the candidates of the restricted ballot, as she was not
         available at the moment when the voter cast her ballot.
+
+        The restrictions are stored in :attr:`restriction_cache`, so that restricting the same ballot again to the
+        same candidates (e.g. in several sub-elections) costs nothing:
+
+            >>> ballot.restrict(candidates={'b', 'c'}) is ballot.restrict(candidates={'b', 'c'})
+            True
         """
         if kwargs:
             raise TypeError("restrict() got an unexpected keyword argument %r" % list(kwargs.keys())[0])
-        if candidates is None:
+        if candidates is None or self.candidates <= candidates:
+            # Nothing to remove.
             return self
+        return self.restriction_cache.get(self, candidates, self._restrict_without_cache)
+
+    def _restrict_without_cache(self, candidates: set) -> 'BallotOrder':
         weak = [indifference_class & candidates for indifference_class in self.as_weak_order]
         weak = [indifference_class for indifference_class in weak if indifference_class]
         return BallotOrder(weak, candidates=self.candidates & candidates)
@@ -18,7 +18,6 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
 """
-from pyparsing import ParseException
 from whalrus.converters_ballot.converter_ballot import ConverterBallot
 from whalrus.ballots.ballot import Ballot
 from whalrus.ballots.ballot_one_name import BallotOneName
@@ -27,6 +26,7 @@ from whalrus.ballots.ballot_levels import BallotLevels
 from whalrus.ballots.ballot_plurality import BallotPlurality
 from whalrus.ballots.ballot_veto import BallotVeto
 from whalrus.priorities.priority import Priority
+from whalrus.utils.utils import WeakOrderParseError
 
 
 # noinspection PyUnresolvedReferences
@@ -117,6 +117,6 @@ class ConverterBallotGeneral(ConverterBallot):
                 return self(BallotOneName(x), candidates)
             else:
                 return self(ballot_order, candidates)
-        except (TypeError, ParseException):
+        except (TypeError, WeakOrderParseError):
             pass
         return self(BallotOneName(x), candidates)
@@ -32,7 +32,7 @@ from whalrus.scales.scale_from_list import ScaleFromList
 from whalrus.scales.scale_from_set import ScaleFromSet
 from whalrus.scales.scale_range import ScaleRange
 from whalrus.scorers.scorer_borda import ScorerBorda
-from whalrus.utils.utils import my_division
+from whalrus.utils.utils import my_division, numeric_policy
 
 
 class ConverterBallotToLevelsInterval(ConverterBallot):
@@ -90,6 +90,12 @@ class ConverterBallotToLevelsInterval(ConverterBallot):
         self.borda_unordered_give_points = borda_unordered_give_points
 
     def __call__(self, x: object, candidates: set=None) -> BallotLevels:
+        # The grades are part of the ballot, not a result of the rule: they are computed exactly, whatever the numeric
+        # policy (cf. :func:`numeric_policy`). Otherwise, e.g., two grades that are equal could become different floats.
+        with numeric_policy('exact'):
+            return self._convert(x, candidates)
+
+    def _convert(self, x: object, candidates: set) -> BallotLevels:
         x = ConverterBallotGeneral()(x, candidates=None)
         if isinstance(x, BallotVeto):
             if x.candidate is None:
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright Sylvain Bouveret, Yann Chevaleyre and François Durand
+sylvain.bouveret@imag.fr, yann.chevaleyre@dauphine.fr, fradurand@gmail.com
+
+This file is part of Whalrus.
+
+Whalrus is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Whalrus is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import numpy as np
+from whalrus.profiles.profile_array import ProfileArray, _rank_dtype
+from whalrus.utils.utils import set_to_list
+from typing import Iterator
+
+
+class Generator:
+    """
+    A generator of random profiles.
+
+    A :class:`Generator` object is a callable whose input is a number of voters. Each call draws a new random profile,
+    which is directly built as a :class:`ProfileArray` (i.e. an array of ranks, without any :class:`BallotOrder`
+    object). It can be used wherever a :class:`Profile` is expected, e.g. by the rules.
+
+    Parameters
+    ----------
+    candidates : set
+        The candidates.
+    seed : int or np.random.Generator
+        The seed of the random number generator (cf. ``np.random.default_rng``). With the same seed, the same
+        sequence of profiles is drawn.
+
+    Attributes
+    ----------
+    candidates_as_list : list
+        The candidates, in the order of the columns of the profiles.
+    rng : np.random.Generator
+        The random number generator.
+
+    Examples
+    --------
+    Cf. :class:`GeneratorImpartialCulture` for some examples.
+    """
+
+    def __init__(self, candidates: set, seed: object = None):
+        self.candidates_as_list = set_to_list(candidates)
+        self.rng = np.random.default_rng(seed)
+
+    @property
+    def n_candidates(self) -> int:
+        """int: The number of candidates.
+        """
+        return len(self.candidates_as_list)
+
+    def __call__(self, n_voters: int, compress: bool = False) -> ProfileArray:
+        """
+        Draw a profile.
+
+        Parameters
+        ----------
+        n_voters : int
+            The number of voters.
+        compress : bool
+            If True, then equal ballots are grouped (cf. :meth:`ProfileArray.compressed`).
+
+        Returns
+        -------
+        ProfileArray
+            The profile.
+        """
+        orders = self._orders(n_voters)
+        ranks = np.empty(orders.shape, dtype=_rank_dtype(self.n_candidates))
+        np.put_along_axis(ranks, orders, np.arange(self.n_candidates, dtype=ranks.dtype)[np.newaxis, :], axis=1)
+        profile = ProfileArray._from_arrays(ranks, self.candidates_as_list, np.ones(n_voters, dtype=np.int64), None)
+        return profile.compressed() if compress else profile
+
+    def iterate(self, n_voters: int, n_elections: int = None, compress: bool = False) -> Iterator:
+        """
+        Draw several profiles.
+
+        Parameters
+        ----------
+        n_voters : int
+            The number of voters in each profile.
+        n_elections : int
+            The number of profiles. Default: infinite.
+        compress : bool
+            If True, then equal ballots are grouped in each profile.
+
+        Returns
+        -------
+        Iterator
+            An iterator of :class:`ProfileArray` objects. Profiles are drawn only when they are needed.
+        """
+        i = 0
+        while n_elections is None or i < n_elections:
+            yield self(n_voters, compress=compress)
+            i += 1
+
+    def _orders(self, n_voters: int) -> np.ndarray:
+        """
+        Draw the ballots.
+
+        Parameters
+        ----------
+        n_voters : int
+            The number of voters.
+
+        Returns
+        -------
+        np.ndarray
+            An array of integers, with one row per voter. Each row is a strict order, given as the indexes of the
+            candidates (in :attr:`candidates_as_list`) from the most liked to the least liked.
+        """
+        raise NotImplementedError
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright Sylvain Bouveret, Yann Chevaleyre and François Durand
+sylvain.bouveret@imag.fr, yann.chevaleyre@dauphine.fr, fradurand@gmail.com
+
+This file is part of Whalrus.
+
+Whalrus is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Whalrus is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import numpy as np
+from whalrus.generators.generator import Generator
+
+
+class GeneratorEuclidean(Generator):
+    """
+    Euclidean (or spatial) model: voters and candidates are points in a space, and each voter prefers the candidates
+    that are closer to her.
+
+    The positions of the voters are drawn uniformly in the unit hypercube. The positions of the candidates are either
+    given, or drawn uniformly in the unit hypercube for each profile.
+
+    Parameters
+    ----------
+    args
+        Cf. parent class.
+    n_dimensions : int
+        The dimension of the space.
+    positions : dict
+        Key: candidate. Value: its position (a number in dimension 1, or a sequence of ``n_dimensions`` numbers).
+        Default: the positions of the candidates are drawn at random for each profile.
+    kwargs
+        Cf. parent class.
+
+    Attributes
+    ----------
+    positions_ : np.ndarray
+        The positions of the candidates used for the last profile (one row per candidate, in the order of
+        :attr:`candidates_as_list`).
+
+    Examples
+    --------
+        >>> generator = GeneratorEuclidean(candidates={'a', 'b', 'c'}, positions={'a': 0, 'b': .4, 'c': 1}, seed=42)
+        >>> print(generator(n_voters=100, compress=True))
+        (27): c > b > a
+        (31): b > a > c
+        (20): b > c > a
+        (22): a > b > c
+    """
+
+    def __init__(self, *args, n_dimensions: int = 1, positions: dict = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.n_dimensions = n_dimensions
+        self.positions = positions
+        self.positions_ = None
+
+    def _orders(self, n_voters: int) -> np.ndarray:
+        if self.positions is None:
+            self.positions_ = self.rng.random((self.n_candidates, self.n_dimensions))
+        else:
+            self.positions_ = np.array([self.positions[c] for c in self.candidates_as_list],
+                                       dtype=float).reshape((self.n_candidates, self.n_dimensions))
+        voters = self.rng.random((n_voters, self.n_dimensions))
+        distances = ((voters[:, np.newaxis, :] - self.positions_[np.newaxis, :, :]) ** 2).sum(axis=2)
+        return np.argsort(distances, axis=1, kind='stable')
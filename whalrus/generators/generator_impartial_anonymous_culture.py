@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright Sylvain Bouveret, Yann Chevaleyre and François Durand
+sylvain.bouveret@imag.fr, yann.chevaleyre@dauphine.fr, fradurand@gmail.com
+
+This file is part of Whalrus.
+
+Whalrus is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Whalrus is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import numpy as np
+from math import factorial
+from whalrus.generators.generator import Generator
+
+
+class GeneratorImpartialAnonymousCulture(Generator):
+    """
+    Impartial Anonymous Culture: the anonymous profile (i.e. the number of voters having each strict order) is drawn
+    uniformly at random.
+
+    The profile is drawn with a Pólya urn: the first voter draws a uniform order. Then the `t`-th voter copies the
+    order of one of the `t - 1` previous voters (chosen uniformly) with probability `(t - 1) / (m! + t - 1)`, where `m`
+    is the number of candidates, and draws a new uniform order otherwise. This is equivalent to Impartial Anonymous
+    Culture, without enumerating the `m!` orders.
+
+    Parameters
+    ----------
+    args
+        Cf. parent class.
+    kwargs
+        Cf. parent class.
+
+    Examples
+    --------
+        >>> generator = GeneratorImpartialAnonymousCulture(candidates={'a', 'b'}, seed=42)
+        >>> print(generator(n_voters=5, compress=True))
+        (4): a > b
+        (1): b > a
+    """
+
+    def _orders(self, n_voters: int) -> np.ndarray:
+        # Beyond 170 candidates, m! exceeds the range of floats (and the probability to copy is below 1e-300 anyway).
+        n_orders = float(factorial(self.n_candidates)) if self.n_candidates <= 170 else np.inf
+        t = np.arange(n_voters)
+        is_copy = self.rng.random(n_voters) < t / (n_orders + t)
+        # Each voter who copies points to a previous voter; then follow the pointers to the voter who drew the order.
+        source = np.where(is_copy, np.floor(self.rng.random(n_voters) * t).astype(np.int64), t)
+        while True:
+            new_source = source[source]
+            if np.array_equal(new_source, source):
+                break
+            source = new_source
+        orders = self.rng.permuted(np.tile(np.arange(self.n_candidates), (n_voters, 1)), axis=1)
+        return orders[source]
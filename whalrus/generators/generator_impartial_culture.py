@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright Sylvain Bouveret, Yann Chevaleyre and François Durand
+sylvain.bouveret@imag.fr, yann.chevaleyre@dauphine.fr, fradurand@gmail.com
+
+This file is part of Whalrus.
+
+Whalrus is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Whalrus is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import numpy as np
+from whalrus.generators.generator import Generator
+
+
+class GeneratorImpartialCulture(Generator):
+    """
+    Impartial Culture: each voter has a strict order drawn uniformly at random, independently of the others.
+
+    Parameters
+    ----------
+    args
+        Cf. parent class.
+    kwargs
+        Cf. parent class.
+
+    Examples
+    --------
+        >>> generator = GeneratorImpartialCulture(candidates={'a', 'b', 'c'}, seed=42)
+        >>> profile = generator(n_voters=4)
+        >>> print(profile)
+        c > b > a
+        a > c > b
+        b > c > a
+        c > a > b
+
+    The profiles can be used by the rules like any other profile:
+
+        >>> from whalrus.rules.rule_borda import RuleBorda
+        >>> RuleBorda(profile).winner_
+        'c'
+
+    Use :meth:`iterate` to simulate many elections:
+
+        >>> from whalrus.rules.rule_condorcet import RuleCondorcet
+        >>> generator = GeneratorImpartialCulture(candidates={'a', 'b', 'c'}, seed=0)
+        >>> rule = RuleCondorcet()
+        >>> [rule(profile).cowinners_ for profile in generator.iterate(n_voters=5, n_elections=4)]
+        [{'c'}, {'c'}, {'a'}, {'c'}]
+    """
+
+    def _orders(self, n_voters: int) -> np.ndarray:
+        return self.rng.permuted(np.tile(np.arange(self.n_candidates), (n_voters, 1)), axis=1)
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright Sylvain Bouveret, Yann Chevaleyre and François Durand
+sylvain.bouveret@imag.fr, yann.chevaleyre@dauphine.fr, fradurand@gmail.com
+
+This file is part of Whalrus.
+
+Whalrus is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Whalrus is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import numpy as np
+from whalrus.generators.generator import Generator
+from numbers import Number
+
+
+class GeneratorMallows(Generator):
+    """
+    Mallows model: the probability of a strict order is proportional to `phi ** d`, where `d` is its Kendall tau
+    distance to a reference order.
+
+    The orders are drawn with the repeated insertion model: the candidates of the reference order are inserted one by
+    one, and the `i`-th one is inserted at position `j` (for `j` from 0 to `i`) with probability proportional to
+    `phi ** (i - j)`. This is done for all voters at once.
+
+    Parameters
+    ----------
+    args
+        Cf. parent class.
+    phi : Number
+        The dispersion, between 0 and 1. With ``phi=0``, all the voters have the reference order. With ``phi=1``, this
+        is Impartial Culture.
+    reference : list
+        The reference order, from the most liked candidate to the least liked. Default: the candidates in the order of
+        :attr:`candidates_as_list`.
+    kwargs
+        Cf. parent class.
+
+    Examples
+    --------
+        >>> generator = GeneratorMallows(candidates={'a', 'b', 'c'}, phi=.2, reference=['c', 'b', 'a'], seed=42)
+        >>> print(generator(n_voters=100, compress=True))
+        (59): c > b > a
+        (20): c > a > b
+        (4): a > c > b
+        (4): b > a > c
+        (13): b > c > a
+    """
+
+    def __init__(self, *args, phi: Number = 1, reference: list = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.phi = phi
+        if reference is None:
+            reference = self.candidates_as_list
+        indexes = {c: i for i, c in enumerate(self.candidates_as_list)}
+        self.reference = list(reference)
+        self._reference_indexes = np.array([indexes[c] for c in self.reference], dtype=np.int64)
+
+    def _orders(self, n_voters: int) -> np.ndarray:
+        n_candidates = self.n_candidates
+        orders = np.zeros((n_voters, n_candidates), dtype=np.int64)
+        rows = np.arange(n_voters)
+        for i in range(n_candidates):
+            # Position of insertion of the i-th candidate of the reference (0 = top).
+            probabilities = float(self.phi) ** np.arange(i, -1, -1, dtype=float)
+            cumulative = np.cumsum(probabilities)
+            positions = np.searchsorted(cumulative, self.rng.random(n_voters) * cumulative[-1], side='right')
+            positions = np.minimum(positions, i)
+            for k in range(i, 0, -1):
+                shift = k > positions
+                orders[shift, k] = orders[shift, k - 1]
+            orders[rows, positions] = self._reference_indexes[i]
+        return orders
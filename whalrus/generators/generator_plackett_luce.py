@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright Sylvain Bouveret, Yann Chevaleyre and François Durand
+sylvain.bouveret@imag.fr, yann.chevaleyre@dauphine.fr, fradurand@gmail.com
+
+This file is part of Whalrus.
+
+Whalrus is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Whalrus is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import numpy as np
+from whalrus.generators.generator import Generator
+
+
+class GeneratorPlackettLuce(Generator):
+    """
+    Plackett-Luce model: each voter picks her favorite candidate with probability proportional to its weight, then her
+    second favorite among the remaining candidates with probability proportional to its weight, etc.
+
+    The orders are drawn with the Gumbel trick: each voter sorts the candidates by decreasing value of
+    `log(weight) + G`, where `G` is an independent Gumbel noise. This is done for all voters at once.
+
+    Parameters
+    ----------
+    args
+        Cf. parent class.
+    weights : dict
+        Key: candidate. Value: its weight (a positive number). Default: all weights are 1 (which gives Impartial
+        Culture).
+    kwargs
+        Cf. parent class.
+
+    Examples
+    --------
+        >>> generator = GeneratorPlackettLuce(candidates={'a', 'b', 'c'}, weights={'a': 6, 'b': 3, 'c': 1}, seed=42)
+        >>> print(generator(n_voters=100, compress=True))
+        (29): b > a > c
+        (7): c > a > b
+        (38): a > b > c
+        (17): a > c > b
+        (6): b > c > a
+        (3): c > b > a
+    """
+
+    def __init__(self, *args, weights: dict = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if weights is None:
+            weights = {c: 1 for c in self.candidates_as_list}
+        self.weights = weights
+
+    def _orders(self, n_voters: int) -> np.ndarray:
+        log_weights = np.log(np.array([float(self.weights[c]) for c in self.candidates_as_list]))
+        utilities = log_weights[np.newaxis, :] + self.rng.gumbel(size=(n_voters, self.n_candidates))
+        return np.argsort(-utilities, axis=1, kind='stable')
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright Sylvain Bouveret, Yann Chevaleyre and François Durand
+sylvain.bouveret@imag.fr, yann.chevaleyre@dauphine.fr, fradurand@gmail.com
+
+This file is part of Whalrus.
+
+Whalrus is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Whalrus is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import numpy as np
+from whalrus.generators.generator import Generator
+
+
+class GeneratorSinglePeaked(Generator):
+    """
+    Single-peaked orders: each voter has an order drawn uniformly among the strict orders that are single-peaked with
+    respect to an axis (model of Walsh).
+
+    The order is built from the least liked candidate to the most liked one: at each step, the next candidate is one of
+    the two extremities of the remaining part of the axis, each with probability 1 / 2. This is done for all voters at
+    once.
+
+    Parameters
+    ----------
+    args
+        Cf. parent class.
+    axis : list
+        The axis, i.e. a list of the candidates. Default: the candidates in the order of :attr:`candidates_as_list`.
+    kwargs
+        Cf. parent class.
+
+    Examples
+    --------
+        >>> generator = GeneratorSinglePeaked(candidates={'a', 'b', 'c'}, axis=['a', 'b', 'c'], seed=42)
+        >>> print(generator(n_voters=100, compress=True))
+        (20): a > b > c
+        (29): b > c > a
+        (27): b > a > c
+        (24): c > b > a
+    """
+
+    def __init__(self, *args, axis: list = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if axis is None:
+            axis = self.candidates_as_list
+        indexes = {c: i for i, c in enumerate(self.candidates_as_list)}
+        self.axis = list(axis)
+        self._axis_indexes = np.array([indexes[c] for c in self.axis], dtype=np.int64)
+
+    def _orders(self, n_voters: int) -> np.ndarray:
+        n_candidates = self.n_candidates
+        orders = np.empty((n_voters, n_candidates), dtype=np.int64)
+        left = np.zeros(n_voters, dtype=np.int64)
+        right = np.full(n_voters, n_candidates - 1, dtype=np.int64)
+        for position in range(n_candidates - 1, 0, -1):
+            take_left = self.rng.random(n_voters) < .5
+            orders[:, position] = self._axis_indexes[np.where(take_left, left, right)]
+            left += take_left
+            right -= ~take_left
+        if n_candidates:
+            orders[:, 0] = self._axis_indexes[left]
+        return orders
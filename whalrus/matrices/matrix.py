@@ -20,14 +20,96 @@ along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
 """
 import logging
 import numpy as np
-from whalrus.utils.utils import DeleteCacheMixin, cached_property, NiceSet, set_to_list, NiceDict
+from fractions import Fraction
+from whalrus.utils.utils import cached_property, NiceSet, set_to_list, NiceDict, apply_numeric_policy, \
+    get_numeric_policy, check_numeric_policy
+from whalrus.utils.incremental_mixin import IncrementalMixin
 from whalrus.converters_ballot.converter_ballot_general import ConverterBallotGeneral
 from whalrus.profiles.profile import Profile
+from whalrus.profiles.election import Election
 from whalrus.converters_ballot.converter_ballot import ConverterBallot
 from typing import Union
 
 
-class Matrix(DeleteCacheMixin):
+def _array_of_policy(values: list) -> np.ndarray:
+    """
+    Convert a list of lists of numbers to an array, according to the numeric policy.
+
+    Parameters
+    ----------
+    values : list
+        A list of lists of numbers.
+
+    Returns
+    -------
+    np.ndarray
+        With the policy ``'exact'``, the array is built by NumPy without any conversion (hence fractions give an array
+        of objects). With the policy ``'integer'``, it is an array of integers if all values are integers, and an array
+        of floats otherwise. With the policy ``'float'``, it is an array of floats. Cf. :func:`numeric_policy`.
+
+    Examples
+    --------
+        >>> from fractions import Fraction
+        >>> from whalrus.utils.utils import numeric_policy
+        >>> _array_of_policy([[1, Fraction(1, 2)]])
+        array([[1, Fraction(1, 2)]], dtype=object)
+        >>> with numeric_policy('integer'):
+        ...     _array_of_policy([[1, 2]]), _array_of_policy([[1, Fraction(1, 2)]])
+        (array([[1, 2]]), array([[1. , 0.5]]))
+    """
+    policy = get_numeric_policy()
+    if policy == 'exact':
+        return np.array(values)
+    if policy == 'integer' and all(isinstance(x, (int, np.integer)) for row in values for x in row):
+        return np.array(values, dtype=np.int64)
+    return np.array(values, dtype=float)
+
+
+def _scaled_to_array(numerators: np.ndarray, denominator: int) -> np.ndarray:
+    """
+    Convert a matrix given as integers over a common denominator to an array, with the numeric policy ``'integer'``.
+
+    Parameters
+    ----------
+    numerators : np.ndarray
+        An array of integers (native or Python integers).
+    denominator : int
+        A positive integer.
+
+    Returns
+    -------
+    np.ndarray
+        An array of integers if `denominator` is 1. Otherwise, an array of floats, where each coefficient is the
+        closest float to ``numerator / denominator``: equal fractions give equal floats.
+
+    Examples
+    --------
+        >>> _scaled_to_array(np.array([[0, 3], [2, 6]]), 6)
+        array([[0.        , 0.5       ],
+               [0.33333333, 1.        ]])
+    """
+    if denominator == 1:
+        return numerators.astype(np.int64) if numerators.dtype == object and _fits_in_int64(numerators) else numerators
+    if numerators.dtype != object and denominator < 2 ** 53 and np.abs(numerators).max(initial=0) < 2 ** 53:
+        # Both are exact floats, and the division of floats is correctly rounded.
+        return numerators.astype(float) / float(denominator)
+    return np.array([float(Fraction(int(x), denominator)) for x in numerators.flat]).reshape(numerators.shape)
+
+
+def _off_diagonal(array: np.ndarray) -> np.ndarray:
+    """The non-diagonal coefficients of a square array: it has one row per row of `array`, and one column less."""
+    n = array.shape[0]
+    if n == 0:
+        return array.reshape((0, 0))
+    return array[~np.eye(n, dtype=bool)].reshape((n, n - 1))
+
+
+def _fits_in_int64(x: np.ndarray) -> bool:
+    """Whether an array of integers can be stored as a native array, and summed along one axis without overflow."""
+    return max([abs(int(y)) for y in (x.min(initial=0), x.max(initial=0))]) * max(1, x.shape[-1]) < 2 ** 62
+
+
+class Matrix(IncrementalMixin):
     """
     A way to compute a matrix from a profile.
 
@@ -43,6 +125,12 @@ class Matrix(DeleteCacheMixin):
     converter : ConverterBallot
         The converter that is used to convert input ballots in order to compute :attr:`profile_converted_`.
         Default: :class:`ConverterBallotGeneral`.
+    numeric_policy : str
+        The numeric policy used for the computed variables: ``'exact'``, ``'integer'`` or ``'float'`` (cf.
+        :func:`numeric_policy`). If None (default), the policy that is current when the matrix is called is used.
+        With the policies ``'integer'`` and ``'float'``, :attr:`as_array_` is an array of a native NumPy type (instead
+        of an array of objects). The sub-objects of the matrix are called with the policy of the matrix, hence they
+        use it too, unless they have their own parameter ``numeric_policy``.
     kwargs
         If present, these parameters will be passed to ``__call__`` immediately after initialization.
 
@@ -58,44 +146,84 @@ class Matrix(DeleteCacheMixin):
         of the object.
     candidates_ : NiceSet
         The candidates of the election, as entered in the ``__call__``.
+    election_ : Election
+        The election, if the object was called on an :class:`Election` instead of ballots (None otherwise). In that
+        case, :attr:`profile_original_` is the profile of the election, and the converted profile and the sub-objects
+        (such as matrices) are shared with the other objects called on the same election.
+    numeric_policy_ : str
+        The numeric policy of the computed variables (cf. the parameter ``numeric_policy``).
 
     Examples
     --------
     Cf. :class:`MatrixWeightedMajority` for some examples.
     """
 
-    def __init__(self, *args, converter: ConverterBallot = None, **kwargs):
+    def __init__(self, *args, converter: ConverterBallot = None, numeric_policy: str = None, **kwargs):
         """
         Remark: this `__init__` must always be called at the end of the subclasses' `__init__`.
         """
         # Parameters
         if converter is None:
             converter = ConverterBallotGeneral()
+        check_numeric_policy(numeric_policy)
         self.converter = converter
+        self.numeric_policy = numeric_policy
         # Computed variables
+        self.numeric_policy_ = None
         self.profile_original_ = None
         self.profile_converted_ = None
         self.candidates_ = None
+        self.election_ = None
+        self._candidates_are_given = False
+        self._election_converted = None
         # Optional: load a profile at initialization
         if args or kwargs:
             self(*args, **kwargs)
 
-    def __call__(self, ballots: Union[list, Profile] = None, weights: list = None, voters: list = None,
+    def __call__(self, ballots: Union[list, Profile, Election] = None, weights: list = None, voters: list = None,
                  candidates: set = None):
-        self.profile_original_ = Profile(ballots, weights=weights, voters=voters)
-        self.profile_converted_ = Profile([self.converter(b, candidates) for b in self.profile_original_],
-                                          weights=self.profile_original_.weights, voters=self.profile_original_.voters)
+        self.numeric_policy_ = get_numeric_policy() if self.numeric_policy is None else self.numeric_policy
+        self.election_ = None
+        if isinstance(ballots, Election):
+            # Share the profile and the computations with the other objects called on the election.
+            self.election_ = ballots
+            self.profile_original_ = ballots.profile_
+            if candidates is None:
+                candidates = ballots.candidates
+        elif isinstance(ballots, Profile):
+            # Keep the storage of the profile (e.g. a ProfileArray).
+            self.profile_original_ = type(ballots)(ballots, weights=weights, voters=voters)
+        else:
+            self.profile_original_ = Profile(ballots, weights=weights, voters=voters)
+        self._candidates_are_given = candidates is not None
+        self._convert_profile(candidates)
+        return self
+
+    def _convert_profile(self, candidates: set = None) -> None:
+        """Compute :attr:`profile_converted_` and :attr:`candidates_` from :attr:`profile_original_`."""
+        if self.election_ is None:
+            self.profile_converted_ = self.profile_original_.convert(self.converter, candidates)
+        else:
+            self._election_converted = self.election_.converted(self.converter, candidates)
+            self.profile_converted_ = self._election_converted.profile_
         if candidates is None:
-            candidates = NiceSet(set().union(*[b.candidates for b in self.profile_converted_]))
+            candidates = self.profile_converted_.candidates
         self.candidates_ = candidates
         self._check_profile(candidates)
         self.delete_cache()
-        return self
 
     def _check_profile(self, candidates: set) -> None:
-        if any([b.candidates != candidates for b in self.profile_converted_]):
+        if not self.profile_converted_.ballots_have_candidates(candidates):
             logging.warning('Some ballots do not have the same set of candidates as the whole election.')
 
+    def _call_sub_object(self, x: object, candidates: set = None) -> object:
+        """Call a sub-object (e.g. a matrix) on :attr:`profile_converted_`, with the given candidates (by default,
+        they are inferred from the ballots). If the object itself was called on an :class:`Election`, the result is
+        shared with the other objects called on the election."""
+        if self.election_ is None:
+            return x(self.profile_converted_, candidates=candidates)
+        return self._election_converted.evaluate(x, candidates=candidates)
+
     @cached_property
     def as_dict_(self) -> NiceDict:
         """NiceDict: The matrix, as a :class:`NiceDict`. Keys are pairs of candidates, and values are the coefficients
@@ -121,10 +249,183 @@ class Matrix(DeleteCacheMixin):
         """Array : The matrix, as a numpy array. Each row and each column corresponds to a candidate (in the order of
         :attr:`candidates_as_list_`).
         """
-        return np.array([[self.as_dict_[(c, d)] for d in self.candidates_as_list_] for c in self.candidates_as_list_])
+        return _array_of_policy([[self.as_dict_[(c, d)] for d in self.candidates_as_list_]
+                                 for c in self.candidates_as_list_])
 
     @cached_property
     def as_array_of_floats_(self) -> np.array:
         """Array : The matrix, as a numpy array. It is the same as :attr:`as_array_`, but converted to floats.
         """
         return self.as_array_.astype(float)
+
+    # Rows and columns
+    # ----------------
+
+    def row(self, c: object) -> NiceDict:
+        """
+        Row of a candidate.
+
+        Parameters
+        ----------
+        c : candidate
+            A candidate.
+
+        Returns
+        -------
+        NiceDict
+            To each candidate `d`, it associates the coefficient `(c, d)` of the matrix.
+
+        Examples
+        --------
+            >>> from whalrus import MatrixWeightedMajority
+            >>> matrix = MatrixWeightedMajority(['a > b > c', 'b > a > c'])
+            >>> matrix.row('a')
+            {'a': 0, 'b': Fraction(1, 2), 'c': 1}
+        """
+        return NiceDict(zip(self.candidates_as_list_, self.row_by_index(self.candidates_indexes_[c]).tolist()))
+
+    def column(self, c: object) -> NiceDict:
+        """
+        Column of a candidate.
+
+        Parameters
+        ----------
+        c : candidate
+            A candidate.
+
+        Returns
+        -------
+        NiceDict
+            To each candidate `d`, it associates the coefficient `(d, c)` of the matrix.
+
+        Examples
+        --------
+            >>> from whalrus import MatrixWeightedMajority
+            >>> matrix = MatrixWeightedMajority(['a > b > c', 'b > a > c'])
+            >>> matrix.column('a')
+            {'a': 0, 'b': Fraction(1, 2), 'c': 0}
+        """
+        return NiceDict(zip(self.candidates_as_list_, self.column_by_index(self.candidates_indexes_[c]).tolist()))
+
+    def row_by_index(self, i: int) -> np.ndarray:
+        """
+        Row of the candidate of a given index.
+
+        Parameters
+        ----------
+        i : int
+            An index in :attr:`candidates_as_list_`.
+
+        Returns
+        -------
+        np.ndarray
+            The row `i` of :attr:`as_array_` (it is a view, not a copy).
+
+        Examples
+        --------
+            >>> from whalrus import MatrixWeightedMajority
+            >>> MatrixWeightedMajority(['a > b > c', 'b > a > c']).row_by_index(2)
+            array([0, 0, 0], dtype=object)
+        """
+        return self.as_array_[i]
+
+    def column_by_index(self, j: int) -> np.ndarray:
+        """
+        Column of the candidate of a given index.
+
+        Parameters
+        ----------
+        j : int
+            An index in :attr:`candidates_as_list_`.
+
+        Returns
+        -------
+        np.ndarray
+            The column `j` of :attr:`as_array_` (it is a view, not a copy).
+
+        Examples
+        --------
+            >>> from whalrus import MatrixWeightedMajority
+            >>> MatrixWeightedMajority(['a > b > c', 'b > a > c']).column_by_index(2)
+            array([1, 1, 0], dtype=object)
+        """
+        return self.as_array_[:, j]
+
+    @cached_property
+    def _off_diagonal_(self) -> np.ndarray:
+        """np.ndarray: The non-diagonal coefficients of :attr:`as_array_`. It has one row per candidate, and
+        `n_candidates - 1` columns."""
+        return _off_diagonal(self.as_array_)
+
+    @cached_property
+    def _scaled_array_(self) -> Union[tuple, None]:
+        """tuple or None: With the numeric policy ``'integer'`` (cf. :func:`numeric_policy`), the subclasses may give
+        the matrix exactly, as a pair (`numerators`, `denominator`): an array of integers and a positive integer such
+        that the matrix is ``numerators / denominator``. Then the sums of coefficients (such as :attr:`row_sums_`) are
+        computed exactly, and only converted to floats at the end. By default, it is None."""
+        return None
+
+    def _off_diagonal_scaled(self) -> tuple:
+        """The non-diagonal coefficients of the matrix (as in :attr:`_off_diagonal_`), and the denominator by which they
+        must be divided (1 unless :attr:`_scaled_array_` is used)."""
+        scaled = self._scaled_array_
+        if scaled is None:
+            return self._off_diagonal_, 1
+        numerators, denominator = scaled
+        if numerators.dtype != object and not _fits_in_int64(numerators):
+            numerators = numerators.astype(object)
+        return _off_diagonal(numerators), denominator
+
+    @cached_property
+    def row_sums_(self) -> NiceDict:
+        """NiceDict: To each candidate, it associates the sum of the non-diagonal coefficients of its row.
+
+        Examples
+        --------
+            >>> from whalrus import MatrixWeightedMajority
+            >>> MatrixWeightedMajority(['a > b > c', 'b > a > c']).row_sums_
+            {'a': Fraction(3, 2), 'b': Fraction(3, 2), 'c': 0}
+        """
+        off_diagonal, denominator = self._off_diagonal_scaled()
+        return NiceDict(zip(self.candidates_as_list_, [apply_numeric_policy(Fraction(int(x), denominator))
+                                                       if denominator != 1 else apply_numeric_policy(x)
+                                                       for x in off_diagonal.sum(axis=1).tolist()]))
+
+    @cached_property
+    def row_mins_(self) -> NiceDict:
+        """NiceDict: To each candidate, it associates the minimum of the non-diagonal coefficients of its row.
+
+        Examples
+        --------
+            >>> from whalrus import MatrixWeightedMajority
+            >>> MatrixWeightedMajority(['a > b > c', 'b > a > c']).row_mins_
+            {'a': Fraction(1, 2), 'b': Fraction(1, 2), 'c': 0}
+        """
+        off_diagonal, denominator = self._off_diagonal_scaled()
+        return NiceDict(zip(self.candidates_as_list_, [apply_numeric_policy(Fraction(int(x), denominator))
+                                                       if denominator != 1 else apply_numeric_policy(x)
+                                                       for x in off_diagonal.min(axis=1).tolist()]))
+
+    def beats_all(self, value: object = 1) -> NiceSet:
+        """
+        Candidates whose non-diagonal coefficients are at least a given value, with equality for some of them.
+
+        Parameters
+        ----------
+        value : Number
+            A value.
+
+        Returns
+        -------
+        NiceSet
+            The candidates whose minimal non-diagonal coefficient is equal to `value` (cf. :attr:`row_mins_`). For
+            example, in a :class:`MatrixMajority` with its default parameters, these are the candidates who beat all
+            the other candidates (i.e. the Condorcet winners).
+
+        Examples
+        --------
+            >>> from whalrus import MatrixMajority
+            >>> MatrixMajority(['a > b > c', 'a > c > b']).beats_all()
+            {'a'}
+        """
+        return NiceSet(c for c, v in self.row_mins_.items() if v == value)
@@ -18,11 +18,14 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
 """
-from whalrus.utils.utils import cached_property, NiceDict, convert_number
+import numpy as np
+from whalrus.utils.utils import cached_property, NiceDict, convert_number, apply_numeric_policy, get_numeric_policy
+from whalrus.profiles.profile_batch import ProfileBatch
 from whalrus.converters_ballot.converter_ballot_to_order import ConverterBallotToOrder
 from whalrus.converters_ballot.converter_ballot import ConverterBallot
-from whalrus.matrices.matrix import Matrix
-from whalrus.matrices.matrix_weighted_majority import MatrixWeightedMajority
+from whalrus.matrices.matrix import Matrix, _array_of_policy
+from whalrus.matrices.matrix_weighted_majority import MatrixWeightedMajority, _lcm
+from typing import Union
 from numbers import Number
 from fractions import Fraction
 
@@ -69,6 +72,8 @@ class MatrixMajority(Matrix):
                [0, 0, 0]])
     """
 
+    _incremental_sub_objects = ('matrix_weighted_majority_',)
+
     def __init__(self, *args, converter: ConverterBallot = None, matrix_weighted_majority: Matrix = None,
                  greater: Number = 1, lower: Number = 0, equal: Number = Fraction(1, 2),
                  diagonal: Number = Fraction(1, 2), **kwargs):
@@ -88,7 +93,7 @@ class MatrixMajority(Matrix):
         """Matrix: The weighted majority matrix (upon which the computation of the majority matrix is based), once
         computed with the given profile.
         """
-        return self.matrix_weighted_majority(self.profile_converted_)
+        return self._call_sub_object(self.matrix_weighted_majority)
 
     @cached_property
     def candidates_as_list_(self) -> list:
@@ -98,14 +103,79 @@ class MatrixMajority(Matrix):
     def candidates_indexes_(self) -> NiceDict:
         return self.matrix_weighted_majority_.candidates_indexes_
 
+    @cached_property
+    def as_array_(self) -> np.ndarray:
+        """Array : The matrix, as a numpy array. Cf. :attr:`Matrix.as_array_`. It is computed by comparing the array of
+        the weighted majority matrix `W` with its transpose. Unless the numeric policy is ``'float'``, the coefficients
+        of `W` are compared exactly, as integers over a common denominator when possible (cf.
+        :attr:`Matrix._scaled_array_`).
+
+        Examples
+        --------
+            >>> MatrixMajority(['a > b > c', 'b > a > c'], equal=0, diagonal=0, numeric_policy='integer').as_array_
+            array([[0, 0, 1],
+                   [0, 0, 1],
+                   [0, 0, 0]])
+        """
+        weighted_majority = self.matrix_weighted_majority_
+        scaled = weighted_majority._scaled_array_
+        if scaled is None and get_numeric_policy() == 'exact' and isinstance(weighted_majority, MatrixWeightedMajority):
+            scaled = weighted_majority._exact_scaled_array()
+        weighted = weighted_majority.as_array_ if scaled is None else scaled[0]
+        transposed = weighted.T
+        codes = np.where(weighted > transposed, 0, np.where(weighted < transposed, 1, 2))
+        np.fill_diagonal(codes, 3)
+        values = [apply_numeric_policy(value) for value in [self.greater, self.lower, self.equal, self.diagonal]]
+        # Only the values that are used determine the dtype of the array (e.g. integers if there is no tie).
+        used = np.unique(codes).tolist()
+        return _array_of_policy([[values[k] for k in used]])[0][np.searchsorted(used, codes)]
+
     @cached_property
     def as_dict_(self):
-        def convert(x, y):
-            if x == y:
-                return self.equal
-            return self.greater if x > y else self.lower
-        weighted_as_dict = self.matrix_weighted_majority_.as_dict_
-        return NiceDict({
-            (c, d): self.diagonal if c == d else convert(weighted_as_dict[(c, d)], weighted_as_dict[(d, c)])
-            for (c, d) in weighted_as_dict.keys()
-        })
+        return NiceDict({(c, d): v for c, row in zip(self.candidates_as_list_, self.as_array_.tolist())
+                         for d, v in zip(self.candidates_as_list_, row)})
+
+    def _batch_values(self, batch: ProfileBatch) -> Union[tuple, None]:
+        """
+        Majority matrices of all the elections of a batch.
+
+        Parameters
+        ----------
+        batch : ProfileBatch
+            A batch stored as an array (cf. :attr:`ProfileBatch.ranks`).
+
+        Returns
+        -------
+        tuple or None
+            A pair (`values`, `scale`), where `values` is an array of integers of shape
+            `(n_elections, n_candidates, n_candidates)` and `scale` is an integer: for each election, the matrix
+            :attr:`as_array_` is ``values / scale``. Return None if it is not possible to compute it with vectorized
+            operations (cf. :meth:`MatrixWeightedMajority._batch_comparable_values`).
+
+        Examples
+        --------
+            >>> from whalrus.profiles.profile_batch import ProfileBatch
+            >>> batch = ProfileBatch([['a > b > c', 'b > a > c'], ['c > a ~ b']])
+            >>> MatrixMajority()._batch_values(batch)
+            (array([[[1, 1, 2],
+                    [1, 1, 2],
+                    [0, 0, 1]],
+            <BLANKLINE>
+                   [[1, 1, 0],
+                    [1, 1, 0],
+                    [2, 2, 1]]]), 2)
+        """
+        parameters = [self.greater, self.lower, self.equal, self.diagonal]
+        if (type(self.converter) is not ConverterBallotToOrder
+                or type(self.matrix_weighted_majority) is not MatrixWeightedMajority
+                or any(isinstance(value, float) for value in parameters)):
+            return None
+        weighted = self.matrix_weighted_majority._batch_comparable_values(batch)
+        if weighted is None:
+            return None
+        scale = _lcm([Fraction(value).denominator for value in parameters])
+        greater, lower, equal, diagonal = [int(value * scale) for value in parameters]
+        transposed = np.swapaxes(weighted, 1, 2)
+        values = np.where(weighted > transposed, greater, np.where(weighted < transposed, lower, equal))
+        values[:, np.eye(batch.n_candidates, dtype=bool)] = diagonal
+        return values, scale
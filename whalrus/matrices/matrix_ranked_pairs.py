@@ -73,6 +73,8 @@ class MatrixRankedPairs(Matrix):
         [('a', 'c'), ('a', 'b'), ('b', 'c')]
     """
 
+    _incremental_sub_objects = ('matrix_weighted_majority_',)
+
     def __init__(self, *args, converter: ConverterBallot = None, matrix_weighted_majority: Matrix = None,
                  tie_break: Priority = Priority.UNAMBIGUOUS, **kwargs):
         if converter is None:
@@ -88,7 +90,7 @@ class MatrixRankedPairs(Matrix):
         """Matrix: The weighted majority matrix (upon which the computation of the Ranked Pairs matrix is based), once
         computed with the given profile).
         """
-        return self.matrix_weighted_majority(self.profile_converted_)
+        return self._call_sub_object(self.matrix_weighted_majority)
 
     @cached_property
     def candidates_as_list_(self) -> list:
@@ -103,28 +105,34 @@ class MatrixRankedPairs(Matrix):
         """list: The order in which edges should be added (if possible). It is a list of pairs of candidates.
         E.g. ``[('b', 'c'), ('c', 'a'), ('a', 'b')]``, where ('b', 'c') is the first edge to add.
         """
-        m = self.matrix_weighted_majority_
-        return list(chain(*[
-            self.tie_break.sort_pairs_rp({
-                (c, d) for (c, d), v in m.as_dict_.items()
-                if v == value and c != d and m.as_dict_[(c, d)] >= m.as_dict_[(d, c)]
-            })
-            for value in sorted(set(m.as_dict_.values()), reverse=True)
-        ]))
+        weights = self.matrix_weighted_majority_.as_dict_
+        edges_by_value = dict()
+        for (c, d), v in weights.items():
+            if c != d and v >= weights[(d, c)]:
+                edges_by_value.setdefault(v, set()).add((c, d))
+        return list(chain(*[self.tie_break.sort_pairs_rp(edges_by_value[value])
+                            for value in sorted(edges_by_value, reverse=True)]))
 
     @cached_property
     def as_array_(self):
         n = len(self.candidates_)
-        rp = np.zeros((n, n), dtype=object)
-        for (c, d) in self.edges_order_:
-            i = self.matrix_weighted_majority_.candidates_indexes_[c]
-            j = self.matrix_weighted_majority_.candidates_indexes_[d]
-            if rp[j, i] > 0:
-                continue
-            rp[i, j] = 1
-            rp[i, :] = np.maximum(rp[i, :], rp[j, :])
-            rp[:, j] = np.maximum(rp[:, i], rp[:, j])
-        return rp
+        indexes = self.matrix_weighted_majority_.candidates_indexes_
+        edges = np.array([(indexes[c], indexes[d]) for (c, d) in self.edges_order_], dtype=np.int64).reshape(-1, 2)
+        # reach[i, j] is True iff there is a path from i to j in the graph of locked edges (transitive closure).
+        reach = np.zeros((n, n), dtype=bool)
+        for start in range(0, len(edges), max(n, 1)):
+            # Discard at once the edges that are already decided: they would create a cycle, or are already implied.
+            block = edges[start:start + max(n, 1)]
+            block = block[~(reach[block[:, 0], block[:, 1]] | reach[block[:, 1], block[:, 0]])]
+            for i, j in block.tolist():
+                if reach[j, i] or reach[i, j]:
+                    continue
+                ancestors = reach[:, i].copy()
+                ancestors[i] = True
+                descendants = reach[j, :].copy()
+                descendants[j] = True
+                reach[ancestors] |= descendants
+        return reach.astype(int).astype(object)
 
     @cached_property
     def as_dict_(self):
@@ -19,13 +19,58 @@ You should have received a copy of the GNU General Public License
 along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
 """
 from whalrus.utils.utils import cached_property, NiceDict
+from whalrus.profiles.profile_batch import ProfileBatch
 from whalrus.converters_ballot.converter_ballot_to_order import ConverterBallotToOrder
 from whalrus.converters_ballot.converter_ballot import ConverterBallot
 from whalrus.matrices.matrix import Matrix
 from whalrus.matrices.matrix_weighted_majority import MatrixWeightedMajority
+from typing import Union
 import numpy as np
 
 
+def _widest_paths(weights: np.ndarray) -> np.ndarray:
+    """
+    Width of the widest paths in a graph (Floyd-Warshall algorithm).
+
+    Parameters
+    ----------
+    weights : np.ndarray
+        A square matrix. The non-diagonal coefficients are the weights of the edges. The diagonal is not used. It can
+        also be an array of shape `(..., n, n)`, i.e. a stack of square matrices: in that case, each matrix is
+        processed independently.
+
+    Returns
+    -------
+    np.ndarray
+        The matrix of the widths of the widest paths, where the width of a path is the minimum weight of its edges. The
+        diagonal is unchanged.
+
+    Examples
+    --------
+        >>> from fractions import Fraction
+        >>> _widest_paths(np.array([[0, Fraction(1, 3), 0], [0, 0, 1], [Fraction(1, 2), 0, 0]], dtype=object))
+        array([[0, Fraction(1, 3), Fraction(1, 3)],
+               [Fraction(1, 2), 0, 1],
+               [Fraction(1, 2), Fraction(1, 3), 0]], dtype=object)
+    """
+    n = weights.shape[-1]
+    if weights.dtype == object:
+        # Exact path: since only comparisons are used, work on the ranks of the values, then convert back.
+        values = sorted(set(weights.flat))
+        code = {v: k for k, v in enumerate(values)}
+        codes = np.array([code[v] for v in weights.flat], dtype=np.int64).reshape(weights.shape)
+        lookup = np.empty(len(values), dtype=object)
+        lookup[:] = values
+        return lookup[_widest_paths(codes)]
+    widest_path = weights.copy()
+    for i in range(n):
+        np.maximum(widest_path, np.minimum(widest_path[..., :, i, np.newaxis], widest_path[..., np.newaxis, i, :]),
+                   out=widest_path)
+    diagonal = np.arange(n)
+    widest_path[..., diagonal, diagonal] = weights[..., diagonal, diagonal]
+    return widest_path
+
+
 class MatrixSchulze(Matrix):
     """
     The Schulze matrix.
@@ -54,6 +99,8 @@ class MatrixSchulze(Matrix):
                [Fraction(5, 9), Fraction(5, 9), 0]], dtype=object)
     """
 
+    _incremental_sub_objects = ('matrix_weighted_majority_',)
+
     def __init__(self, *args, converter: ConverterBallot = None, matrix_weighted_majority: Matrix = None, **kwargs):
         if converter is None:
             converter = ConverterBallotToOrder()
@@ -67,7 +114,7 @@ class MatrixSchulze(Matrix):
         """Matrix: The weighted majority matrix (upon which the computation of the Schulze is based), once computed
         with the given profile.
         """
-        return self.matrix_weighted_majority(self.profile_converted_)
+        return self._call_sub_object(self.matrix_weighted_majority)
 
     @cached_property
     def candidates_as_list_(self) -> list:
@@ -79,19 +126,42 @@ class MatrixSchulze(Matrix):
 
     @cached_property
     def as_array_(self):
-        widest_path = np.copy(self.matrix_weighted_majority_.as_array_)
-        n = len(self.candidates_)
-        for i in range(n):
-            for j in range(n):
-                if i == j:
-                    continue
-                for k in range(n):
-                    if k == i or k == j:
-                        continue
-                    widest_path[j, k] = max(widest_path[j, k], min(widest_path[j, i], widest_path[i, k]))
-        return widest_path
+        return _widest_paths(self.matrix_weighted_majority_.as_array_)
 
     @cached_property
     def as_dict_(self):
         return NiceDict({(c, d): self.as_array_[self.candidates_indexes_[c], self.candidates_indexes_[d]]
                          for c in self.candidates_ for d in self.candidates_})
+
+    def _batch_comparable_values(self, batch: ProfileBatch) -> Union[np.ndarray, None]:
+        """
+        Schulze matrices of all the elections of a batch, up to a positive factor in each election.
+
+        Parameters
+        ----------
+        batch : ProfileBatch
+            A batch stored as an array (cf. :attr:`ProfileBatch.ranks`).
+
+        Returns
+        -------
+        np.ndarray or None
+            Cf. :meth:`MatrixWeightedMajority._batch_comparable_values`. The widest paths of all the elections are
+            computed at once.
+
+        Examples
+        --------
+            >>> from whalrus.profiles.profile import Profile
+            >>> from whalrus.profiles.profile_batch import ProfileBatch
+            >>> batch = ProfileBatch([Profile(['a > b > c', 'b > c > a', 'c > a > b'], weights=[4, 3, 2])])
+            >>> MatrixSchulze()._batch_comparable_values(batch)
+            array([[[ 0, 12, 12],
+                    [10,  0, 14],
+                    [10, 10,  0]]])
+        """
+        if (type(self.converter) is not ConverterBallotToOrder
+                or type(self.matrix_weighted_majority) is not MatrixWeightedMajority):
+            return None
+        weighted = self.matrix_weighted_majority._batch_comparable_values(batch)
+        if weighted is None:
+            return None
+        return _widest_paths(weighted)
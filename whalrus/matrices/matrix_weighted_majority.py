@@ -18,15 +18,28 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
 """
-from whalrus.utils.utils import cached_property, NiceDict, convert_number, my_division
+import numpy as np
+from functools import reduce
+from math import gcd
+from whalrus.utils.utils import cached_property, NiceDict, convert_number, my_division, apply_numeric_policy, \
+    apply_numeric_policy_to_total, get_numeric_policy
+from whalrus.profiles.profile_array import ProfileArray
+from whalrus.profiles.profile_batch import ProfileBatch
+from whalrus.ballots.ballot_order import BallotOrder
 from whalrus.converters_ballot.converter_ballot_to_order import ConverterBallotToOrder
 from whalrus.converters_ballot.converter_ballot import ConverterBallot
 from typing import Union
-from whalrus.matrices.matrix import Matrix
+from whalrus.matrices.matrix import Matrix, _scaled_to_array
+from whalrus.tallies.tally_matrix import TallyMatrix
 from numbers import Number
 from fractions import Fraction
 
 
+def _lcm(numbers: list) -> int:
+    """Least common multiple of a list of positive integers (1 for an empty list)."""
+    return reduce(lambda x, y: x * y // gcd(x, y), numbers, 1)
+
+
 class MatrixWeightedMajority(Matrix):
     """
     The weighted majority matrix.
@@ -164,77 +177,316 @@ class MatrixWeightedMajority(Matrix):
 
     @cached_property
     def _gross_and_weights_(self):
+        if not self._can_vectorize():
+            return self._gross_and_weights_iterative()
+        return self._gross_and_weights_vectorized()
+
+    def _can_vectorize(self) -> bool:
+        """Whether the gross matrix and the matrix of weights can be computed with numpy (cf.
+        :attr:`_gross_and_weights_arrays_`), i.e. if the weights are integers, fractions or floats."""
+        weights = self._profile_array_.weights_as_array
+        return weights.dtype != object or all(isinstance(w, (int, Fraction)) for w in weights)
+
+    @cached_property
+    def _profile_array_(self) -> ProfileArray:
+        if isinstance(self.profile_converted_, ProfileArray):
+            return self.profile_converted_
+        return ProfileArray(self.profile_converted_, candidates=self.candidates_as_list_)
+
+    def _scoring_parameters(self) -> list:
+        """List of pairs (name of the count, value of the scoring parameter), for the parameters that are not None.
+        The names refer to the counts computed in :meth:`_gross_and_weights_vectorized`."""
+        return [(name, value) for name, value in [
+            ('higher_vs_lower', self.higher_vs_lower), ('lower_vs_higher', self.lower_vs_higher),
+            ('indifference', self.indifference),
+            ('ordered_vs_unordered', self.ordered_vs_unordered), ('unordered_vs_ordered', self.unordered_vs_ordered),
+            ('unordered_vs_unordered', self.unordered_vs_unordered),
+            ('ordered_vs_absent', self.ordered_vs_absent), ('absent_vs_ordered', self.absent_vs_ordered),
+            ('unordered_vs_absent', self.unordered_vs_absent), ('absent_vs_unordered', self.absent_vs_unordered),
+            ('absent_vs_absent', self.absent_vs_absent)
+        ] if value is not None]
+
+    @cached_property
+    def _gross_and_weights_arrays_(self) -> tuple:
+        """tuple: The gross matrix and the matrix of weights computed with numpy, as a tuple (`gross`, `weights`,
+        `gross_scale`, `weights_scale`): the actual gross matrix is ``gross / (gross_scale * weights_scale)`` and the
+        actual matrix of weights is ``weights / weights_scale``.
+
+        The profile is represented as an array of ranks, hence each candidate is "ordered", "unordered" or "absent" in
+        each ballot. For each scoring parameter, we compute the (weighted) number of ballots where the corresponding
+        situation occurs for each pair of candidates. Weights and scoring parameters are scaled to integers, so that
+        the computation is exact (unless weights or scoring parameters are floats, or the numeric policy is
+        ``'float'``).
+        """
+        profile = self._profile_array_
+        ranks = profile.ranks_over(self.candidates_as_list_).astype(np.int32)
+        n_candidates = ranks.shape[1]
+        parameters = self._scoring_parameters()
+        # Scale weights and scoring parameters to integers (unless weights are floats)
+        weights = profile.weights_as_array
+        weights_scale, gross_scale = 1, 1
+        policy = get_numeric_policy()
+        if (weights.dtype.kind == 'f' or policy == 'float'
+                or (policy == 'integer' and any(isinstance(value, float) for _, value in parameters))):
+            weights = weights.astype(float)
+            parameters = [(name, float(value)) for name, value in parameters]
+        else:
+            if weights.dtype == object:
+                weights_scale = _lcm([Fraction(w).denominator for w in weights])
+                weights = np.array([int(w * weights_scale) for w in weights], dtype=object)
+            gross_scale = _lcm([Fraction(value).denominator for _, value in parameters])
+            parameters = [(name, int(value * gross_scale)) for name, value in parameters]
+            bound = (sum(abs(int(w)) for w in weights) if weights.dtype == object
+                     else float(np.abs(weights.astype(float)).sum()))
+            bound *= 1 + sum(abs(value) for _, value in parameters)
+            weights = weights.astype(np.int64 if bound < 2 ** 62 else object)
+        # Categories of each candidate in each ballot
+        ordered = ranks >= 0
+        unordered = ranks == ProfileArray.UNORDERED
+        absent = ranks == ProfileArray.ABSENT
+
+        def count(x, y):
+            return (x * weights[:, np.newaxis]).T.dot(y.astype(weights.dtype))
+
+        def without_diagonal(x):
+            np.fill_diagonal(x, 0)
+            return x
+
+        # Ordered vs ordered: compare the ranks, by chunks of ballots to save memory.
+        higher_vs_lower = np.zeros((n_candidates, n_candidates), dtype=weights.dtype)
+        chunk = max(1, 2 ** 22 // max(1, n_candidates ** 2))
+        for start in range(0, ranks.shape[0], chunk):
+            r = ranks[start:start + chunk]
+            o = ordered[start:start + chunk]
+            higher = (r[:, :, np.newaxis] < r[:, np.newaxis, :]) & o[:, :, np.newaxis] & o[:, np.newaxis, :]
+            higher_vs_lower += np.tensordot(weights[start:start + chunk], higher.astype(weights.dtype), axes=(0, 0))
+        counts = {
+            'higher_vs_lower': higher_vs_lower,
+            'lower_vs_higher': higher_vs_lower.T,
+            'indifference': without_diagonal(count(ordered, ordered) - higher_vs_lower - higher_vs_lower.T),
+            'unordered_vs_unordered': without_diagonal(count(unordered, unordered)),
+            'absent_vs_absent': without_diagonal(count(absent, absent))
+        }
+        for x, y, name_x, name_y in [(ordered, unordered, 'ordered', 'unordered'),
+                                     (ordered, absent, 'ordered', 'absent'),
+                                     (unordered, absent, 'unordered', 'absent')]:
+            counts[name_x + '_vs_' + name_y] = count(x, y)
+            counts[name_y + '_vs_' + name_x] = counts[name_x + '_vs_' + name_y].T
+        # Combine the counts with the scoring parameters
+        gross = np.zeros((n_candidates, n_candidates), dtype=weights.dtype)
+        total_weights = np.zeros((n_candidates, n_candidates), dtype=weights.dtype)
+        for name, value in parameters:
+            gross += value * counts[name]
+            total_weights += counts[name]
+        return gross, total_weights, gross_scale, weights_scale
+
+    def _gross_and_weights_vectorized(self) -> dict:
+        """Compute the gross matrix and the matrix of weights with numpy (cf. :attr:`_gross_and_weights_arrays_`).
+        """
+        gross, total_weights, gross_scale, weights_scale = self._gross_and_weights_arrays_
+
+        def to_number(x, scale):
+            if scale == 1:
+                return apply_numeric_policy_to_total(x) if get_numeric_policy() != 'exact' else x
+            return apply_numeric_policy_to_total(Fraction(x, scale))
+
+        gross_as_list = gross.tolist()
+        weights_as_list = total_weights.tolist()
+        return {
+            'gross': NiceDict({(c, d): to_number(gross_as_list[i][j], gross_scale * weights_scale)
+                               for i, c in enumerate(self.candidates_as_list_)
+                               for j, d in enumerate(self.candidates_as_list_)}),
+            'weights': NiceDict({(c, d): to_number(weights_as_list[i][j], weights_scale)
+                                 for i, c in enumerate(self.candidates_as_list_)
+                                 for j, d in enumerate(self.candidates_as_list_)})
+        }
+
+    def _gross_and_weights_iterative(self) -> dict:
+        """Compute the gross matrix and the matrix of weights, ballot by ballot (used when weights are not integers,
+        fractions or floats)."""
         gross = NiceDict({(c, d): 0 for c in self.candidates_ for d in self.candidates_})
         weights = NiceDict({(c, d): 0 for c in self.candidates_ for d in self.candidates_})
         for ballot, weight, _ in self.profile_converted_.items():
-            absent = self.candidates_ - ballot.candidates
-            for i_class, indifference_class in enumerate(ballot.as_weak_order):
-                indifference_class_as_list = list(indifference_class)
-                for i, c in enumerate(indifference_class_as_list):
-                    # Deal with other candidates of the indifference class
-                    if self.indifference is not None:
-                        for d in indifference_class_as_list[i + 1:]:
-                            gross[(c, d)] += weight * self.indifference
-                            gross[(d, c)] += weight * self.indifference
-                            weights[(c, d)] += weight
-                            weights[(d, c)] += weight
-                    # Deal with ordered candidates with lower ranks
-                    if self.higher_vs_lower is not None or self.lower_vs_higher is not None:
-                        for lower_indifference_class in ballot.as_weak_order[i_class + 1:]:
-                            for d in lower_indifference_class:
-                                if self.higher_vs_lower is not None:
-                                    gross[(c, d)] += weight * self.higher_vs_lower
-                                    weights[(c, d)] += weight
-                                if self.lower_vs_higher is not None:
-                                    gross[(d, c)] += weight * self.lower_vs_higher
-                                    weights[(d, c)] += weight
-                    # Deal with unordered candidates
-                    if self.ordered_vs_unordered is not None or self.unordered_vs_ordered is not None:
-                        for d in ballot.candidates_not_in_b:
-                            if self.ordered_vs_unordered is not None:
-                                gross[(c, d)] += weight * self.ordered_vs_unordered
-                                weights[(c, d)] += weight
-                            if self.unordered_vs_ordered is not None:
-                                gross[(d, c)] += weight * self.unordered_vs_ordered
-                                weights[(d, c)] += weight
-                    # Deal with absent candidates
-                    if self.ordered_vs_absent is not None or self.absent_vs_ordered is not None:
-                        for d in absent:
-                            if self.ordered_vs_absent is not None:
-                                gross[(c, d)] += weight * self.ordered_vs_absent
+            self._add_ballot_to(gross, weights, ballot, weight)
+        return {'gross': gross, 'weights': weights}
+
+    def _add_ballot_to(self, gross: dict, weights: dict, ballot: BallotOrder, weight: Number) -> None:
+        """Add the contribution of a ballot to the gross matrix and the matrix of weights (in place). With a negative
+        weight, this removes the contribution of the ballot."""
+        absent = self.candidates_ - ballot.candidates
+        for i_class, indifference_class in enumerate(ballot.as_weak_order):
+            indifference_class_as_list = list(indifference_class)
+            for i, c in enumerate(indifference_class_as_list):
+                # Deal with other candidates of the indifference class
+                if self.indifference is not None:
+                    for d in indifference_class_as_list[i + 1:]:
+                        gross[(c, d)] += weight * self.indifference
+                        gross[(d, c)] += weight * self.indifference
+                        weights[(c, d)] += weight
+                        weights[(d, c)] += weight
+                # Deal with ordered candidates with lower ranks
+                if self.higher_vs_lower is not None or self.lower_vs_higher is not None:
+                    for lower_indifference_class in ballot.as_weak_order[i_class + 1:]:
+                        for d in lower_indifference_class:
+                            if self.higher_vs_lower is not None:
+                                gross[(c, d)] += weight * self.higher_vs_lower
                                 weights[(c, d)] += weight
-                            if self.absent_vs_ordered is not None:
-                                gross[(d, c)] += weight * self.absent_vs_ordered
+                            if self.lower_vs_higher is not None:
+                                gross[(d, c)] += weight * self.lower_vs_higher
                                 weights[(d, c)] += weight
-            if (self.unordered_vs_unordered is not None
-                    or self.unordered_vs_absent is not None
-                    or self.absent_vs_unordered is not None):
-                unordered_as_list = list(ballot.candidates_not_in_b)
-                for i, c in enumerate(unordered_as_list):
-                    # Deal with other unordered candidates
-                    if self.unordered_vs_unordered is not None:
-                        for d in unordered_as_list[i + 1:]:
-                            gross[(c, d)] += weight * self.unordered_vs_unordered
-                            gross[(d, c)] += weight * self.unordered_vs_unordered
+                # Deal with unordered candidates
+                if self.ordered_vs_unordered is not None or self.unordered_vs_ordered is not None:
+                    for d in ballot.candidates_not_in_b:
+                        if self.ordered_vs_unordered is not None:
+                            gross[(c, d)] += weight * self.ordered_vs_unordered
                             weights[(c, d)] += weight
+                        if self.unordered_vs_ordered is not None:
+                            gross[(d, c)] += weight * self.unordered_vs_ordered
                             weights[(d, c)] += weight
-                    # Deal with absent candidates
+                # Deal with absent candidates
+                if self.ordered_vs_absent is not None or self.absent_vs_ordered is not None:
                     for d in absent:
-                        if self.unordered_vs_absent is not None:
-                            gross[(c, d)] += weight * self.unordered_vs_absent
+                        if self.ordered_vs_absent is not None:
+                            gross[(c, d)] += weight * self.ordered_vs_absent
                             weights[(c, d)] += weight
-                        if self.absent_vs_unordered is not None:
-                            gross[(d, c)] += weight * self.absent_vs_unordered
+                        if self.absent_vs_ordered is not None:
+                            gross[(d, c)] += weight * self.absent_vs_ordered
                             weights[(d, c)] += weight
-            if self.absent_vs_absent is not None:
-                absent_as_list = list(absent)
-                for i, c in enumerate(absent_as_list):
-                    for d in absent_as_list[i + 1:]:
-                        gross[(c, d)] += weight * self.absent_vs_absent
-                        gross[(d, c)] += weight * self.absent_vs_absent
+        if (self.unordered_vs_unordered is not None
+                or self.unordered_vs_absent is not None
+                or self.absent_vs_unordered is not None):
+            unordered_as_list = list(ballot.candidates_not_in_b)
+            for i, c in enumerate(unordered_as_list):
+                # Deal with other unordered candidates
+                if self.unordered_vs_unordered is not None:
+                    for d in unordered_as_list[i + 1:]:
+                        gross[(c, d)] += weight * self.unordered_vs_unordered
+                        gross[(d, c)] += weight * self.unordered_vs_unordered
                         weights[(c, d)] += weight
                         weights[(d, c)] += weight
-        return {'gross': gross, 'weights': weights}
+                # Deal with absent candidates
+                for d in absent:
+                    if self.unordered_vs_absent is not None:
+                        gross[(c, d)] += weight * self.unordered_vs_absent
+                        weights[(c, d)] += weight
+                    if self.absent_vs_unordered is not None:
+                        gross[(d, c)] += weight * self.absent_vs_unordered
+                        weights[(d, c)] += weight
+        if self.absent_vs_absent is not None:
+            absent_as_list = list(absent)
+            for i, c in enumerate(absent_as_list):
+                for d in absent_as_list[i + 1:]:
+                    gross[(c, d)] += weight * self.absent_vs_absent
+                    gross[(d, c)] += weight * self.absent_vs_absent
+                    weights[(c, d)] += weight
+                    weights[(d, c)] += weight
+
+    def _batch_comparable_values(self, batch: ProfileBatch) -> Union[np.ndarray, None]:
+        """
+        Weighted majority matrices of all the elections of a batch, up to a positive factor in each election.
+
+        Parameters
+        ----------
+        batch : ProfileBatch
+            A batch stored as an array (cf. :attr:`ProfileBatch.ranks`).
+
+        Returns
+        -------
+        np.ndarray or None
+            An array of integers of shape `(n_elections, n_candidates, n_candidates)`. For each election, the
+            non-diagonal coefficients are those of :attr:`as_array_`, multiplied by the same positive number. Hence
+            they can be compared with each other, but not with the coefficients of another election. The diagonal
+            coefficients are 0. Return None if it is not possible, e.g. if the denominators of the coefficients are not
+            the same (which may happen when some scoring parameters are None), or if a scoring parameter is a float.
+
+        Examples
+        --------
+            >>> from whalrus.profiles.profile_batch import ProfileBatch
+            >>> batch = ProfileBatch([['a > b > c', 'b > a > c'], ['c > a ~ b']])
+            >>> MatrixWeightedMajority()._batch_comparable_values(batch)
+            array([[[0, 2, 4],
+                    [2, 0, 4],
+                    [0, 0, 0]],
+            <BLANKLINE>
+                   [[0, 1, 0],
+                    [1, 0, 0],
+                    [2, 2, 0]]])
+        """
+        parameters = self._scoring_parameters() + [('default_score', self.default_score)]
+        if type(self.converter) is not ConverterBallotToOrder or any(isinstance(v, float) for _, v in parameters):
+            return None
+        gross_scale = _lcm([Fraction(value).denominator for _, value in parameters])
+        parameters = [(name, int(value * gross_scale)) for name, value in parameters[:-1]]
+        if np.abs(batch.weights).sum() * (1 + sum(abs(value) for _, value in parameters)) >= 2 ** 62:
+            return None
+        n_candidates = batch.n_candidates
+
+        def gross_and_weights(rows):
+            r = batch.ranks[rows].astype(np.int32)
+            categories = {'ordered': r >= 0, 'unordered': r == ProfileArray.UNORDERED,
+                          'absent': r == ProfileArray.ABSENT}
+            both_ordered = categories['ordered'][:, :, np.newaxis] & categories['ordered'][:, np.newaxis, :]
+            situations = {
+                'higher_vs_lower': both_ordered & (r[:, :, np.newaxis] < r[:, np.newaxis, :]),
+                'lower_vs_higher': both_ordered & (r[:, :, np.newaxis] > r[:, np.newaxis, :]),
+                'indifference': both_ordered & (r[:, :, np.newaxis] == r[:, np.newaxis, :])
+            }
+            result = np.zeros((r.shape[0], 2, n_candidates, n_candidates), dtype=np.int64)
+            for name, value in parameters:
+                try:
+                    situation = situations[name]
+                except KeyError:
+                    name_x, name_y = name.split('_vs_')
+                    situation = categories[name_x][:, :, np.newaxis] & categories[name_y][:, np.newaxis, :]
+                result[:, 0] += value * situation
+                result[:, 1] += situation
+            return result
+
+        gross, weights = np.moveaxis(batch.weighted_sums(gross_and_weights, shape=(2, n_candidates, n_candidates)),
+                                     1, 0)
+        off_diagonal = ~np.eye(n_candidates, dtype=bool)
+        weights = weights[:, off_diagonal]
+        if weights.size and not np.all(weights == weights[:, :1]):
+            return None
+        if self.antisymmetric:
+            gross = gross - np.swapaxes(gross, 1, 2)
+        gross[:, ~off_diagonal] = 0
+        if weights.size:
+            # When the total weight is 0, all coefficients are equal to the default score. When it is negative, the
+            # order of the coefficients is reversed.
+            gross[weights[:, 0] == 0] = 0
+            gross[weights[:, 0] < 0] *= -1
+        return gross
+
+    def _update_ballot(self, i: int, ballot_removed: BallotOrder, ballot_added: BallotOrder, weight: Number,
+                       voter: object) -> None:
+        # Update the gross matrix and the matrix of weights in O(n_candidates ** 2).
+        try:
+            gross_and_weights = self._cached_properties['_gross_and_weights_']
+        except KeyError:
+            # Nothing has been computed yet.
+            self.delete_cache()
+            return
+        gross = NiceDict(gross_and_weights['gross'])
+        weights = NiceDict(gross_and_weights['weights'])
+        if ballot_removed is not None:
+            self._add_ballot_to(gross, weights, ballot_removed, -weight)
+        if ballot_added is not None:
+            self._add_ballot_to(gross, weights, ballot_added, weight)
+        self.delete_cache()
+        self._cached_properties['_gross_and_weights_'] = {'gross': gross, 'weights': weights}
+
+    @cached_property
+    def tally_(self) -> TallyMatrix:
+        """TallyMatrix: The tally of the election, made of :attr:`gross_` and :attr:`weights_`. Cf. :meth:`load_tally`.
+        """
+        return TallyMatrix(gross=self.gross_, weights=self.weights_)
+
+    def _load_tally(self, tally: TallyMatrix) -> None:
+        pairs = [(c, d) for c in self.candidates_ for d in self.candidates_]
+        self._cached_properties['_gross_and_weights_'] = {
+            'gross': NiceDict({pair: tally.gross.get(pair, 0) for pair in pairs}),
+            'weights': NiceDict({pair: tally.weights.get(pair, 0) for pair in pairs})}
 
     @cached_property
     def gross_(self):
@@ -273,11 +525,118 @@ class MatrixWeightedMajority(Matrix):
 
     @cached_property
     def as_dict_(self):
+        if self._uses_native_array() or self._scaled_array_ is not None:
+            return NiceDict({(c, d): v for c, row in zip(self.candidates_as_list_, self.as_array_.tolist())
+                             for d, v in zip(self.candidates_as_list_, row)})
+        diagonal_score = apply_numeric_policy(self.diagonal_score)
+        default_score = apply_numeric_policy(self.default_score)
         net_matrix = {
-            (c, d): self.diagonal_score if c == d else my_division(
-                self.gross_[(c, d)], w, divide_by_zero=self.default_score)
+            (c, d): diagonal_score if c == d else my_division(
+                self.gross_[(c, d)], w, divide_by_zero=default_score)
             for (c, d), w in self.weights_.items()}
         if self.antisymmetric:
             return {(c, d): net_matrix[(c, d)] - net_matrix[(d, c)] for (c, d) in net_matrix.keys()}
         else:
             return net_matrix
+
+    def _uses_native_array(self) -> bool:
+        """Whether :attr:`as_array_` is computed directly from :attr:`_gross_and_weights_arrays_`, with native
+        NumPy types. It requires a numeric policy other than ``'exact'``, and that the gross matrix and the matrix
+        of weights are not already computed (e.g. by an incremental update or by :meth:`load_tally`)."""
+        return (get_numeric_policy() != 'exact' and '_gross_and_weights_' not in self._cached_properties
+                and self._can_vectorize())
+
+    @cached_property
+    def _scaled_array_(self) -> Union[tuple, None]:
+        """tuple or None: Cf. :attr:`Matrix._scaled_array_`. With the numeric policy ``'integer'``, each coefficient is
+        the exact quotient of the gross matrix by the matrix of weights, and they are put over a common denominator.
+        None if the weights or the scoring parameters are floats."""
+        if get_numeric_policy() != 'integer':
+            return None
+        return self._exact_scaled_array()
+
+    def _exact_scaled_array(self) -> Union[tuple, None]:
+        """The matrix as a pair (`numerators`, `denominator`), as in :attr:`_scaled_array_`, but whatever the numeric
+        policy (this is used by :class:`MatrixMajority` to compare the coefficients exactly). None if the weights or
+        the scoring parameters are floats."""
+        n = len(self.candidates_as_list_)
+        counted = ~np.eye(n, dtype=bool)
+        if '_gross_and_weights_' not in self._cached_properties and self._can_vectorize():
+            # The quotient is gross / (weights * gross_scale), where both arrays are integers.
+            gross, weights, gross_scale, _ = self._gross_and_weights_arrays_
+            if gross.dtype.kind == 'f':
+                return None
+            counted &= weights != 0
+            values, inverse = np.unique(weights[counted], return_inverse=True)
+            denominators = [int(w) * gross_scale for w in values.tolist()]
+            gross_counted = gross[counted]
+        else:
+            # The gross matrix and the matrix of weights are exact in this policy (unless weights are floats).
+            quotients = []
+            for i, c in enumerate(self.candidates_as_list_):
+                for j, d in enumerate(self.candidates_as_list_):
+                    if counted[i, j]:
+                        g, w = self.gross_[(c, d)], self.weights_[(c, d)]
+                        if isinstance(g, float) or isinstance(w, float):
+                            return None
+                        if w == 0:
+                            counted[i, j] = False
+                        else:
+                            quotients.append(Fraction(g) / Fraction(w))
+            denominators = [q.denominator for q in quotients]
+            inverse = np.arange(len(quotients))
+            gross_counted = np.array([q.numerator for q in quotients], dtype=object)
+        special = [Fraction(self.default_score), Fraction(self.diagonal_score)]
+        denominator = _lcm(set(denominators) | {value.denominator for value in special})
+        factors = np.array([denominator // d for d in denominators], dtype=object)[inverse.reshape(-1)]
+        bound = (max([abs(int(x)) for x in (gross_counted.min(initial=0), gross_counted.max(initial=0))])
+                 * max(factors.tolist(), default=0) * 2)
+        dtype = np.int64 if bound < 2 ** 62 and abs(special[0] * denominator) < 2 ** 61 else object
+        numerators = np.full((n, n), int(special[0] * denominator), dtype=dtype)
+        numerators[counted] = gross_counted.astype(dtype) * factors.astype(dtype)
+        np.fill_diagonal(numerators, int(special[1] * denominator))
+        if self.antisymmetric:
+            numerators = numerators - numerators.T
+        return numerators, denominator
+
+    @cached_property
+    def as_array_(self) -> np.ndarray:
+        """Array : The matrix, as a numpy array. Each row and each column corresponds to a candidate (in the order of
+        :attr:`candidates_as_list_`).
+
+        Examples
+        --------
+        With the numeric policies ``'integer'`` and ``'float'``, the array is computed directly with native NumPy
+        types:
+
+            >>> MatrixWeightedMajority(['a > b', 'a ~ b'], weights=[2, 1], numeric_policy='integer').as_array_
+            array([[0.        , 0.83333333],
+                   [0.16666667, 0.        ]])
+
+        With the policy ``'integer'``, the coefficients are computed exactly, then converted to floats, and the sums
+        of coefficients are computed exactly too (cf. :attr:`row_sums_`). Hence the values that are equal with the
+        policy ``'exact'`` are also equal with this policy, unlike with the policy ``'float'``:
+
+            >>> ballots = ['c > b > a > d', 'b > d > c > a', 'a > c > b > d', 'd > b > c > a', 'b > a > d > c',
+            ...            'b > c > a > d', 'd > a > c > b', 'b > a > d > c']
+            >>> weights = [2, 1, 3, 1, 2, 2, 2, 2]
+            >>> MatrixWeightedMajority(ballots, weights=weights, antisymmetric=True, numeric_policy='exact').row_sums_
+            {'a': Fraction(1, 3), 'b': 1, 'c': Fraction(-1, 3), 'd': -1}
+            >>> MatrixWeightedMajority(ballots, weights=weights, antisymmetric=True, numeric_policy='integer').row_sums_
+            {'a': 0.3333333333333333, 'b': 1, 'c': -0.3333333333333333, 'd': -1}
+            >>> MatrixWeightedMajority(ballots, weights=weights, antisymmetric=True, numeric_policy='float').row_sums_
+            {'a': 0.33333333333333326, 'b': 1.0, 'c': -0.33333333333333326, 'd': -1.0}
+        """
+        scaled = self._scaled_array_
+        if scaled is not None:
+            return _scaled_to_array(*scaled)
+        if not self._uses_native_array():
+            return super().as_array_
+        gross, weights, gross_scale, _ = self._gross_and_weights_arrays_
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result = np.where(weights == 0, float(self.default_score),
+                              gross.astype(float) / (weights.astype(float) * gross_scale))
+        np.fill_diagonal(result, float(self.diagonal_score))
+        if self.antisymmetric:
+            result = result - result.T
+        return result
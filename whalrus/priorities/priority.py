@@ -21,6 +21,7 @@ along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
 import random
 from typing import Union
 from functools import cmp_to_key
+from operator import itemgetter
 # Ideally, all Union[set, list] in this file should be typing.Collection, but it is only defined in Python >= 3.6.
 
 
@@ -300,6 +301,14 @@ class PriorityAscending(Priority):
     def _sort(self, x: Union[set, list], reverse: bool) -> Union[list, None]:
         return sorted(x, reverse=reverse)
 
+    def _sort_pairs_rp(self, x: Union[set, list], reverse: bool) -> Union[list, None]:
+        # Two stable sorts: by descending second element, then by ascending first element.
+        result = sorted(x, key=itemgetter(1), reverse=True)
+        result.sort(key=itemgetter(0))
+        if reverse:
+            result.reverse()
+        return result
+
 
 Priority.ASCENDING = PriorityAscending()
 
@@ -337,6 +346,14 @@ class PriorityDescending(Priority):
     def _sort(self, x: Union[set, list], reverse: bool) -> Union[list, None]:
         return sorted(x, reverse=not reverse)
 
+    def _sort_pairs_rp(self, x: Union[set, list], reverse: bool) -> Union[list, None]:
+        # Two stable sorts: by ascending second element, then by descending first element.
+        result = sorted(x, key=itemgetter(1))
+        result.sort(key=itemgetter(0), reverse=True)
+        if reverse:
+            result.reverse()
+        return result
+
 
 Priority.DESCENDING = PriorityDescending()
 
@@ -370,10 +387,10 @@ class PriorityRandom(Priority):
         return random.choice(list(x))
 
     def _sort(self, x: Union[set, list], reverse: bool) -> Union[list, None]:
-        return random.sample(x, len(x))
+        return random.sample(list(x), len(x))
 
     def _sort_pairs_rp(self, x: Union[set, list], reverse: bool):
-        return random.sample(x, len(x))
+        return random.sample(list(x), len(x))
 
 
 Priority.RANDOM = PriorityRandom()
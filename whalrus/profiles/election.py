@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright Sylvain Bouveret, Yann Chevaleyre and François Durand
+sylvain.bouveret@imag.fr, yann.chevaleyre@dauphine.fr, fradurand@gmail.com
+
+This file is part of Whalrus.
+
+Whalrus is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Whalrus is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import copy
+import types
+from whalrus.profiles.profile import Profile
+from whalrus.converters_ballot.converter_ballot import ConverterBallot
+from whalrus.converters_ballot.converter_ballot_general import ConverterBallotGeneral
+from whalrus.utils.utils import NiceSet, _cache_info, get_numeric_policy
+from typing import Union
+
+# Attributes that describe the state of an object, not its parameters.
+_STATE_ATTRIBUTES = {'_candidates_are_given', '_election_converted'}
+
+
+def _parameters_key(x: object) -> object:
+    """
+    Hashable key describing the parameters of an object.
+
+    Two objects with the same key are considered to give the same results when they are called on the same profile.
+    The parameters of an object are its attributes, except the computed variables (ending with an underscore or
+    cached, cf. :func:`cached_property`) and its internal state.
+
+    Parameters
+    ----------
+    x : object
+        Typically a :class:`Rule`, a :class:`Matrix` or a :class:`ConverterBallot`, but it can also be one of their
+        parameters (a number, a :class:`Priority`, a list of rules, etc.).
+
+    Returns
+    -------
+    object
+        A hashable key.
+
+    Examples
+    --------
+        >>> from whalrus.converters_ballot.converter_ballot_to_order import ConverterBallotToOrder
+        >>> _parameters_key(ConverterBallotToOrder()) == _parameters_key(ConverterBallotToOrder())
+        True
+        >>> from whalrus.matrices.matrix_weighted_majority import MatrixWeightedMajority
+        >>> _parameters_key(MatrixWeightedMajority()) == _parameters_key(MatrixWeightedMajority(indifference=1))
+        False
+        >>> _parameters_key(1) == _parameters_key(1.)
+        False
+    """
+    if isinstance(x, (list, tuple)):
+        return type(x), tuple(_parameters_key(y) for y in x)
+    if isinstance(x, (set, frozenset)):
+        return type(x), frozenset(_parameters_key(y) for y in x)
+    if isinstance(x, dict):
+        return type(x), frozenset((_parameters_key(k), _parameters_key(v)) for k, v in x.items())
+    if hasattr(x, '__dict__') and not isinstance(x, (type, types.FunctionType, types.MethodType)):
+        cached = _cache_info(type(x)).names
+        return type(x), frozenset((k, _parameters_key(v)) for k, v in vars(x).items()
+                                  if not k.endswith('_') and k not in _STATE_ATTRIBUTES and k not in cached)
+    try:
+        hash(x)
+    except TypeError:
+        # Unknown object: it is only considered equal to itself.
+        return 'id', id(x)
+    # The type is included, so that e.g. ``1`` and ``1.`` are different keys (the results have different types).
+    return type(x), x
+
+
+def _candidates_key(candidates: set) -> Union[frozenset, None]:
+    return None if candidates is None else frozenset(candidates)
+
+
+class Election:
+    """
+    An election, i.e. a profile that is shared by several rules or matrices.
+
+    A :class:`Rule` or a :class:`Matrix` can be called on an :class:`Election` instead of ballots. In that case, the
+    converted profile and the sub-objects that it uses (e.g. the weighted majority matrix) are taken from the
+    election when another object with the same parameters already computed them. For example, if Schulze, Ranked
+    Pairs, Copeland and Maximin rules are computed on the same election, the weighted majority matrix is computed
+    only once.
+
+    Objects called on an election share their profile with it: ballots cannot be added, removed or replaced (cf.
+    :meth:`Rule.add_ballot`).
+
+    Parameters
+    ----------
+    ballots : list or Profile
+        The ballots (as in the ``__call__`` of a :class:`Rule`).
+    weights : list
+        The weights.
+    voters : list
+        The voters.
+    candidates : set
+        The candidates. If None, each object called on the election infers the candidates from the ballots.
+
+    Attributes
+    ----------
+    profile_ : Profile
+        The profile of the election.
+
+    Examples
+    --------
+        >>> from whalrus.rules.rule_schulze import RuleSchulze
+        >>> from whalrus.rules.rule_maximin import RuleMaximin
+        >>> election = Election(['a > b > c', 'b > c > a', 'c > a > b'], weights=[4, 3, 2])
+        >>> schulze = RuleSchulze()(election)
+        >>> maximin = RuleMaximin()(election)
+        >>> schulze.winner_, maximin.winner_
+        ('a', 'a')
+        >>> schulze.matrix_schulze_.matrix_weighted_majority_ is maximin.matrix_weighted_majority_
+        True
+
+    The method :meth:`evaluate` gives the same result, but it also reuses the rule if it was already evaluated with
+    the same parameters:
+
+        >>> election.evaluate(RuleSchulze()) is election.evaluate(RuleSchulze())
+        True
+    """
+
+    def __init__(self, ballots: Union[list, Profile] = None, weights: list = None, voters: list = None,
+                 candidates: set = None):
+        if isinstance(ballots, Profile):
+            # Keep the storage of the profile (e.g. a ProfileArray).
+            profile = type(ballots)(ballots, weights=weights, voters=voters)
+        else:
+            profile = Profile(ballots, weights=weights, voters=voters)
+        # The ballots of a profile are already converted by ConverterBallotGeneral.
+        self._init(profile, candidates, (_parameters_key(ConverterBallotGeneral()), None))
+
+    @classmethod
+    def _from_converted_profile(cls, profile: Profile, converter: ConverterBallot) -> 'Election':
+        """Election whose profile is `profile` (without copy), which is already converted by `converter`."""
+        election = cls.__new__(cls)
+        election._init(profile, None, (_parameters_key(converter), None))
+        return election
+
+    def _init(self, profile: Profile, candidates: set, conversion_key: tuple) -> None:
+        self.profile_ = profile
+        self.candidates = None if candidates is None else NiceSet(candidates)
+        self._conversion_key = conversion_key
+        self._converted = dict()
+        self._evaluated = dict()
+
+    def converted(self, converter: ConverterBallot, candidates: set = None) -> 'Election':
+        """
+        Convert the profile.
+
+        Parameters
+        ----------
+        converter : ConverterBallot
+            The converter.
+        candidates : set
+            The candidates (passed to the converter).
+
+        Returns
+        -------
+        Election
+            An election whose profile is converted. It has no given candidates, so that objects called on it infer
+            their candidates from the converted ballots (as when they are called on a :class:`Profile`). The result
+            is stored: with another converter having the same parameters, the same election is returned. Converting
+            with the converter that produced this election returns the election itself.
+
+        Examples
+        --------
+            >>> from whalrus.converters_ballot.converter_ballot_to_order import ConverterBallotToOrder
+            >>> election = Election(['a > b > c', 'b > a'])
+            >>> print(election.converted(ConverterBallotToOrder(), candidates={'a', 'b'}).profile_)
+            a > b
+            b > a
+            >>> converted = election.converted(ConverterBallotToOrder())
+            >>> converted is election.converted(ConverterBallotToOrder())
+            True
+            >>> converted.converted(ConverterBallotToOrder()) is converted
+            True
+        """
+        converter_key, candidates_key = _parameters_key(converter), _candidates_key(candidates)
+        if converter_key == self._conversion_key[0] and candidates_key in {None, self._conversion_key[1]}:
+            return self
+        key = (converter_key, candidates_key)
+        try:
+            return self._converted[key]
+        except KeyError:
+            election = Election.__new__(Election)
+            election._init(self.profile_.convert(converter, candidates), None, key)
+            self._converted[key] = election
+            return election
+
+    def evaluate(self, x: object, candidates: set = None) -> object:
+        """
+        Call an object on the election.
+
+        Parameters
+        ----------
+        x : Rule or Matrix
+            The object. It is not modified: a copy of it is called on the election.
+        candidates : set
+            The candidates. Default: the candidates of the election.
+
+        Returns
+        -------
+        Rule or Matrix
+            The copy of `x`, once called on the election. The result is stored: with another object having the same
+            parameters (and the same `candidates` and numeric policy, cf. :func:`numeric_policy`), the same result is
+            returned.
+
+        Examples
+        --------
+            >>> from whalrus.matrices.matrix_weighted_majority import MatrixWeightedMajority
+            >>> election = Election(['a > b > c', 'b > c > a'])
+            >>> matrix = election.evaluate(MatrixWeightedMajority())
+            >>> matrix.as_array_
+            array([[0, Fraction(1, 2), Fraction(1, 2)],
+                   [Fraction(1, 2), 0, 1],
+                   [Fraction(1, 2), 0, 0]], dtype=object)
+            >>> election.evaluate(MatrixWeightedMajority()) is matrix
+            True
+            >>> election.evaluate(MatrixWeightedMajority(antisymmetric=True)) is matrix
+            False
+        """
+        policy = getattr(x, 'numeric_policy', None)
+        key = (_parameters_key(x), _candidates_key(candidates), get_numeric_policy() if policy is None else policy)
+        try:
+            return self._evaluated[key]
+        except KeyError:
+            result = copy.copy(x)(self, candidates=candidates)
+            self._evaluated[key] = result
+            return result
@@ -19,13 +19,44 @@ You should have received a copy of the GNU General Public License
 along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
 """
 from whalrus.converters_ballot.converter_ballot_general import ConverterBallotGeneral
-from whalrus.utils.utils import cached_property, DeleteCacheMixin, convert_number
+from whalrus.utils.utils import cached_property, DeleteCacheMixin, convert_number, NiceSet
 from whalrus.ballots.ballot import Ballot
 from whalrus.ballots.ballot_order import BallotOrder
+from whalrus.ballots.ballot_levels import BallotLevels
+from whalrus.ballots.ballot_one_name import BallotOneName
+from whalrus.converters_ballot.converter_ballot import ConverterBallot
 from typing import Union, Iterator
 from numbers import Number
 
 
+def _ballot_key(ballot: Ballot) -> object:
+    """
+    A hashable key representing a ballot, used to group equal ballots.
+
+    Parameters
+    ----------
+    ballot : Ballot
+
+    Returns
+    -------
+    object
+        A hashable object. Two ballots with the same key are equal. If the type of ballot is not known, return None.
+
+    Examples
+    --------
+        >>> _ballot_key(BallotOrder('a > b ~ c')) == _ballot_key(BallotOrder('a > c ~ b'))
+        True
+    """
+    candidates = frozenset(ballot.candidates)
+    if isinstance(ballot, BallotLevels):
+        return (type(ballot), candidates, frozenset(ballot.as_dict.items()), type(ballot.scale), repr(ballot.scale))
+    if isinstance(ballot, BallotOrder):
+        return type(ballot), candidates, tuple(frozenset(c) for c in ballot.as_weak_order)
+    if isinstance(ballot, BallotOneName):
+        return type(ballot), candidates, ballot.candidate
+    return None
+
+
 class Profile(DeleteCacheMixin):
     """
     A profile of ballots.
@@ -41,6 +72,8 @@ class Profile(DeleteCacheMixin):
     voters : list
         A list representing the voters corresponding to the ballots. Default: if :attr:`ballots` is a Profile, then use
         the voters of this profile; otherwise, all voters are None.
+    compress : bool
+        If True, then equal ballots are grouped (cf. :meth:`compressed`).
 
     Examples
     --------
@@ -99,14 +132,33 @@ class Profile(DeleteCacheMixin):
         >>> print(profile)
         (3): a > b
         (3): b > a
+
+    Equal ballots can be grouped, which makes the computation of the rules faster:
+
+        >>> profile = Profile(['a > b', 'b > a', 'a > b'], compress=True)
+        >>> print(profile)
+        (2): a > b
+        (1): b > a
     """
 
-    def __init__(self, ballots: Union[list, 'Profile'], weights: list = None, voters: list = None):
+    def __init__(self, ballots: Union[list, 'Profile'], weights: list = None, voters: list = None,
+                 compress: bool = False):
         converter = ConverterBallotGeneral()
-        self._ballots = [converter(b) for b in ballots]
+        # Equal strings give equal ballots: each distinct string is converted only once (ballots are immutable).
+        converted = dict()
+        self._ballots = []
+        for b in ballots:
+            if isinstance(b, str):
+                try:
+                    ballot = converted[b]
+                except KeyError:
+                    ballot = converted[b] = converter(b)
+            else:
+                ballot = converter(b)
+            self._ballots.append(ballot)
         if weights is None:
             if isinstance(ballots, Profile):
-                weights = ballots.weights
+                weights = list(ballots.weights)
             else:
                 weights = [1] * len(ballots)
         else:
@@ -114,11 +166,14 @@ class Profile(DeleteCacheMixin):
         self._weights = weights
         if voters is None:
             if isinstance(ballots, Profile):
-                self._voters = ballots.voters
+                self._voters = list(ballots.voters)
             else:
                 self._voters = [None] * len(ballots)
         else:
-            self._voters = voters
+            self._voters = list(voters)
+        if compress:
+            compressed = self.compressed()
+            self._ballots, self._weights, self._voters = compressed.ballots, compressed.weights, compressed.voters
 
     @property
     def ballots(self) -> list:
@@ -156,7 +211,7 @@ class Profile(DeleteCacheMixin):
         """
         return self._voters
 
-    @cached_property
+    @cached_property(depends_on=['_weights'])
     def has_weights(self) -> bool:
         """bool: Presence of non-trivial weights. True iff at least one weight is not 1.
 
@@ -168,7 +223,7 @@ class Profile(DeleteCacheMixin):
         """
         return any([weight != 1 for weight in self.weights])
 
-    @cached_property
+    @cached_property(depends_on=['_voters'])
     def has_voters(self) -> bool:
         """bool: Presence of explicit voters. True iff at least one voter is not None.
 
@@ -180,6 +235,110 @@ class Profile(DeleteCacheMixin):
         """
         return any([voter is not None for voter in self.voters])
 
+    @cached_property(depends_on=['_ballots'])
+    def candidates(self) -> NiceSet:
+        """NiceSet: The candidates of the ballots, i.e. the union of the candidates of all the ballots.
+
+        Examples
+        --------
+            >>> profile = Profile(['a > b', 'b > c'])
+            >>> profile.candidates
+            {'a', 'b', 'c'}
+        """
+        return NiceSet(set().union(*[b.candidates for b in self.ballots]))
+
+    def ballots_have_candidates(self, candidates: set) -> bool:
+        """
+        Whether all ballots have a given set of candidates.
+
+        Parameters
+        ----------
+        candidates : set
+
+        Returns
+        -------
+        bool
+            True iff the candidates of each ballot are exactly `candidates`.
+
+        Examples
+        --------
+            >>> profile = Profile(['a > b', 'b > a ~ c'])
+            >>> profile.ballots_have_candidates({'a', 'b'})
+            False
+        """
+        return all([b.candidates == candidates for b in self.ballots])
+
+    def convert(self, converter: ConverterBallot, candidates: set = None) -> 'Profile':
+        """
+        Convert all the ballots.
+
+        Parameters
+        ----------
+        converter : ConverterBallot
+            The converter to apply to each ballot.
+        candidates : set
+            The candidates (passed to the converter).
+
+        Returns
+        -------
+        Profile
+            The profile of converted ballots, with the same weights and voters.
+
+        Examples
+        --------
+            >>> from whalrus.converters_ballot.converter_ballot_to_plurality import ConverterBallotToPlurality
+            >>> profile = Profile(['a > b > c', 'c > b > a'], weights=[2, 1])
+            >>> print(profile.convert(ConverterBallotToPlurality(), candidates={'a', 'b'}))
+            (2): a
+            (1): b
+        """
+        return Profile([converter(b, candidates) for b in self.ballots], weights=self.weights, voters=self.voters)
+
+    def compressed(self, keep_voters: bool = True) -> 'Profile':
+        """
+        Group equal ballots.
+
+        Parameters
+        ----------
+        keep_voters : bool
+            If True (default) and if the profile has voters (cf. :attr:`has_voters`), then the voter of each group
+            is the tuple of the voters of its ballots. Otherwise, voters are None.
+
+        Returns
+        -------
+        Profile
+            A profile where equal ballots (same order and same candidates) are grouped in only one ballot, whose weight
+            is the sum of their weights. Ballots are in the order of their first appearance.
+
+        Examples
+        --------
+            >>> profile = Profile(['a > b', 'b > a', 'a > b'], weights=[1, 2, 3], voters=['Alice', 'Bob', 'Cate'])
+            >>> print(profile.compressed())
+            ('Alice', 'Cate') (4): a > b
+            ('Bob',) (2): b > a
+            >>> print(profile.compressed(keep_voters=False))
+            (4): a > b
+            (2): b > a
+        """
+        keep_voters = keep_voters and self.has_voters
+        groups = dict()
+        ballots, weights, voters = [], [], []
+        for i, (ballot, weight, voter) in enumerate(self.items()):
+            key = _ballot_key(ballot)
+            if key is None:
+                key = ('unknown', i)
+            j = groups.get(key)
+            if j is None:
+                groups[key] = len(ballots)
+                ballots.append(ballot)
+                weights.append(weight)
+                voters.append([voter])
+            else:
+                weights[j] += weight
+                voters[j].append(voter)
+        return Profile(ballots, weights=weights,
+                       voters=[tuple(v) for v in voters] if keep_voters else [None] * len(ballots))
+
     # Representation
     # ==============
 
@@ -229,13 +388,57 @@ class Profile(DeleteCacheMixin):
         self._voters.append(voter)
         self.delete_cache()
 
+    def index(self, ballot: object=None, voter: object=None) -> int:
+        """
+        Index of a ballot in the profile.
+
+        If only the ballot is specified, find the first matching ballot in the profile.
+        If only the voter is specified, find the first ballot whose voter matches the given voter.
+        If both are specified, find the first ballot matching both descriptions.
+
+        Parameters
+        ----------
+        ballot : object
+            The ballot or, more generally, an input that can be interpreted by :class:`ConverterBallotGeneral`.
+        voter : object
+            The voter.
+
+        Returns
+        -------
+        int
+            The index of the ballot.
+
+        Raises
+        ------
+        ValueError
+            If there is no such ballot (like :meth:`list.index`).
+
+        Examples
+        --------
+            >>> profile = Profile(['a > b', 'b > a'], voters=['Alice', 'Bob'])
+            >>> profile.index('b > a')
+            1
+            >>> profile.index('b > a', voter='Alice')
+            Traceback (most recent call last):
+            ...
+            ValueError: There is no such ballot in the profile: ballot='b > a', voter='Alice'.
+        """
+        if ballot is None:
+            i = next((i for i, v in enumerate(self.voters) if v == voter), None)
+        else:
+            ballot_converted = ConverterBallotGeneral()(ballot)
+            i = next((i for i, b in enumerate(self.ballots)
+                      if b == ballot_converted and (voter is None or self.voters[i] == voter)), None)
+        if i is None:
+            raise ValueError('There is no such ballot in the profile: ballot=%r, voter=%r.' % (ballot, voter))
+        return i
+
     def remove(self, ballot: object=None, voter: object=None) -> None:
         """
         Remove a ballot from the profile.
 
-        If only the ballot is specified, remove the first matching ballot in the profile.
-        If only the voter is specified, remove the first ballot whose voter matches the given voter.
-        If both are specified, remove the first ballot matching both descriptions.
+        The ballot is chosen as in :meth:`index`. If there is no such ballot, a ValueError is raised (like
+        :meth:`list.remove`).
 
         Parameters
         ----------
@@ -251,17 +454,7 @@ class Profile(DeleteCacheMixin):
             >>> print(profile)
             a > b
         """
-        if ballot is None:
-            i = next(i for i, v in enumerate(self.voters) if v == voter)
-        elif voter is None:
-            i = next(i for i, b in enumerate(self.ballots) if b == ConverterBallotGeneral()(ballot))
-        else:
-            i = next(i for i, b in enumerate(self.ballots)
-                     if b == ConverterBallotGeneral()(ballot) and self.voters[i] == voter)
-        del self._ballots[i]
-        del self._voters[i]
-        del self._weights[i]
-        self.delete_cache()
+        del self[self.index(ballot, voter)]
 
     def __len__(self) -> int:
         """int: Length. The number of ballots in the profile.
@@ -314,7 +507,7 @@ class Profile(DeleteCacheMixin):
             b > a
         """
         self._ballots[key] = ConverterBallotGeneral()(value)
-        self.delete_cache()
+        self.invalidate('_ballots')
 
     def __delitem__(self, key: int) -> None:
         """
@@ -0,0 +1,863 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright Sylvain Bouveret, Yann Chevaleyre and François Durand
+sylvain.bouveret@imag.fr, yann.chevaleyre@dauphine.fr, fradurand@gmail.com
+
+This file is part of Whalrus.
+
+Whalrus is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Whalrus is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import numpy as np
+from whalrus.profiles.profile import Profile
+from whalrus.ballots.ballot_order import BallotOrder
+from whalrus.converters_ballot.converter_ballot import ConverterBallot
+from whalrus.converters_ballot.converter_ballot_general import ConverterBallotGeneral
+from whalrus.converters_ballot.converter_ballot_to_order import ConverterBallotToOrder
+from whalrus.converters_ballot.converter_ballot_to_strict_order import ConverterBallotToStrictOrder
+from whalrus.utils.utils import cached_property, convert_number, set_to_list, NiceDict, NiceSet
+from typing import Union, Iterator
+from numbers import Number
+
+
+def _rank_dtype(n: int) -> type:
+    """
+    Smallest signed integer dtype able to store the ranks of a table of `n` candidates.
+
+    Parameters
+    ----------
+    n : int
+        Number of candidates.
+
+    Returns
+    -------
+    type
+        A numpy integer type.
+
+    Examples
+    --------
+        >>> _rank_dtype(10)
+        <class 'numpy.int8'>
+        >>> _rank_dtype(1000)
+        <class 'numpy.int16'>
+    """
+    if n <= np.iinfo(np.int8).max:
+        return np.int8
+    if n <= np.iinfo(np.int16).max:
+        return np.int16
+    return np.int32
+
+
+def _dense_ranks(ranks: np.ndarray) -> np.ndarray:
+    """
+    Renumber the ranks of each row so that the indifference classes are numbered 0, 1, 2, etc.
+
+    Parameters
+    ----------
+    ranks : np.ndarray
+        A 2d array of ranks. Negative values are codes (:attr:`ProfileArray.UNORDERED` or
+        :attr:`ProfileArray.ABSENT`) and are left unchanged.
+
+    Returns
+    -------
+    np.ndarray
+        The same ranks, without gaps.
+
+    Examples
+    --------
+        >>> _dense_ranks(np.array([[3, -1, 7, 3], [-2, 5, 0, 2]]))
+        array([[ 0, -1,  1,  0],
+               [-2,  2,  0,  1]], dtype=int8)
+    """
+    dtype = _rank_dtype(ranks.shape[1])
+    if ranks.size == 0:
+        return ranks.astype(dtype)
+    order = np.argsort(ranks, axis=1, kind='stable')
+    sorted_ranks = np.take_along_axis(ranks, order, axis=1)
+    new_class = np.ones(sorted_ranks.shape, dtype=bool)
+    new_class[:, 1:] = sorted_ranks[:, 1:] != sorted_ranks[:, :-1]
+    new_class &= sorted_ranks >= 0
+    dense = np.where(sorted_ranks >= 0, np.cumsum(new_class, axis=1) - 1, sorted_ranks)
+    result = np.empty(ranks.shape, dtype=dtype)
+    np.put_along_axis(result, order, dense, axis=1)
+    return result
+
+
+def _weights_to_array(weights: list) -> np.ndarray:
+    """
+    Convert a list of weights to a numpy array, using a native dtype when it is exact.
+
+    Parameters
+    ----------
+    weights : list
+        A list of numbers.
+
+    Returns
+    -------
+    np.ndarray
+        An array of integers if all weights are integers (and not too large), an array of floats if all weights are
+        floats, and an array of objects otherwise (e.g. for fractions).
+
+    Examples
+    --------
+        >>> from fractions import Fraction
+        >>> _weights_to_array([1, 2, 3]).dtype
+        dtype('int64')
+        >>> _weights_to_array([1, Fraction(1, 2)])
+        array([1, Fraction(1, 2)], dtype=object)
+    """
+    if all(isinstance(w, int) for w in weights):
+        try:
+            return np.array(weights, dtype=np.int64)
+        except OverflowError:
+            pass
+    elif all(isinstance(w, float) for w in weights):
+        return np.array(weights, dtype=float)
+    result = np.empty(len(weights), dtype=object)
+    result[:] = weights
+    return result
+
+
+class ProfileArray(Profile):
+    """
+    A profile of ordered ballots, stored as a NumPy array of ranks.
+
+    This is an alternative storage for a :class:`Profile` whose ballots are orders. Candidates are stored once, in a
+    table (:attr:`candidates_as_list`). Then, each ballot is a row of integers in the array :attr:`ranks`: the
+    candidates of the first indifference class have rank 0, those of the second class have rank 1, etc. The code
+    :attr:`UNORDERED` is used for a candidate that is available but not ordered in the ballot, and :attr:`ABSENT` for a
+    candidate that is not available in the ballot. Weights are stored in the vector :attr:`weights_as_array`.
+
+    In other words, each ballot only costs a few bytes, and a :class:`BallotOrder` object is created only when it is
+    asked for (e.g. with ``__getitem__`` or :meth:`items`). Rules and matrices can read the arrays directly. The
+    profile can also be modified (e.g. with :meth:`append`): the arrays are then stored at the beginning of larger
+    buffers, so that appending a ballot is amortized O(m), where m is the number of candidates.
+
+    Parameters
+    ----------
+    ballots : iterable
+        Typically, it is a list, but it can also be a :class:`Profile`. Its elements must be inputs that can be
+        interpreted by :class:`ConverterBallotToOrder`. N.B.: a :class:`BallotLevels` is stored as its order only, i.e.
+        the ballots of the profile are :class:`BallotOrder` objects.
+    weights : list
+        A list of numbers representing the weights of the ballots. Default: if :attr:`ballots` is a Profile, then use
+        the weights of this profile; otherwise, all weights are 1.
+    voters : list
+        A list representing the voters corresponding to the ballots. Default: if :attr:`ballots` is a Profile, then use
+        the voters of this profile; otherwise, all voters are None.
+    candidates : set
+        The candidates of the table. Default: the candidates of the ballots. All the candidates of the ballots must be
+        in this set.
+    compress : bool
+        If True, then equal ballots are grouped (cf. :meth:`compressed`).
+
+    Examples
+    --------
+        >>> profile = ProfileArray(['a > b ~ c', 'c > a', 'b > a > c'], weights=[2, 1, 1])
+        >>> print(profile)
+        (2): a > b ~ c
+        (1): c > a
+        (1): b > a > c
+        >>> profile.candidates_as_list
+        ['a', 'b', 'c']
+        >>> profile.ranks
+        array([[ 0,  1,  1],
+               [ 1, -2,  0],
+               [ 1,  0,  2]], dtype=int8)
+        >>> profile.weights_as_array
+        array([2, 1, 1])
+
+    Ballots are created on demand:
+
+        >>> profile[1]
+        BallotOrder(['c', 'a'], candidates={'a', 'c'})
+
+    A :class:`ProfileArray` can be used wherever a :class:`Profile` is expected. When the converter of a rule keeps
+    the ballots as orders, the converted profile is also a :class:`ProfileArray`:
+
+        >>> from whalrus.rules.rule_borda import RuleBorda
+        >>> rule = RuleBorda(profile)
+        >>> type(rule.profile_converted_).__name__
+        'ProfileArray'
+        >>> rule.winner_
+        'a'
+
+    It is also possible to build a profile directly from an array of ranks:
+
+        >>> profile = ProfileArray.from_ranks([[0, 1, 2], [2, 1, 0]], candidates=['a', 'b', 'c'])
+        >>> print(profile)
+        a > b > c
+        c > b > a
+    """
+
+    #: Code used in :attr:`ranks` for a candidate that is available, but not ordered in the ballot.
+    UNORDERED = -1
+    #: Code used in :attr:`ranks` for a candidate that is not available in the ballot.
+    ABSENT = -2
+
+    #: Buffers (ranks, weights) that hold the arrays when the profile is modified in place (cf. :meth:`_owns_buffers`).
+    _buffers = None
+
+    def __init__(self, ballots: Union[list, Profile], weights: list = None, voters: list = None,
+                 candidates: set = None, compress: bool = False):
+        if isinstance(ballots, ProfileArray):
+            # The arrays may be shared with this profile: the other one must not modify them in place anymore.
+            ballots._buffers = None
+        if isinstance(ballots, ProfileArray) and candidates is None:
+            self._candidates_as_list = ballots._candidates_as_list
+            self._ranks = ballots._ranks
+        elif isinstance(ballots, ProfileArray):
+            self._candidates_as_list = set_to_list(candidates)
+            self._check_candidates(ballots.candidates)
+            self._ranks = ballots.ranks_over(self._candidates_as_list)
+        else:
+            if not isinstance(ballots, Profile):
+                ballots = list(ballots)
+            converter = ConverterBallotToOrder()
+            converted = dict()
+            ballots_converted = []
+            for b in ballots:
+                if isinstance(b, str):
+                    try:
+                        ballot = converted[b]
+                    except KeyError:
+                        ballot = converted[b] = converter(b)
+                else:
+                    ballot = converter(b)
+                ballots_converted.append(ballot)
+            all_candidates = NiceSet(set().union(*[b.candidates for b in ballots_converted]))
+            if candidates is None:
+                candidates = all_candidates
+            self._candidates_as_list = set_to_list(candidates)
+            self._check_candidates(all_candidates)
+            indexes = self.candidates_indexes
+            rows = dict()  # Ballots converted from equal strings are the same object: compute their row only once.
+            for b in converted.values():
+                rows[id(b)] = self._row(b, indexes)
+            self._ranks = np.array([rows[id(b)] if id(b) in rows else self._row(b, indexes)
+                                    for b in ballots_converted],
+                                   dtype=_rank_dtype(len(self._candidates_as_list))
+                                   ).reshape((len(ballots_converted), len(self._candidates_as_list)))
+        if weights is None:
+            if isinstance(ballots, ProfileArray):
+                self._weights = ballots._weights
+            elif isinstance(ballots, Profile):
+                self._weights = _weights_to_array(ballots.weights)
+            else:
+                self._weights = np.ones(len(ballots), dtype=np.int64)
+        else:
+            self._weights = _weights_to_array([convert_number(w) for w in weights])
+        if voters is None:
+            if isinstance(ballots, ProfileArray):
+                self._voters = None if ballots._voters is None else list(ballots._voters)
+            elif isinstance(ballots, Profile) and ballots.has_voters:
+                self._voters = list(ballots.voters)
+            else:
+                self._voters = None
+        else:
+            self._voters = list(voters)
+        if compress:
+            compressed = self.compressed()
+            self._ranks, self._weights, self._voters = compressed._ranks, compressed._weights, compressed._voters
+
+    @classmethod
+    def from_ranks(cls, ranks: object, candidates: list, weights: list = None,
+                   voters: list = None) -> 'ProfileArray':
+        """
+        Build a profile from an array of ranks.
+
+        Parameters
+        ----------
+        ranks : array-like
+            A 2d array of integers. Each row is a ballot and each column corresponds to a candidate. Ranks do not need
+            to be consecutive, only their order matters. Negative values must be :attr:`UNORDERED` or :attr:`ABSENT`.
+        candidates : list
+            The candidates corresponding to the columns.
+        weights : list
+            The weights. Default: all weights are 1.
+        voters : list
+            The voters. Default: all voters are None.
+
+        Returns
+        -------
+        ProfileArray
+            The profile.
+
+        Examples
+        --------
+            >>> profile = ProfileArray.from_ranks([[10, 20, -1]], candidates=['a', 'b', 'c'], weights=[3])
+            >>> print(profile)
+            (3): a > b (unordered: c)
+        """
+        ranks = np.asarray(ranks)
+        candidates = list(candidates)
+        if ranks.ndim != 2 or ranks.shape[1] != len(candidates):
+            raise ValueError('The array of ranks must have one column per candidate.')
+        if ranks.size and ranks.min() < cls.ABSENT:
+            raise ValueError('Negative ranks must be ProfileArray.UNORDERED or ProfileArray.ABSENT.')
+        if weights is None:
+            weights = np.ones(ranks.shape[0], dtype=np.int64)
+        elif isinstance(weights, np.ndarray) and weights.dtype != object:
+            weights = weights.copy()
+        else:
+            weights = _weights_to_array([convert_number(w) for w in weights])
+        if len(weights) != ranks.shape[0]:
+            raise ValueError('There must be one weight per ballot.')
+        return cls._from_arrays(_dense_ranks(ranks), candidates, weights, None if voters is None else list(voters))
+
+    @classmethod
+    def _from_arrays(cls, ranks: np.ndarray, candidates: list, weights: np.ndarray,
+                     voters: list) -> 'ProfileArray':
+        """Build a profile directly from its internal representation (without any check or copy)."""
+        profile = cls.__new__(cls)
+        profile._ranks = ranks
+        profile._candidates_as_list = candidates
+        profile._weights = weights
+        profile._voters = voters
+        return profile
+
+    def _check_candidates(self, candidates: set) -> None:
+        missing = set(candidates) - set(self._candidates_as_list)
+        if missing:
+            raise ValueError('Some candidates of the ballots are not in the candidates of the profile: %r.'
+                             % NiceSet(missing))
+
+    def _row(self, ballot: BallotOrder, indexes: dict) -> list:
+        """Convert a :class:`BallotOrder` to a row of ranks."""
+        row = [self.ABSENT] * len(indexes)
+        for c in ballot.candidates_not_in_b:
+            row[indexes[c]] = self.UNORDERED
+        for k, indifference_class in enumerate(ballot.as_weak_order):
+            for c in indifference_class:
+                row[indexes[c]] = k
+        return row
+
+    def _ballot(self, i: int) -> BallotOrder:
+        """Create the :class:`BallotOrder` corresponding to the `i`-th row."""
+        classes = dict()
+        candidates = []
+        for c, r in zip(self._candidates_as_list, self._ranks[i].tolist()):
+            if r == self.ABSENT:
+                continue
+            candidates.append(c)
+            if r >= 0:
+                classes.setdefault(r, []).append(c)
+        return BallotOrder([NiceSet(classes[r]) for r in sorted(classes)], candidates=NiceSet(candidates))
+
+    # Array representation
+    # ====================
+
+    @property
+    def candidates_as_list(self) -> list:
+        """list: The table of candidates, i.e. the candidates corresponding to the columns of :attr:`ranks`.
+
+        Examples
+        --------
+            >>> ProfileArray(['b > a', 'c > a']).candidates_as_list
+            ['a', 'b', 'c']
+        """
+        return self._candidates_as_list
+
+    @cached_property(depends_on=['_candidates_as_list'])
+    def candidates_indexes(self) -> NiceDict:
+        """NiceDict: To each candidate, it associates its index in :attr:`candidates_as_list`.
+
+        Examples
+        --------
+            >>> ProfileArray(['b > a', 'c > a']).candidates_indexes
+            {'a': 0, 'b': 1, 'c': 2}
+        """
+        return NiceDict({c: i for i, c in enumerate(self._candidates_as_list)})
+
+    @property
+    def ranks(self) -> np.ndarray:
+        """np.ndarray: The array of ranks. Each row is a ballot and each column is a candidate of
+        :attr:`candidates_as_list`. The candidates of the first indifference class have rank 0, etc. Special codes are
+        :attr:`UNORDERED` and :attr:`ABSENT`.
+
+        Examples
+        --------
+            >>> ProfileArray(['b > a', 'c > a']).ranks
+            array([[ 1,  0, -2],
+                   [ 1, -2,  0]], dtype=int8)
+        """
+        return self._ranks
+
+    @property
+    def weights_as_array(self) -> np.ndarray:
+        """np.ndarray: The weights, as a numpy array. Its dtype is integer or float whenever possible, and object
+        otherwise (e.g. for fractions).
+
+        Examples
+        --------
+            >>> ProfileArray(['b > a', 'c > a'], weights=[2, 3]).weights_as_array
+            array([2, 3])
+        """
+        return self._weights
+
+    def ranks_over(self, candidates_as_list: list) -> np.ndarray:
+        """
+        The array of ranks, over another table of candidates.
+
+        Parameters
+        ----------
+        candidates_as_list : list
+            A list of candidates.
+
+        Returns
+        -------
+        np.ndarray
+            An array with one row per ballot and one column per candidate of `candidates_as_list`. A candidate that is
+            not in :attr:`candidates_as_list` is absent from all ballots. Conversely, candidates that are not in
+            `candidates_as_list` are ignored (in that case, ranks may be non-consecutive, but their order is preserved).
+
+        Examples
+        --------
+            >>> ProfileArray(['b > a', 'c > a']).ranks_over(['c', 'a', 'd'])
+            array([[-2,  1, -2],
+                   [ 0,  1, -2]], dtype=int8)
+        """
+        if list(candidates_as_list) == self._candidates_as_list:
+            return self._ranks
+        indexes = self.candidates_indexes
+        dtype = np.promote_types(self._ranks.dtype, _rank_dtype(len(candidates_as_list)))
+        result = np.full((len(self), len(candidates_as_list)), self.ABSENT, dtype=dtype)
+        for j, c in enumerate(candidates_as_list):
+            i = indexes.get(c)
+            if i is not None:
+                result[:, j] = self._ranks[:, i]
+        return result
+
+    # Core properties of the profile
+    # ==============================
+
+    @cached_property(depends_on=['_ranks', '_candidates_as_list'])
+    def ballots(self) -> list:
+        """list of BallotOrder: The ballots. N.B.: accessing this attribute creates all the ballots, which may
+        be expensive for a large profile. Consider using :meth:`items` or iterating over the profile instead.
+
+        Examples
+        --------
+            >>> ProfileArray(['a > b', 'b > a']).ballots
+            [BallotOrder(['a', 'b'], candidates={'a', 'b'}), BallotOrder(['b', 'a'], candidates={'a', 'b'})]
+        """
+        return [self._ballot(i) for i in range(len(self))]
+
+    @cached_property(depends_on=['_weights'])
+    def weights(self) -> list:
+        """list of Number: The weights.
+
+        Examples
+        --------
+            >>> ProfileArray(['a > b', 'b > a']).weights
+            [1, 1]
+        """
+        return self._weights.tolist()
+
+    @cached_property(depends_on=['_voters'])
+    def voters(self) -> list:
+        """list: The voters.
+
+        Examples
+        --------
+            >>> ProfileArray(['a > b', 'b > a'], voters=['Alice', 'Bob']).voters
+            ['Alice', 'Bob']
+        """
+        if self._voters is None:
+            return [None] * len(self)
+        return self._voters
+
+    @cached_property(depends_on=['_weights'])
+    def has_weights(self) -> bool:
+        """bool: Presence of non-trivial weights. True iff at least one weight is not 1.
+
+        Examples
+        --------
+            >>> ProfileArray(['a > b', 'b > a'], weights=[1, 2]).has_weights
+            True
+        """
+        return bool(np.any(self._weights != 1))
+
+    @cached_property(depends_on=['_voters'])
+    def has_voters(self) -> bool:
+        """bool: Presence of explicit voters. True iff at least one voter is not None.
+
+        Examples
+        --------
+            >>> ProfileArray(['a > b', 'b > a']).has_voters
+            False
+        """
+        return self._voters is not None and any([voter is not None for voter in self._voters])
+
+    @cached_property(depends_on=['_ranks', '_candidates_as_list'])
+    def candidates(self) -> NiceSet:
+        """NiceSet: The candidates of the ballots, i.e. the candidates of :attr:`candidates_as_list` that are available
+        in at least one ballot.
+
+        Examples
+        --------
+            >>> ProfileArray(['a > b'], candidates={'a', 'b', 'c'}).candidates
+            {'a', 'b'}
+        """
+        present = np.any(self._ranks != self.ABSENT, axis=0)
+        return NiceSet(c for c, p in zip(self._candidates_as_list, present) if p)
+
+    @cached_property(depends_on=['_ranks'])
+    def is_strict(self) -> bool:
+        """bool: Whether all the ballots are strict orders (cf. :attr:`BallotOrder.is_strict`).
+
+        Examples
+        --------
+            >>> ProfileArray(['a > b > c', 'b > a']).is_strict
+            True
+            >>> ProfileArray(['a > b > c', 'b ~ a']).is_strict
+            False
+        """
+        sorted_ranks = np.sort(self._ranks, axis=1)
+        return not np.any((sorted_ranks[:, 1:] == sorted_ranks[:, :-1]) & (sorted_ranks[:, 1:] >= 0))
+
+    def ballots_have_candidates(self, candidates: set) -> bool:
+        """
+        Whether all ballots have a given set of candidates.
+
+        Parameters
+        ----------
+        candidates : set
+
+        Returns
+        -------
+        bool
+            True iff the candidates of each ballot are exactly `candidates`.
+
+        Examples
+        --------
+            >>> ProfileArray(['a > b', 'b > a ~ c']).ballots_have_candidates({'a', 'b'})
+            False
+        """
+        if len(self) == 0:
+            return True
+        if not set(candidates) <= set(self._candidates_as_list):
+            return False
+        inside = np.array([c in candidates for c in self._candidates_as_list], dtype=bool)
+        present = self._ranks != self.ABSENT
+        return bool(np.all(present[:, inside]) and not np.any(present[:, ~inside]))
+
+    # Restriction and conversion
+    # ==========================
+
+    def restrict(self, candidates: set = None) -> 'ProfileArray':
+        """
+        Restrict all the ballots to less candidates.
+
+        Parameters
+        ----------
+        candidates : set
+            A set of candidates. Default: all the candidates.
+
+        Returns
+        -------
+        ProfileArray
+            The profile, where each ballot is restricted to `candidates` (like in :meth:`BallotOrder.restrict`).
+
+        Examples
+        --------
+            >>> print(ProfileArray(['a > b > c', 'c > b ~ a']).restrict({'a', 'c'}))
+            a > c
+            c > a
+        """
+        if candidates is None:
+            return self
+        columns = [j for j, c in enumerate(self._candidates_as_list) if c in candidates]
+        self._buffers = None  # The weights are shared.
+        return self._from_arrays(_dense_ranks(self._ranks[:, columns]),
+                                 [self._candidates_as_list[j] for j in columns], self._weights,
+                                 None if self._voters is None else list(self._voters))
+
+    def convert(self, converter: ConverterBallot, candidates: set = None) -> Profile:
+        """
+        Convert all the ballots.
+
+        When the converter keeps the ballots as orders, the conversion is performed directly on the array and the
+        result is a :class:`ProfileArray`. Otherwise, it falls back on :meth:`Profile.convert`.
+
+        Parameters
+        ----------
+        converter : ConverterBallot
+        candidates : set
+            The candidates.
+
+        Returns
+        -------
+        Profile
+            The converted profile.
+
+        Examples
+        --------
+            >>> profile = ProfileArray(['a > b > c', 'c > b ~ a'])
+            >>> print(profile.convert(ConverterBallotToOrder(), candidates={'b', 'c'}))
+            b > c
+            c > b
+            >>> type(profile.convert(ConverterBallotToOrder())).__name__
+            'ProfileArray'
+        """
+        if type(converter) in {ConverterBallotGeneral, ConverterBallotToOrder}:
+            return self.restrict(candidates)
+        if type(converter) == ConverterBallotToStrictOrder:
+            restricted = self.restrict(candidates)
+            if restricted.is_strict:
+                return restricted
+        return super().convert(converter, candidates)
+
+    # Representation
+    # ==============
+
+    def compressed(self, keep_voters: bool = True) -> 'ProfileArray':
+        """
+        Group equal ballots.
+
+        Parameters
+        ----------
+        keep_voters : bool
+            If True (default) and if the profile has voters (cf. :attr:`has_voters`), then the voter of each group
+            is the tuple of the voters of its ballots. Otherwise, voters are None.
+
+        Returns
+        -------
+        ProfileArray
+            A profile where equal rows of :attr:`ranks` are grouped in only one row, whose weight is the sum of their
+            weights. Rows are in the order of their first appearance.
+
+        Examples
+        --------
+            >>> profile = ProfileArray(['a > b', 'b > a', 'a > b'], weights=[1, 2, 3])
+            >>> print(profile.compressed())
+            (4): a > b
+            (2): b > a
+        """
+        if self._ranks.shape[0] == 0:
+            return self._from_arrays(self._ranks, self._candidates_as_list, self._weights, None)
+        _, first, inverse = np.unique(self._ranks, axis=0, return_index=True, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        order = np.argsort(first, kind='stable')
+        new_index = np.empty(len(order), dtype=np.int64)
+        new_index[order] = np.arange(len(order))
+        group = new_index[inverse]
+        weights = np.zeros(len(order), dtype=self._weights.dtype)
+        np.add.at(weights, group, self._weights)
+        if keep_voters and self.has_voters:
+            voters = [[] for _ in range(len(order))]
+            for g, voter in zip(group.tolist(), self._voters):
+                voters[g].append(voter)
+            voters = [tuple(v) for v in voters]
+        else:
+            voters = None
+        return self._from_arrays(self._ranks[first[order]], self._candidates_as_list, weights, voters)
+
+    def __repr__(self) -> str:
+        return 'ProfileArray(ballots=%r, weights=%r, voters=%r)' % (self.ballots, self.weights, self.voters)
+
+    # List-like behavior
+    # ==================
+
+    def _owns_buffers(self) -> bool:
+        """Whether the arrays are stored at the beginning of buffers that this profile may modify in place. This is
+        not the case anymore once the arrays are shared with another profile (e.g. by :meth:`restrict`)."""
+        return (self._buffers is not None and self._ranks.base is self._buffers[0]
+                and self._weights.base is self._buffers[1])
+
+    def _reallocate(self, capacity: int, weights_dtype: np.dtype = None) -> None:
+        """Copy the arrays at the beginning of new buffers, owned by this profile, with room for `capacity` ballots."""
+        n = len(self)
+        ranks_buffer = np.empty((capacity, self._ranks.shape[1]), dtype=self._ranks.dtype)
+        ranks_buffer[:n] = self._ranks
+        weights_buffer = np.empty(capacity, dtype=self._weights.dtype if weights_dtype is None else weights_dtype)
+        weights_buffer[:n] = self._weights
+        self._ranks, self._weights = ranks_buffer[:n], weights_buffer[:n]
+        self._buffers = (ranks_buffer, weights_buffer)
+
+    def _extend_table(self, ballot: BallotOrder) -> None:
+        """Add the candidates of the ballot to the table, if necessary."""
+        new_candidates = ballot.candidates - set(self._candidates_as_list)
+        if new_candidates:
+            candidates_as_list = set_to_list(set(self._candidates_as_list) | new_candidates)
+            self._ranks = self.ranks_over(candidates_as_list)
+            self._candidates_as_list = candidates_as_list
+            self.delete_cache()
+
+    def append(self, ballot: object, weight: Number = 1, voter: object = None) -> None:
+        """
+        Append a ballot to the profile.
+
+        Parameters
+        ----------
+        ballot : object
+            A ballot or, more generally, an input that can be interpreted by :class:`ConverterBallotToOrder`.
+        weight : Number
+            The weight of the ballot.
+        voter : object
+            The voter.
+
+        Examples
+        --------
+            >>> profile = ProfileArray(['a > b'])
+            >>> profile.append('b > c', weight=2)
+            >>> print(profile)
+            (1): a > b
+            (2): b > c
+        """
+        ballot = ConverterBallotToOrder()(ballot)
+        self._extend_table(ballot)
+        weight = convert_number(weight)
+        weights = self._cached_properties.get('weights')
+        n = len(self)
+        weights_dtype = _weights_to_array(self._weights[:1].tolist() + [weight]).dtype
+        if weights_dtype != self._weights.dtype and self._weights.dtype != object:
+            self._reallocate(2 * n + 1, weights_dtype)
+        elif not self._owns_buffers() or n == len(self._buffers[0]):
+            self._reallocate(2 * n + 1)
+        ranks_buffer, weights_buffer = self._buffers
+        ranks_buffer[n] = self._row(ballot, self.candidates_indexes)
+        weights_buffer[n] = weight
+        self._ranks, self._weights = ranks_buffer[:n + 1], weights_buffer[:n + 1]
+        if weights is not None:
+            weights.append(weight)
+            self._cached_properties['weights'] = weights
+        if self._voters is not None:
+            self._voters.append(voter)
+        elif voter is not None:
+            self._voters = [None] * n + [voter]
+        self.invalidate('_voters')
+
+    def index(self, ballot: object = None, voter: object = None) -> int:
+        """
+        Index of a ballot in the profile.
+
+        Cf. :meth:`Profile.index`. The ballot is converted to an order, then its row of ranks is searched in
+        :attr:`ranks`, by blocks of rows (so that a ballot near the beginning of the profile is found quickly).
+
+        Examples
+        --------
+            >>> ProfileArray(['a > b', 'b', 'b > a']).index('b')
+            1
+        """
+        if ballot is None:
+            return super().index(voter=voter)
+        ballot_order = ConverterBallotToOrder()(ballot)
+        if ballot_order.candidates <= set(self._candidates_as_list):
+            row = np.array(self._row(ballot_order, self.candidates_indexes))
+            block = 1024
+            for start in range(0, len(self), block):
+                for i in np.flatnonzero(np.all(self._ranks[start:start + block] == row, axis=1)).tolist():
+                    if voter is None or self.voters[start + i] == voter:
+                        return start + i
+        raise ValueError('There is no such ballot in the profile: ballot=%r, voter=%r.' % (ballot, voter))
+
+    def __len__(self) -> int:
+        return self._ranks.shape[0]
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[BallotOrder, list]:
+        if isinstance(item, slice):
+            return [self._ballot(i) for i in range(len(self))[item]]
+        if not -len(self) <= item < len(self):
+            raise IndexError('ProfileArray index out of range')
+        return self._ballot(item % len(self))
+
+    def __iter__(self) -> Iterator:
+        return (self._ballot(i) for i in range(len(self)))
+
+    def __setitem__(self, key: int, value: object) -> None:
+        ballot = ConverterBallotToOrder()(value)
+        self._extend_table(ballot)
+        row = self._row(ballot, self.candidates_indexes)
+        if not self._owns_buffers():
+            # Copy on write: the arrays may be shared with another profile.
+            self._reallocate(len(self))
+        self._ranks[key] = row
+        self.invalidate('_ranks')
+
+    def __delitem__(self, key: int) -> None:
+        weights = self._cached_properties.get('weights')
+        if isinstance(key, int) and self._owns_buffers():
+            n = len(self)
+            key = range(n)[key]
+            ranks_buffer, weights_buffer = self._buffers
+            ranks_buffer[key:n - 1] = ranks_buffer[key + 1:n]
+            weights_buffer[key:n - 1] = weights_buffer[key + 1:n]
+            self._ranks, self._weights = ranks_buffer[:n - 1], weights_buffer[:n - 1]
+        else:
+            self._ranks = np.delete(self._ranks, key, axis=0)
+            self._weights = np.delete(self._weights, key)
+        if weights is not None:
+            del weights[key]
+            self._cached_properties['weights'] = weights
+        if self._voters is not None:
+            del self._voters[key]
+        self.invalidate('_voters')
+
+    def items(self) -> Iterator:
+        """
+        Items of the profile.
+
+        Returns
+        -------
+        Iterator
+            An iterator of triples (ballot, weight, voter). Ballots are created on the fly.
+
+        Examples
+        --------
+            >>> for ballot, weight, voter in ProfileArray(['a > b', 'b > a'], weights=[2, 1]).items():
+            ...     print('Ballot %s, weight %s, voter %s.' % (ballot, weight, voter))
+            Ballot a > b, weight 2, voter None.
+            Ballot b > a, weight 1, voter None.
+        """
+        return zip(iter(self), self.weights, self.voters)
+
+    # Some basic operations
+    # =====================
+
+    def __add__(self, other: Union[Profile, list]) -> 'ProfileArray':
+        """
+        Concatenate with another profile.
+
+        Examples
+        --------
+            >>> print(ProfileArray(['a > b']) + ['b > c'])
+            a > b
+            b > c
+        """
+        if not isinstance(other, ProfileArray):
+            other = ProfileArray(other)
+        candidates_as_list = set_to_list(set(self._candidates_as_list) | set(other.candidates_as_list))
+        if self._voters is None and other._voters is None:
+            voters = None
+        else:
+            voters = self.voters + other.voters
+        return self._from_arrays(
+            np.concatenate([self.ranks_over(candidates_as_list), other.ranks_over(candidates_as_list)]),
+            candidates_as_list, np.concatenate([self._weights, other.weights_as_array]), voters)
+
+    def __mul__(self, other: Number) -> 'ProfileArray':
+        """
+        Multiply the weights.
+
+        Examples
+        --------
+            >>> print(ProfileArray(['a > b', 'b > a']) * 3)
+            (3): a > b
+            (3): b > a
+        """
+        other = convert_number(other)
+        self._buffers = None  # The ranks are shared.
+        return self._from_arrays(self._ranks, self._candidates_as_list,
+                                 _weights_to_array([convert_number(w * other) for w in self.weights]),
+                                 None if self._voters is None else list(self._voters))
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright Sylvain Bouveret, Yann Chevaleyre and François Durand
+sylvain.bouveret@imag.fr, yann.chevaleyre@dauphine.fr, fradurand@gmail.com
+
+This file is part of Whalrus.
+
+Whalrus is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Whalrus is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import numpy as np
+from whalrus.profiles.profile import Profile
+from whalrus.profiles.profile_array import ProfileArray, _rank_dtype
+from whalrus.ballots.ballot_order import BallotOrder
+from whalrus.utils.utils import cached_property, DeleteCacheMixin, set_to_list, NiceSet
+from typing import Iterable, Callable
+
+
+class ProfileBatch(DeleteCacheMixin):
+    """
+    A batch of elections with the same candidates, stored as a single array of ranks.
+
+    This is the input of :meth:`Rule.evaluate_batch`. The ballots of all the elections are stacked in the array
+    :attr:`ranks` (with the same codes as in :class:`ProfileArray`), and :attr:`election_of_ballot` tells to which
+    election each ballot belongs. Hence the rules can count all the elections at once with vectorized operations,
+    without creating a :class:`Rule`, a :class:`Profile` or a :class:`Matrix` for each election.
+
+    This storage is possible only if all the ballots are :class:`BallotOrder` objects (e.g. the elections are
+    :class:`ProfileArray` objects, as produced by a :class:`Generator`), if the weights are integers, and if all the
+    elections have the same candidates (or, when `candidates` is given, if their candidates are in `candidates`).
+    Otherwise, :attr:`ranks` is None and the elections are only kept as they are in
+    :attr:`profiles`.
+
+    Parameters
+    ----------
+    elections : iterable
+        Each element is a :class:`Profile` or a list of ballots.
+    candidates : set
+        The candidates of all the elections. If None, they are inferred from the ballots of each election.
+
+    Attributes
+    ----------
+    profiles : list of Profile
+        The profiles of the elections.
+    candidates : NiceSet or None
+        The candidates, as given in the parameters.
+    candidates_as_list : list
+        The candidates corresponding to the columns of :attr:`ranks`.
+    ranks : np.ndarray or None
+        An array with one row per ballot (of all the elections) and one column per candidate.
+    weights : np.ndarray or None
+        The weights of the ballots (integers).
+    election_of_ballot : np.ndarray or None
+        For each ballot, the index of its election. Ballots of the same election are contiguous.
+    same_candidates : bool
+        True if the candidates of the ballots of each election are exactly :attr:`candidates_as_list` (e.g. a rule
+        based on a matrix whose candidates are inferred from the ballots gives the same result as with
+        `candidates`).
+
+    Examples
+    --------
+        >>> batch = ProfileBatch([['a > b > c', 'b > a > c'], ['c > b > a']])
+        >>> batch.n_elections
+        2
+        >>> batch.ranks
+        array([[0, 1, 2],
+               [1, 0, 2],
+               [2, 1, 0]], dtype=int8)
+        >>> batch.election_of_ballot
+        array([0, 0, 1])
+
+    Sums over the ballots of each election are computed with :meth:`weighted_sums`:
+
+        >>> batch.weighted_sums(lambda rows: batch.ranks[rows] == 0, shape=(3, ))
+        array([[1, 1, 0],
+               [0, 0, 1]])
+
+    When the elections cannot be stored as an array, only :attr:`profiles` is available:
+
+        >>> ProfileBatch([['a > b'], ['a > b > c']]).ranks is None
+        True
+    """
+
+    def __init__(self, elections: Iterable, candidates: set = None):
+        self.profiles = [x if isinstance(x, Profile) else Profile(x) for x in elections]
+        self.candidates = None if candidates is None else NiceSet(candidates)
+        self.candidates_as_list = None
+        self.ranks = None
+        self.weights = None
+        self.election_of_ballot = None
+        self.same_candidates = False
+        profiles_array = self._profiles_array()
+        if profiles_array is None:
+            return
+        self.candidates_as_list = (set_to_list(self.candidates) if self.candidates is not None
+                                   else profiles_array[0].candidates_as_list if profiles_array else [])
+        dtype = _rank_dtype(len(self.candidates_as_list))
+        self.ranks = np.concatenate(
+            [p.ranks_over(self.candidates_as_list).astype(dtype, copy=False) for p in profiles_array]
+        ).reshape((-1, len(self.candidates_as_list))) if profiles_array else np.zeros((0, 0), dtype=dtype)
+        self.weights = (np.concatenate([p.weights_as_array for p in profiles_array]).astype(np.int64)
+                        if profiles_array else np.zeros(0, dtype=np.int64))
+        self.same_candidates = all(p.candidates == set(self.candidates_as_list) for p in profiles_array)
+        self.election_of_ballot = np.repeat(np.arange(len(profiles_array)), [len(p) for p in profiles_array])
+
+    def _profiles_array(self) -> list:
+        """The profiles as :class:`ProfileArray` objects with the same candidates (None if it is not possible)."""
+        result = []
+        candidates = None
+        for profile in self.profiles:
+            if not isinstance(profile, ProfileArray):
+                if any(type(ballot) is not BallotOrder for ballot in profile):
+                    return None
+                profile = ProfileArray(profile)
+            if profile.weights_as_array.dtype.kind not in {'i', 'u'}:
+                return None
+            if self.candidates is not None:
+                if not profile.candidates <= self.candidates:
+                    return None
+            elif candidates is None:
+                candidates = profile.candidates
+            elif profile.candidates != candidates:
+                return None
+            result.append(profile)
+        return result
+
+    @property
+    def n_elections(self) -> int:
+        """int: Number of elections.
+        """
+        return len(self.profiles)
+
+    @property
+    def n_candidates(self) -> int:
+        """int: Number of candidates (only when the batch is stored as an array).
+        """
+        return len(self.candidates_as_list)
+
+    @cached_property
+    def unique_(self) -> tuple:
+        """tuple: A pair (`rows`, `inverse`), where `rows` is the array of the distinct rows of :attr:`ranks`, and
+        ``rows[inverse]`` is :attr:`ranks`.
+
+        Examples
+        --------
+            >>> rows, inverse = ProfileBatch([['a > b', 'b > a'], ['a > b']]).unique_
+            >>> rows
+            array([[0, 1],
+                   [1, 0]], dtype=int8)
+            >>> inverse
+            array([0, 1, 0])
+        """
+        rows, inverse = np.unique(self.ranks, axis=0, return_inverse=True)
+        return rows, inverse.reshape(-1)
+
+    def weighted_sums(self, f: Callable, shape: tuple, dtype: type = np.int64) -> np.ndarray:
+        """
+        Weighted sums over the ballots of each election.
+
+        Parameters
+        ----------
+        f : callable
+            A function that takes a slice of the ballots and returns an array with one entry per ballot of the slice.
+            Each entry is an array of the given `shape`.
+        shape : tuple
+            The shape of each entry.
+        dtype : type
+            The type of the sums.
+
+        Returns
+        -------
+        np.ndarray
+            An array of shape ``(n_elections, ) + shape``. For each election, it is the sum of the outputs of `f` for
+            its ballots, multiplied by their weights.
+        """
+        result = np.zeros((self.n_elections, ) + tuple(shape), dtype=dtype)
+        n_ballots = self.ranks.shape[0]
+        chunk = max(1, 2 ** 22 // max(1, int(np.prod(shape))))
+        for start in range(0, n_ballots, chunk):
+            rows = slice(start, min(start + chunk, n_ballots))
+            values = np.asarray(f(rows), dtype=dtype)
+            values = values * self.weights[rows].reshape((-1, ) + (1, ) * len(shape))
+            elections = self.election_of_ballot[rows]
+            starts = np.flatnonzero(np.concatenate(([True], elections[1:] != elections[:-1])))
+            result[elections[starts]] += np.add.reduceat(values, starts, axis=0)
+        return result
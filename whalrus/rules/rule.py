@@ -19,15 +19,21 @@ You should have received a copy of the GNU General Public License
 along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
 """
 import logging
-from whalrus.utils.utils import DeleteCacheMixin, cached_property, NiceSet
+from whalrus.utils.utils import cached_property, NiceSet, check_numeric_policy, get_numeric_policy
+from whalrus.utils.incremental_mixin import IncrementalMixin
 from whalrus.priorities.priority import Priority
 from whalrus.converters_ballot.converter_ballot_general import ConverterBallotGeneral
 from whalrus.profiles.profile import Profile
+from whalrus.profiles.election import Election
 from whalrus.converters_ballot.converter_ballot import ConverterBallot
-from typing import Union
+from typing import Union, Iterable, TYPE_CHECKING
+if TYPE_CHECKING:
+    # Imported on demand, by the methods that count a batch of elections (cf. :meth:`Rule.evaluate_batch`).
+    import numpy as np
+    from whalrus.profiles.profile_batch import ProfileBatch
 
 
-class Rule(DeleteCacheMixin):
+class Rule(IncrementalMixin):
     """
     A voting rule.
 
@@ -48,6 +54,11 @@ class Rule(DeleteCacheMixin):
     converter : ConverterBallot
         The converter that is used to convert input ballots in order to compute :attr:`profile_converted_`.
         Default: :class:`ConverterBallotGeneral`.
+    numeric_policy : str
+        The numeric policy used for the computed variables: ``'exact'``, ``'integer'`` or ``'float'`` (cf.
+        :func:`numeric_policy`). If None (default), the policy that is current when the rule is called is used. The
+        sub-objects of the rule (e.g. its matrices) are called with the policy of the rule, hence they use it too,
+        unless they have their own parameter ``numeric_policy``.
     kwargs
         If present, these parameters will be passed to ``__call__`` immediately after initialization.
 
@@ -63,45 +74,144 @@ class Rule(DeleteCacheMixin):
         the parameter ``converter`` of the rule.
     candidates_ : NiceSet
         The candidates of the election, as entered in the ``__call__``.
+    election_ : Election
+        The election, if the object was called on an :class:`Election` instead of ballots (None otherwise). In that
+        case, :attr:`profile_original_` is the profile of the election, and the converted profile and the sub-objects
+        (such as matrices) are shared with the other objects called on the same election.
+    numeric_policy_ : str
+        The numeric policy of the computed variables (cf. the parameter ``numeric_policy``).
 
     Examples
     --------
     Cf. :class:`RulePlurality` for some examples.
     """
 
-    def __init__(self, *args, tie_break: Priority = Priority.UNAMBIGUOUS, converter: ConverterBallot = None, **kwargs):
+    # The tie-breaking rule only affects the cached properties that explicitly depend on it (cf. ``depends_on`` in
+    # :func:`cached_property`): changing it does not delete the scores, the matrices, etc.
+    _explicit_parameters = frozenset({'tie_break'})
+
+    def __init__(self, *args, tie_break: Priority = Priority.UNAMBIGUOUS, converter: ConverterBallot = None,
+                 numeric_policy: str = None, **kwargs):
         """
         Remark: this `__init__` must always be called at the end of the subclasses' `__init__`.
         """
         if converter is None:
             converter = ConverterBallotGeneral()
         # Parameters
+        check_numeric_policy(numeric_policy)
         self.tie_break = tie_break
         self.converter = converter
+        self.numeric_policy = numeric_policy
         # Computed variables
+        self.numeric_policy_ = None
         self.profile_original_ = None
         self.profile_converted_ = None
         self.candidates_ = None
+        self.election_ = None
+        self._candidates_are_given = False
+        self._election_converted = None
         # Optional: load a profile at initialization
         if args or kwargs:
             self(*args, **kwargs)
 
-    def __call__(self, ballots: Union[list, Profile] = None, weights: list = None, voters: list = None,
+    def __call__(self, ballots: Union[list, Profile, Election] = None, weights: list = None, voters: list = None,
                  candidates: set = None):
-        self.profile_original_ = Profile(ballots, weights=weights, voters=voters)
-        self.profile_converted_ = Profile([self.converter(b, candidates) for b in self.profile_original_],
-                                          weights=self.profile_original_.weights, voters=self.profile_original_.voters)
+        self.numeric_policy_ = get_numeric_policy() if self.numeric_policy is None else self.numeric_policy
+        self.election_ = None
+        if isinstance(ballots, Election):
+            # Share the profile and the computations with the other objects called on the election.
+            self.election_ = ballots
+            self.profile_original_ = ballots.profile_
+            if candidates is None:
+                candidates = ballots.candidates
+        elif isinstance(ballots, Profile):
+            # Keep the storage of the profile (e.g. a ProfileArray).
+            self.profile_original_ = type(ballots)(ballots, weights=weights, voters=voters)
+        else:
+            self.profile_original_ = Profile(ballots, weights=weights, voters=voters)
+        self._candidates_are_given = candidates is not None
+        self._convert_profile(candidates)
+        return self
+
+    def evaluate_batch(self, elections: Union[Iterable, 'ProfileBatch'], candidates: set = None) -> list:
+        """
+        Cowinners of many elections.
+
+        For some rules (e.g. :class:`RulePlurality`, :class:`RuleBorda`, :class:`RuleScorePositional`,
+        :class:`RuleApproval`, :class:`RuleCopeland`, :class:`RuleMaximin`, :class:`RuleCondorcet` and
+        :class:`RuleSchulze`, with their default sub-objects), all the elections are counted at once with vectorized
+        operations on the array of ranks of a :class:`ProfileBatch`; for example, the weighted majority matrices are
+        computed as an array of shape `(n_elections, n_candidates, n_candidates)`. This is much faster than calling the
+        rule on each election when the elections are small. In the other cases, the rule is called on each election in
+        turn (hence it stays loaded with the last one).
+
+        Parameters
+        ----------
+        elections : iterable or ProfileBatch
+            Each element is a :class:`Profile` or a list of ballots (cf. :class:`ProfileBatch`).
+        candidates : set
+            The candidates of all the elections. If None, they are inferred from the ballots of each election.
+
+        Returns
+        -------
+        list of NiceSet
+            The cowinners of each election, i.e. its :attr:`cowinners_`.
+
+        Examples
+        --------
+            >>> from whalrus import RuleSchulze
+            >>> RuleSchulze().evaluate_batch([['a > b > c', 'b > c > a'], ['c > a > b', 'c > b > a']])
+            [{'a', 'b'}, {'c'}]
+
+        The winner of each election can then be chosen with the tie-break rule:
+
+            >>> from whalrus import RuleBorda, Priority
+            >>> rule = RuleBorda(tie_break=Priority.ASCENDING)
+            >>> [rule.tie_break.choice(cowinners) for cowinners in rule.evaluate_batch(
+            ...     [['a > b > c', 'b > a > c'], ['c > a > b']])]
+            ['a', 'c']
+        """
+        from whalrus.profiles.profile_batch import ProfileBatch
+        if not isinstance(elections, ProfileBatch):
+            elections = ProfileBatch(elections, candidates=candidates)
+        cowinners = None
+        if elections.ranks is not None and elections.n_candidates > 0:
+            cowinners = self._cowinners_batch(elections)
+        if cowinners is None:
+            return [self(profile, candidates=elections.candidates).cowinners_ for profile in elections.profiles]
+        return [NiceSet(c for c, is_cowinner in zip(elections.candidates_as_list, row) if is_cowinner)
+                for row in cowinners.tolist()]
+
+    def _cowinners_batch(self, batch: 'ProfileBatch') -> Union['np.ndarray', None]:
+        """Boolean array of shape `(n_elections, n_candidates)` indicating the cowinners of each election of the batch
+        (stored as an array), or None if the rule cannot count the batch with vectorized operations."""
+        return None
+
+    def _convert_profile(self, candidates: set = None) -> None:
+        """Compute :attr:`profile_converted_` and :attr:`candidates_` from :attr:`profile_original_`."""
+        if self.election_ is None:
+            self.profile_converted_ = self.profile_original_.convert(self.converter, candidates)
+        else:
+            self._election_converted = self.election_.converted(self.converter, candidates)
+            self.profile_converted_ = self._election_converted.profile_
         if candidates is None:
-            candidates = set().union(*[b.candidates for b in self.profile_converted_])
+            candidates = self.profile_converted_.candidates
         self.candidates_ = NiceSet(candidates)
         self._check_profile(candidates)
         self.delete_cache()
-        return self
 
     def _check_profile(self, candidates: set) -> None:
-        if any([b.candidates != candidates for b in self.profile_converted_]):
+        if not self.profile_converted_.ballots_have_candidates(candidates):
             logging.warning('Some ballots do not have the same set of candidates as the whole election.')
 
+    def _call_sub_object(self, x: object, candidates: set = None) -> object:
+        """Call a sub-object (e.g. a matrix) on :attr:`profile_converted_`, with the given candidates (by default,
+        they are inferred from the ballots). If the object itself was called on an :class:`Election`, the result is
+        shared with the other objects called on the election."""
+        if self.election_ is None:
+            return x(self.profile_converted_, candidates=candidates)
+        return self._election_converted.evaluate(x, candidates=candidates)
+
     @cached_property
     def n_candidates_(self) -> int:
         """int: Number of candidates.
@@ -117,7 +227,7 @@ class Rule(DeleteCacheMixin):
         # N.B.: it is recommended to override this method when it is possible to make computation cheaper.
         return self.order_[0]
 
-    @cached_property
+    @cached_property(depends_on=['cowinners_', 'tie_break'])
     def winner_(self) -> object:
         """object: The winner of the election. This is the first candidate in :attr:`strict_order_` and also the
         choice of the tie-breaking rule in :attr:`cowinners_`.
@@ -133,7 +243,7 @@ class Rule(DeleteCacheMixin):
         # N.B.: it is recommended to override this method when it is possible to make computation cheaper.
         return self.order_[-1]
 
-    @cached_property
+    @cached_property(depends_on=['cotrailers_', 'n_candidates_', 'winner_', 'tie_break'])
     def trailer_(self) -> object:
         """object: The "trailer" of the election. This is the last candidate in :attr:`strict_order_` and also the
         unfavorable choice of the tie-breaking rule in :attr:`cotrailers_`.
@@ -156,7 +266,7 @@ class Rule(DeleteCacheMixin):
         """
         raise NotImplementedError
 
-    @cached_property
+    @cached_property(depends_on=['order_', 'winner_', 'trailer_', 'tie_break'])
     def strict_order_(self) -> list:
         """list: Result of the election as a strict order over the candidates. The first element is the winner, etc.
         This may use the tie-breaking rule.
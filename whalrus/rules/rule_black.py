@@ -23,6 +23,7 @@ from whalrus.rules.rule import Rule
 from whalrus.rules.rule_condorcet import RuleCondorcet
 from whalrus.rules.rule_borda import RuleBorda
 from whalrus.rules.rule_sequential_tie_break import RuleSequentialTieBreak
+from whalrus.profiles.election import Election
 
 
 class RuleBlack(RuleSequentialTieBreak):
@@ -72,6 +73,15 @@ class RuleBlack(RuleSequentialTieBreak):
         self.rule_borda = rule_borda
         super().__init__(*args, rules=[rule_condorcet, rule_borda], **kwargs)
 
+    @cached_property
+    def rules_(self) -> list:
+        if self.election_ is not None:
+            return super().rules_
+        # The two rules are evaluated in a common election, so that they share the conversion of the ballots and, with
+        # the default options, the weighted majority matrix (cf. :class:`RuleBorda`).
+        election = Election._from_converted_profile(self.profile_converted_, self.converter)
+        return [election.evaluate(rule) for rule in self.rules]
+
     @cached_property
     def rule_condorcet_(self):
         """Rule: The Condorcet rule (once applied to the profile).
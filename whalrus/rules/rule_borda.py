@@ -23,6 +23,9 @@ from whalrus.scorers.scorer import Scorer
 from whalrus.scorers.scorer_borda import ScorerBorda
 from whalrus.converters_ballot.converter_ballot_to_order import ConverterBallotToOrder
 from whalrus.converters_ballot.converter_ballot import ConverterBallot
+from whalrus.matrices.matrix_weighted_majority import MatrixWeightedMajority
+from whalrus.utils.utils import cached_property, apply_numeric_policy_to_total, NiceDict, NiceSet
+from fractions import Fraction
 
 
 class RuleBorda(RuleScoreNumAverage):
@@ -47,6 +50,11 @@ class RuleBorda(RuleScoreNumAverage):
         {'a': Fraction(3, 2), 'b': Fraction(7, 2), 'c': 1}
         >>> rule.scores_
         {'a': Fraction(3, 4), 'b': Fraction(7, 4), 'c': Fraction(1, 2)}
+
+    With the default options of the scorer and the converter (and unless some weights are floats), the gross score of
+    a candidate is computed as the sum of her row in a weighted majority matrix, where unordered and absent candidates
+    are considered as tied below the ordered candidates. This is much faster than scoring each ballot, and the
+    matrix can be reused for subsets of the candidates (e.g. in :class:`RuleBaldwin` or :class:`RuleNanson`).
     """
 
     def __init__(self, *args, converter: ConverterBallot = None, scorer: Scorer = None, **kwargs):
@@ -55,3 +63,81 @@ class RuleBorda(RuleScoreNumAverage):
         if scorer is None:
             scorer = ScorerBorda()
         super().__init__(*args, converter=converter, scorer=scorer, **kwargs)
+
+    def _can_use_matrix(self) -> bool:
+        """Whether the gross scores can be computed with :attr:`_borda_matrix_`. It requires the default options, and
+        no float weights (the sums would be computed in another order)."""
+        scorer = self.scorer
+        return (type(scorer) is ScorerBorda and type(self.converter) is ConverterBallotToOrder
+                and scorer.absent_give_points is True and scorer.absent_receive_points is True
+                and scorer.unordered_give_points is True and scorer.unordered_receive_points is True
+                and not any(isinstance(weight, float) for weight in self.profile_converted_.weights))
+
+    @cached_property
+    def _borda_matrix_(self) -> MatrixWeightedMajority:
+        """MatrixWeightedMajority: The matrix whose row sums are the gross Borda scores. For a pair of candidates
+        (`c`, `d`), a voter gives 1 point if she prefers `c` to `d`, and 1 / 2 point if they are tied. Unordered
+        candidates are below the ordered ones, and absent candidates are below the unordered ones."""
+        if self.profile_converted_.ballots_have_candidates(self.candidates_):
+            # No candidate is absent, so the default matrix gives the same result (and it may be shared with other
+            # rules, e.g. in :class:`RuleBlack`).
+            matrix = MatrixWeightedMajority()
+        else:
+            matrix = MatrixWeightedMajority(ordered_vs_absent=1, absent_vs_ordered=0, unordered_vs_absent=1,
+                                            absent_vs_unordered=0, absent_vs_absent=Fraction(1, 2))
+        return self._call_sub_object(matrix, candidates=self.candidates_ if self._candidates_are_given else None)
+
+    @cached_property
+    def _gross_scores_and_weights_(self) -> dict:
+        if not self._can_use_matrix():
+            return super()._gross_scores_and_weights_
+        return self._gross_scores_and_weights_from_matrix(self._borda_matrix_, self.candidates_)
+
+    def _gross_scores_and_weights_from_matrix(self, matrix: MatrixWeightedMajority, candidates: set) -> dict:
+        """Gross scores and weights for the given candidates (a subset of the candidates of the matrix)."""
+        gross = matrix._gross_and_weights_['gross']
+        total_weight = apply_numeric_policy_to_total(sum(matrix.profile_converted_.weights))
+        return {'gross_scores': NiceDict({
+                    c: apply_numeric_policy_to_total(sum(gross[(c, d)] for d in candidates if d != c))
+                    for c in candidates}),
+                'weights': NiceDict({c: total_weight for c in candidates})}
+
+    def _load_restriction(self, rule: 'RuleBorda', candidates: set) -> 'RuleBorda':
+        """
+        Load the election of another Borda rule, restricted to a subset of its candidates.
+
+        This gives the same scores as calling this rule on the profile of `rule` with the given candidates, but the
+        ballots are not converted again: the scores are computed from the matrix of `rule`, which must be able to use
+        it (cf. :meth:`_can_use_matrix`). Hence the ballots of :attr:`profile_converted_` are not restricted to the
+        candidates.
+
+        Parameters
+        ----------
+        rule : RuleBorda
+            A Borda rule, already called on a profile.
+        candidates : set
+            A subset of the candidates of `rule`.
+
+        Returns
+        -------
+        RuleBorda
+            The rule itself.
+
+        Examples
+        --------
+            >>> rule = RuleBorda(['a > b > c > d', 'd > c > a > b'])
+            >>> RuleBorda()._load_restriction(rule, {'a', 'b', 'd'}).gross_scores_
+            {'a': 3, 'b': 1, 'd': 2}
+            >>> RuleBorda(['a > b > c > d', 'd > c > a > b'], candidates={'a', 'b', 'd'}).gross_scores_
+            {'a': 3, 'b': 1, 'd': 2}
+        """
+        self.election_ = rule.election_
+        self._election_converted = rule._election_converted
+        self.profile_original_ = rule.profile_original_
+        self.profile_converted_ = rule.profile_converted_
+        self.candidates_ = NiceSet(candidates)
+        self._candidates_are_given = True
+        self.delete_cache()
+        self._cached_properties['_gross_scores_and_weights_'] = self._gross_scores_and_weights_from_matrix(
+            rule._borda_matrix_, candidates)
+        return self
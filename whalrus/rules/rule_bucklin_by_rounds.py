@@ -21,7 +21,7 @@ along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
 from whalrus.scorers.scorer_bucklin import ScorerBucklin
 from whalrus.rules.rule_score_num import RuleScoreNum
 from whalrus.converters_ballot.converter_ballot_to_order import ConverterBallotToOrder
-from whalrus.utils.utils import cached_property, NiceDict, my_division
+from whalrus.utils.utils import cached_property, NiceDict, my_division, get_numeric_policy
 from whalrus.converters_ballot.converter_ballot import ConverterBallot
 from fractions import Fraction
 
@@ -77,17 +77,73 @@ class RuleBucklinByRounds(RuleScoreNum):
     def detailed_scores_(self) -> list:
         """list: Detailed scores. A list of :class:`NiceDict`. The first dictionary gives the scores of the first round,
         etc.
+
+        With a :class:`ScorerBucklin` (and no float weights), the ballots are read only once: for each candidate and
+        each rank, we compute the points that she receives at this rank (a fraction of the weight of the ballot if she
+        is tied with other candidates), then the scores of each round are given by cumulative sums.
         """
+        if type(self.scorer) is not ScorerBucklin or any(
+                isinstance(weight, float) for weight in self.profile_converted_.weights):
+            return self._detailed_scores_ballot_by_ballot()
+        n_candidates = len(self.candidates_)
+        unordered_receive_points = self.scorer.unordered_receive_points
+        absent_receive_points = self.scorer.absent_receive_points
+        # slopes[c][k] - slopes[c][k - 1] is the change in the points received by `c` at rank `k`.
+        slopes = {c: [0] * (n_candidates + 2) for c in self.candidates_}
+        weights = NiceDict({c: 0 for c in self.candidates_})
+        # Unless the policy is 'float', the points are exact, so that the gross scores are exact.
+        exact_points = get_numeric_policy() != 'float'
+        for ballot, weight, _ in self.profile_converted_.items():
+            unordered = ballot.candidates_not_in_b
+            absent = self.candidates_ - ballot.candidates
+            indifference_classes = list(ballot.as_weak_order)
+            counted = set(ballot.candidates_in_b)
+            if unordered_receive_points is not None:
+                counted |= unordered
+                if unordered_receive_points:
+                    indifference_classes.append(unordered)
+            if absent_receive_points is not None:
+                counted |= absent
+                if absent_receive_points:
+                    indifference_classes.append(absent)
+            for c in counted:
+                weights[c] += weight
+            rank = 0
+            for indifference_class in indifference_classes:
+                n_indifference = len(indifference_class)
+                if n_indifference == 0:
+                    continue
+                if n_indifference == 1:
+                    points = weight
+                else:
+                    points = Fraction(weight, n_indifference) if exact_points else my_division(weight, n_indifference)
+                for c in indifference_class:
+                    slopes[c][rank + 1] += points
+                    slopes[c][rank + n_indifference + 1] -= points
+                rank += n_indifference
+        detailed_scores = []
+        points = {c: 0 for c in self.candidates_}
+        gross_scores = {c: 0 for c in self.candidates_}
+        for k in range(1, n_candidates + 1):
+            for c in self.candidates_:
+                points[c] += slopes[c][k]
+                gross_scores[c] += points[c]
+            scores = NiceDict({c: my_division(score, weights[c], divide_by_zero=0)
+                               for c, score in gross_scores.items()})
+            detailed_scores.append(scores)
+            if max(scores.values()) > Fraction(1, 2):
+                break
+        return detailed_scores
+
+    def _detailed_scores_ballot_by_ballot(self) -> list:
+        """Compute :attr:`detailed_scores_` by calling the scorer on each ballot, for each round."""
         n_candidates = len(self.candidates_)
         detailed_scores = []
         for k in range(1, n_candidates + 1):
             self.scorer.k = k
-            gross_scores = NiceDict({c: 0 for c in self.candidates_})
-            weights = NiceDict({c: 0 for c in self.candidates_})
-            for ballot, weight, voter in self.profile_converted_.items():
-                for c, value in self.scorer(ballot=ballot, voter=voter, candidates=self.candidates_).scores_.items():
-                    gross_scores[c] += weight * value
-                    weights[c] += weight
+            gross_scores_and_weights = self.scorer.score_profile(self.profile_converted_, self.candidates_)
+            gross_scores = gross_scores_and_weights['gross_scores']
+            weights = gross_scores_and_weights['weights']
             scores = NiceDict({c: my_division(score, weights[c], divide_by_zero=0)
                                for c, score in gross_scores.items()})
             detailed_scores.append(scores)
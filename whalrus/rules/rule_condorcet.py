@@ -18,12 +18,15 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
 """
+import numpy as np
 from whalrus.rules.rule import Rule
 from whalrus.converters_ballot.converter_ballot_to_order import ConverterBallotToOrder
 from whalrus.utils.utils import cached_property, NiceSet
 from whalrus.converters_ballot.converter_ballot import ConverterBallot
 from whalrus.matrices.matrix import Matrix
 from whalrus.matrices.matrix_majority import MatrixMajority
+from whalrus.profiles.profile_batch import ProfileBatch
+from typing import Union
 
 
 class RuleCondorcet(Rule):
@@ -65,6 +68,8 @@ class RuleCondorcet(Rule):
         [{'a', 'b'}, {'c'}]
     """
 
+    _incremental_sub_objects = ('matrix_majority_',)
+
     def __init__(self, *args, converter: ConverterBallot = None, matrix_majority: Matrix = None, **kwargs):
         if converter is None:
             converter = ConverterBallotToOrder()
@@ -77,12 +82,24 @@ class RuleCondorcet(Rule):
     def matrix_majority_(self):
         """Matrix: The majority matrix (once computed with the given profile).
         """
-        return self.matrix_majority(self.profile_converted_)
+        return self._call_sub_object(self.matrix_majority)
 
     @cached_property
     def order_(self) -> list:
-        matrix = self.matrix_majority_
-        condorcet_winners = {c for c in matrix.candidates_
-                             if min({v for (i, j), v in matrix.as_dict_.items() if i == c and j != c}) == 1}
+        condorcet_winners = self.matrix_majority_.beats_all(1)
         other_candidates = self.candidates_ - condorcet_winners
         return [NiceSet(tie_class) for tie_class in [condorcet_winners, other_candidates] if tie_class]
+
+    def _cowinners_batch(self, batch: ProfileBatch) -> Union[np.ndarray, None]:
+        if (type(self.converter) is not ConverterBallotToOrder or type(self.matrix_majority) is not MatrixMajority
+                or not batch.same_candidates or batch.n_candidates < 2):
+            return None
+        values_and_scale = self.matrix_majority._batch_values(batch)
+        if values_and_scale is None:
+            return None
+        values, scale = values_and_scale
+        off_diagonal = ~np.eye(batch.n_candidates, dtype=bool)
+        condorcet_winners = np.all((values == scale) | ~off_diagonal, axis=2)
+        # If there is no Condorcet winner, all candidates are tied.
+        condorcet_winners[~condorcet_winners.any(axis=1)] = True
+        return condorcet_winners
@@ -18,12 +18,16 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
 """
+import numpy as np
 from whalrus.rules.rule_score_num_row_sum import RuleScoreNumRowSum
+from whalrus.rules.rule_score_num import _best
 from whalrus.converters_ballot.converter_ballot_to_order import ConverterBallotToOrder
 from whalrus.utils.utils import cached_property
 from whalrus.converters_ballot.converter_ballot import ConverterBallot
 from whalrus.matrices.matrix import Matrix
 from whalrus.matrices.matrix_majority import MatrixMajority
+from whalrus.profiles.profile_batch import ProfileBatch
+from typing import Union
 
 
 class RuleCopeland(RuleScoreNumRowSum):
@@ -74,3 +78,14 @@ class RuleCopeland(RuleScoreNumRowSum):
                    [0, 0, Fraction(1, 2)]], dtype=object)
         """
         return self.matrix_
+
+    def _cowinners_batch(self, batch: ProfileBatch) -> Union[np.ndarray, None]:
+        if (type(self.converter) is not ConverterBallotToOrder or type(self.matrix) is not MatrixMajority
+                or not batch.same_candidates):
+            return None
+        values_and_scale = self.matrix._batch_values(batch)
+        if values_and_scale is None:
+            return None
+        values, _ = values_and_scale
+        values[:, np.eye(batch.n_candidates, dtype=bool)] = 0
+        return _best(values.sum(axis=2))
@@ -21,6 +21,13 @@ along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
 from whalrus.utils.utils import cached_property
 from whalrus.rules.rule import Rule
 from whalrus.rules.rule_plurality import RulePlurality
+from whalrus.rules.rule_veto import RuleVeto
+from whalrus.rules.rule_borda import RuleBorda
+from whalrus.scorers.scorer_plurality import ScorerPlurality
+from whalrus.scorers.scorer_veto import ScorerVeto
+from whalrus.converters_ballot.converter_ballot_to_plurality import ConverterBallotToPlurality
+from whalrus.converters_ballot.converter_ballot_to_veto import ConverterBallotToVeto
+from whalrus.profiles.profile import Profile
 from whalrus.priorities.priority import Priority
 from whalrus.eliminations.elimination import Elimination
 from whalrus.eliminations.elimination_last import EliminationLast
@@ -106,8 +113,27 @@ class RuleIteratedElimination(Rule):
 
         >>> rule.strict_order_
         ['a', 'c', 'b', 'd', 'e']
+
+    When the base rule is :class:`RulePlurality` or :class:`RuleVeto` (as in :class:`RuleIRV` or
+    :class:`RuleCoombs`), with their default scorers and converters with deterministic priorities, the ballots are not
+    converted again at each round: only the ballots of the eliminated candidates are transferred. The results are the
+    same, but the base rule of each round after the first one is computed on a compressed profile, with one ballot
+    per candidate:
+
+        >>> irv = RuleIteratedElimination(['a > b > c', 'b > a > c', 'c > a > b', 'c > b > a'],
+        ...                               weights=[2, 3, 2, 2], base_rule=RulePlurality())
+        >>> print(irv.eliminations_[1].rule_.profile_original_)
+        (5): b
+        (4): c
+
+    Similarly, when the base rule is :class:`RuleBorda` with its default options (as in :class:`RuleBaldwin` or
+    :class:`RuleNanson`), the gross scores of each round are computed from the matrix of the first round (cf.
+    :class:`RuleBorda`), restricted to the remaining candidates.
     """
 
+    # The tie-breaking rule may be propagated to the rounds, so it may affect all the cached properties.
+    _explicit_parameters = frozenset()
+
     def __init__(self, *args, base_rule: Rule = None, elimination: Elimination = None, propagate_tie_break=True,
                  **kwargs):
         if elimination is None:
@@ -130,17 +156,66 @@ class RuleIteratedElimination(Rule):
         self.base_rule.delete_cache()
         eliminations = []
         candidates = self.candidates_
+        # For each candidate (or None for abstention), the indexes of the ballots that currently vote for her, and their
+        # total weight.
+        ballots_by_candidate = None
+        weight_by_candidate = None
+        ballot_class = None
+        weights = self.profile_converted_.weights
+        # Borda rule of the first round, whose matrix is used for the next rounds.
+        borda_rule = None
         while candidates:
             elimination = deepcopy(self.elimination)
             rule = deepcopy(self.base_rule)
             if self.propagate_tie_break:
                 rule.tie_break = self.tie_break
-            rule(ballots=self.profile_converted_, candidates=candidates)
+            if ballots_by_candidate is not None:
+                # An abstention has no candidates (otherwise, it would be restricted to a vote for a candidate).
+                rule(ballots=Profile([ballot_class(c, candidates=candidates if c is not None else set())
+                                      for c in ballots_by_candidate],
+                                     weights=[weight_by_candidate[c] for c in ballots_by_candidate]),
+                     candidates=candidates)
+            elif borda_rule is not None:
+                rule._load_restriction(borda_rule, candidates)
+            else:
+                # With a frozenset, the restriction cache of the ballots does not hash the candidates for each ballot.
+                rule(ballots=self.profile_converted_, candidates=frozenset(candidates))
+                if self._can_transfer_ballots():
+                    ballots_by_candidate, weight_by_candidate = dict(), dict()
+                    for i, (ballot, weight) in enumerate(zip(rule.profile_converted_, weights)):
+                        ballots_by_candidate.setdefault(ballot.candidate, []).append(i)
+                        weight_by_candidate[ballot.candidate] = weight_by_candidate.get(ballot.candidate, 0) + weight
+                        ballot_class = type(ballot)
+                elif type(rule) is RuleBorda and rule._can_use_matrix():
+                    borda_rule = rule
             elimination(rule=rule)
             eliminations.append(elimination)
             candidates = elimination.qualified_
+            if ballots_by_candidate is not None:
+                frozen_candidates = frozenset(candidates)
+                for c in elimination.eliminated_:
+                    weight_by_candidate.pop(c, None)
+                    for i in ballots_by_candidate.pop(c, []):
+                        new_candidate = rule.converter(self.profile_converted_[i], frozen_candidates).candidate
+                        ballots_by_candidate.setdefault(new_candidate, []).append(i)
+                        weight_by_candidate[new_candidate] = weight_by_candidate.get(new_candidate, 0) + weights[i]
         return eliminations
 
+    def _can_transfer_ballots(self) -> bool:
+        """Whether the rounds can be computed by transferring only the ballots of the eliminated candidates (cf.
+        :attr:`eliminations_`). This requires that the converted ballot of a voter does not change as long as her
+        candidate is not eliminated."""
+        if type(self.base_rule) is RulePlurality:
+            scorer_class, converter_class = ScorerPlurality, ConverterBallotToPlurality
+        elif type(self.base_rule) is RuleVeto:
+            scorer_class, converter_class = ScorerVeto, ConverterBallotToVeto
+        else:
+            return False
+        if type(self.base_rule.scorer) is not scorer_class or type(self.base_rule.converter) is not converter_class:
+            return False
+        deterministic = [Priority.UNAMBIGUOUS, Priority.ASCENDING, Priority.DESCENDING]
+        return all(any(priority is p for p in deterministic) for priority in vars(self.base_rule.converter).values())
+
     @cached_property
     def order_(self) -> list:
         return list(chain(*[elimination.eliminated_order_ for elimination in self.eliminations_[::-1]]))
@@ -26,6 +26,9 @@ from whalrus.rules.rule_score import RuleScore
 from whalrus.converters_ballot.converter_ballot_to_levels import ConverterBallotToLevels
 from whalrus.utils.utils import cached_property, NiceDict, my_division
 from whalrus.converters_ballot.converter_ballot import ConverterBallot
+from whalrus.tallies.tally_levels import TallyLevels
+from whalrus.ballots.ballot import Ballot
+from numbers import Number
 
 
 class RuleMajorityJudgment(RuleScore):
@@ -97,35 +100,50 @@ class RuleMajorityJudgment(RuleScore):
         self.default_median = default_median
         super().__init__(*args, converter=converter, **kwargs)
 
+    @cached_property
+    def tally_(self) -> TallyLevels:
+        """TallyLevels: For each candidate, the histogram of the levels given by the ballots (weighted). Cf.
+        :meth:`load_tally`.
+        """
+        tally = TallyLevels(scale=self.scorer.scale)
+        for ballot, weight, voter in self.profile_converted_.items():
+            tally.add(self.scorer(ballot=ballot, voter=voter, candidates=self.candidates_).scores_, weight=weight)
+        return tally
+
+    def _load_tally(self, tally: TallyLevels) -> None:
+        self._cached_properties['tally_'] = TallyLevels.from_dict(tally.to_dict(), scale=self.scorer.scale)
+
+    def _update_ballot(self, i: int, ballot_removed: Ballot, ballot_added: Ballot, weight: Number,
+                       voter: object) -> None:
+        # Update the histograms by the contribution of the ballot, instead of counting the whole profile again.
+        try:
+            tally = self._cached_properties['tally_'].copy()
+        except KeyError:
+            # Nothing has been computed yet.
+            self.delete_cache()
+            return
+        if ballot_removed is not None:
+            tally.remove(self.scorer(ballot=ballot_removed, voter=voter, candidates=self.candidates_).scores_,
+                         weight=weight)
+        if ballot_added is not None:
+            tally.add(self.scorer(ballot=ballot_added, voter=voter, candidates=self.candidates_).scores_,
+                      weight=weight)
+        self.delete_cache()
+        self._cached_properties['tally_'] = tally
+
     @cached_property
     def scores_(self) -> NiceDict:
         """NiceDict: The scores. A :class:`NiceDict` of triples.
         """
-        levels_ = NiceDict({c: [] for c in self.candidates_})
-        weights_ = NiceDict({c: [] for c in self.candidates_})
-        for ballot, weight, voter in self.profile_converted_.items():
-            for c, level in self.scorer(ballot=ballot, voter=voter, candidates=self.candidates_).scores_.items():
-                levels_[c].append(level)
-                weights_[c].append(weight)
         scores_ = NiceDict()
         for c in self.candidates_:
-            if not levels_[c]:
+            if self.tally_.n_ballots(c) == 0:
                 scores_[c] = (self.default_median, 0, 0)
                 continue
-            indexes = self.scorer.scale.argsort(levels_[c])
-            levels_[c] = [levels_[c][i] for i in indexes]
-            weights_[c] = [weights_[c][i] for i in indexes]
-            total_weight = sum(weights_[c])
-            half_total_weight = my_division(total_weight, 2)
-            cumulative_weight = 0
-            median = None
-            for i, weight in enumerate(weights_[c]):
-                cumulative_weight += weight
-                if cumulative_weight >= half_total_weight:
-                    median = levels_[c][i]
-                    break
-            p = sum([weights_[c][i] for i, level in enumerate(levels_[c]) if self.scorer.scale.gt(level, median)])
-            q = sum([weights_[c][i] for i, level in enumerate(levels_[c]) if self.scorer.scale.lt(level, median)])
+            median = self.tally_.median(c)
+            total_weight = self.tally_.total_weight(c)
+            p = self.tally_.weight_above(c, median)
+            q = self.tally_.weight_below(c, median)
             if p > q:
                 scores_[c] = (median, my_division(p, total_weight), -my_division(q, total_weight))
             else:
@@ -18,12 +18,15 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
 """
-from whalrus.rules.rule_score_num import RuleScoreNum
+import numpy as np
+from whalrus.rules.rule_score_num import RuleScoreNum, _best
 from whalrus.converters_ballot.converter_ballot_to_order import ConverterBallotToOrder
 from whalrus.utils.utils import cached_property, NiceDict
 from whalrus.converters_ballot.converter_ballot import ConverterBallot
 from whalrus.matrices.matrix import Matrix
 from whalrus.matrices.matrix_weighted_majority import MatrixWeightedMajority
+from whalrus.profiles.profile_batch import ProfileBatch
+from typing import Union
 
 
 class RuleMaximin(RuleScoreNum):
@@ -56,6 +59,8 @@ class RuleMaximin(RuleScoreNum):
         'a'
     """
 
+    _incremental_sub_objects = ('matrix_weighted_majority_',)
+
     def __init__(self, *args, converter: ConverterBallot = None, matrix_weighted_majority: Matrix = None, **kwargs):
         if converter is None:
             converter = ConverterBallotToOrder()
@@ -68,10 +73,19 @@ class RuleMaximin(RuleScoreNum):
     def matrix_weighted_majority_(self):
         """Matrix: The weighted majority matrix (once computed with the given profile).
         """
-        return self.matrix_weighted_majority(self.profile_converted_)
+        return self._call_sub_object(self.matrix_weighted_majority)
 
     @cached_property
     def scores_(self) -> NiceDict:
-        matrix = self.matrix_weighted_majority_
-        return NiceDict({c: min({v for (i, j), v in matrix.as_dict_.items() if i == c and j != c})
-                         for c in matrix.candidates_})
+        return NiceDict(self.matrix_weighted_majority_.row_mins_)
+
+    def _cowinners_batch(self, batch: ProfileBatch) -> Union[np.ndarray, None]:
+        if (type(self.converter) is not ConverterBallotToOrder
+                or type(self.matrix_weighted_majority) is not MatrixWeightedMajority
+                or not batch.same_candidates or batch.n_candidates < 2):
+            return None
+        weighted = self.matrix_weighted_majority._batch_comparable_values(batch)
+        if weighted is None:
+            return None
+        off_diagonal = ~np.eye(batch.n_candidates, dtype=bool)
+        return _best(np.where(off_diagonal, weighted, np.iinfo(weighted.dtype).max).min(axis=2))
@@ -22,8 +22,53 @@ from whalrus.rules.rule import Rule
 from whalrus.converters_ballot.converter_ballot_to_order import ConverterBallotToOrder
 from whalrus.utils.utils import cached_property, NiceSet
 from whalrus.converters_ballot.converter_ballot import ConverterBallot
+from typing import Union
 from whalrus.matrices.matrix import Matrix
-from whalrus.matrices.matrix_schulze import MatrixSchulze
+from whalrus.matrices.matrix_schulze import MatrixSchulze, _widest_paths
+from whalrus.profiles.profile_batch import ProfileBatch
+import numpy as np
+
+
+def _smith_set(weights: np.ndarray) -> Union[list, None]:
+    """
+    Smith set of a complementary weighted majority matrix.
+
+    Parameters
+    ----------
+    weights : np.ndarray
+        A square matrix `W`. It must be complementary, i.e. `W(c, d) + W(d, c)` is the same constant `T` for all
+        distinct candidates `c` and `d` (the diagonal is not used).
+
+    Returns
+    -------
+    list or None
+        The indexes of the candidates in the Smith set, i.e. the smallest non-empty set of candidates who beat all the
+        other candidates (`W(c, d) > T / 2`). If the matrix is not complementary, return None.
+
+    Examples
+    --------
+        >>> _smith_set(np.array([[0, 2, 3, 3], [1, 0, 2, 3], [0, 1, 0, 1], [0, 0, 2, 0]]))
+        [0]
+        >>> _smith_set(np.array([[0, 2, 1, 3], [1, 0, 2, 3], [2, 1, 0, 2], [0, 0, 1, 0]]))
+        [0, 1, 2]
+        >>> print(_smith_set(np.array([[0, 2, 1], [0, 0, 1], [0, 1, 0]])))
+        None
+    """
+    n = weights.shape[0]
+    off_diagonal = ~np.eye(n, dtype=bool)
+    sums = (weights + weights.T)[off_diagonal]
+    if n > 1 and not np.all(sums == sums[0]):
+        return None
+    # Weak majority relation. Since it is complete, the Smith set is its top strongly connected component, which is
+    # the shortest prefix of the candidates (sorted by number of weak victories) that no other candidate weakly beats.
+    weak = np.asarray(weights >= weights.T, dtype=bool) & off_diagonal
+    order = np.argsort(-weak.sum(axis=1), kind='stable')
+    weak = weak[np.ix_(order, order)]
+    # For each candidate (in this order), the first candidate that it weakly beats.
+    first_weak_victory = np.where(weak.any(axis=1), weak.argmax(axis=1), n)
+    suffix_min = np.minimum.accumulate(first_weak_victory[::-1])[::-1]
+    k = next(k for k in range(1, n + 1) if k == n or suffix_min[k] >= k)
+    return sorted(order[:k].tolist())
 
 
 class RuleSchulze(Rule):
@@ -54,6 +99,8 @@ class RuleSchulze(Rule):
         'a'
     """
 
+    _incremental_sub_objects = ('matrix_schulze_',)
+
     def __init__(self, *args, converter: ConverterBallot = None, matrix_schulze: Matrix = None, **kwargs):
         if converter is None:
             converter = ConverterBallotToOrder()
@@ -66,7 +113,38 @@ class RuleSchulze(Rule):
     def matrix_schulze_(self):
         """Matrix: The Schulze matrix (once computed with the given profile).
         """
-        return self.matrix_schulze(self.profile_converted_)
+        return self._call_sub_object(self.matrix_schulze)
+
+    @cached_property
+    def cowinners_(self) -> NiceSet:
+        """NiceSet: Cowinners of the election.
+
+        When the weighted majority matrix is complementary (e.g. with the default parameters of
+        :class:`MatrixWeightedMajority` and complete ballots), the Schulze winners are in the Smith set, and the widest
+        paths between them stay in the Smith set. Hence the Schulze matrix is only computed on the Smith set, which is
+        usually much smaller than the set of candidates. The full Schulze matrix is computed only if needed, e.g. for
+        :attr:`order_`.
+
+        Examples
+        --------
+            >>> rule = RuleSchulze(['a > b > c > d', 'b > c > a > d', 'c > a > b > d'])
+            >>> rule.cowinners_
+            {'a', 'b', 'c'}
+            >>> 'as_array_' in rule.matrix_schulze_._cached_properties
+            False
+        """
+        matrix = self.matrix_schulze_
+        if not isinstance(matrix, MatrixSchulze) or 'as_array_' in matrix._cached_properties:
+            return self.order_[0]
+        weights = matrix.matrix_weighted_majority_.as_array_
+        smith_set = _smith_set(weights)
+        if smith_set is None:
+            return self.order_[0]
+        widest_path = _widest_paths(weights[np.ix_(smith_set, smith_set)])
+        defeated = np.asarray(widest_path.T > widest_path, dtype=bool).any(axis=1)
+        # Candidates that are not in the matrix are never defeated (as in :attr:`order_`).
+        return NiceSet([matrix.candidates_as_list_[i] for i, d in zip(smith_set, defeated) if not d]
+                       + [c for c in self.candidates_ if c not in matrix.candidates_indexes_])
 
     @cached_property
     def order_(self) -> list:
@@ -80,3 +158,12 @@ class RuleSchulze(Rule):
             to_sort = losers
             victories = {(c, d) for (c, d) in victories if c in to_sort and d in to_sort}
         return result
+
+    def _cowinners_batch(self, batch: ProfileBatch) -> Union[np.ndarray, None]:
+        if (type(self.converter) is not ConverterBallotToOrder or type(self.matrix_schulze) is not MatrixSchulze
+                or not batch.same_candidates):
+            return None
+        widest_path = self.matrix_schulze._batch_comparable_values(batch)
+        if widest_path is None:
+            return None
+        return ~np.any(np.swapaxes(widest_path, 1, 2) > widest_path, axis=2)
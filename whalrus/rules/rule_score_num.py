@@ -21,6 +21,33 @@ along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
 from whalrus.rules.rule_score import RuleScore
 from whalrus.utils.utils import cached_property, NiceDict, NiceSet, my_division
 from numbers import Number
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def _best(scores: 'np.ndarray') -> 'np.ndarray':
+    """
+    Best scores in each row.
+
+    Parameters
+    ----------
+    scores : np.ndarray
+        A 2d array. Each row contains the scores of the candidates in an election.
+
+    Returns
+    -------
+    np.ndarray
+        A boolean array of the same shape, indicating the best scores in each row.
+
+    Examples
+    --------
+        >>> import numpy as np
+        >>> _best(np.array([[1, 3, 3], [2, 0, 1]]))
+        array([[False,  True,  True],
+               [ True, False, False]])
+    """
+    return scores == scores.max(axis=1, keepdims=True)
 
 
 class RuleScoreNum(RuleScore):
@@ -18,10 +18,20 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
 """
-from whalrus.rules.rule_score_num import RuleScoreNum
+from whalrus.rules.rule_score_num import RuleScoreNum, _best
 from whalrus.scorers.scorer import Scorer
-from whalrus.utils.utils import cached_property, NiceDict, my_division
+from whalrus.ballots.ballot import Ballot
+from whalrus.tallies.tally_scores import TallyScores
+from whalrus.profiles.profile import Profile
+from whalrus.utils.utils import cached_property, NiceDict, NiceSet, my_division, convert_number, \
+    get_numeric_policy, numeric_policy
 from numbers import Number
+from fractions import Fraction
+from typing import Union, TYPE_CHECKING
+if TYPE_CHECKING:
+    # Imported on demand, by the method that counts a batch of elections.
+    import numpy as np
+    from whalrus.profiles.profile_batch import ProfileBatch
 
 
 class RuleScoreNumAverage(RuleScoreNum):
@@ -44,6 +54,18 @@ class RuleScoreNumAverage(RuleScoreNum):
     Examples
     --------
     Cf. :class:`RuleRangeVoting` for some examples.
+
+    When the candidates are given, the tallies are updated incrementally when a ballot is added, removed or replaced
+    (cf. :meth:`add_ballot`), instead of being computed again from the whole profile:
+
+        >>> from whalrus.rules.rule_borda import RuleBorda
+        >>> rule = RuleBorda(['a > b > c', 'b > a > c'], candidates={'a', 'b', 'c'})
+        >>> rule.gross_scores_
+        {'a': 3, 'b': 3, 'c': 0}
+        >>> rule.add_ballot('a > c > b').gross_scores_
+        {'a': 5, 'b': 3, 'c': 1}
+        >>> rule.remove_ballot('b > a > c').winner_
+        'a'
     """
 
     def __init__(self, *args, scorer: Scorer = None, default_average: Number = 0, **kwargs):
@@ -53,13 +75,83 @@ class RuleScoreNumAverage(RuleScoreNum):
 
     @cached_property
     def _gross_scores_and_weights_(self) -> dict:
-        gross_scores = NiceDict({c: 0 for c in self.candidates_})
-        weights = NiceDict({c: 0 for c in self.candidates_})
-        for ballot, weight, voter in self.profile_converted_.items():
-            for c, value in self.scorer(ballot=ballot, voter=voter, candidates=self.candidates_).scores_.items():
-                gross_scores[c] += weight * value
-                weights[c] += weight
-        return {'gross_scores': gross_scores, 'weights': weights}
+        return self.scorer.score_profile(self.profile_converted_, self.candidates_)
+
+    def _update_ballot(self, i: int, ballot_removed: Ballot, ballot_added: Ballot, weight: Number,
+                       voter: object) -> None:
+        # Update the tallies by the contribution of the ballots, so that the scores are computed in O(n_candidates).
+        try:
+            gross_scores_and_weights = self._cached_properties['_gross_scores_and_weights_']
+        except KeyError:
+            # Nothing has been computed yet.
+            self.delete_cache()
+            return
+        gross_scores = NiceDict(gross_scores_and_weights['gross_scores'])
+        weights = NiceDict(gross_scores_and_weights['weights'])
+        # The contributions are totals, computed with the policy of the rule (hence exactly with ``'integer'``).
+        with numeric_policy(self.numeric_policy_):
+            if ballot_removed is not None:
+                contribution = self.scorer.score_profile(Profile([ballot_removed], weights=[weight], voters=[voter]),
+                                                         self.candidates_)
+                for c, value in contribution['gross_scores'].items():
+                    gross_scores[c] -= value
+                    weights[c] -= contribution['weights'][c]
+            if ballot_added is not None:
+                contribution = self.scorer.score_profile(Profile([ballot_added], weights=[weight], voters=[voter]),
+                                                         self.candidates_)
+                for c, value in contribution['gross_scores'].items():
+                    gross_scores[c] += value
+                    weights[c] += contribution['weights'][c]
+        self.delete_cache()
+        self._cached_properties['_gross_scores_and_weights_'] = {'gross_scores': gross_scores, 'weights': weights}
+
+    def _cowinners_batch(self, batch: 'ProfileBatch') -> Union['np.ndarray', None]:
+        """Each distinct ballot of the batch is converted and scored only once. Then the gross scores and weights of
+        all the elections are computed with vectorized sums (as integers, after scaling the scores)."""
+        import numpy as np
+        from whalrus.profiles.profile_array import ProfileArray
+        from whalrus.matrices.matrix_weighted_majority import _lcm
+        if type(self).scores_ is not RuleScoreNumAverage.scores_:
+            return None
+        rows, inverse = batch.unique_
+        candidates = NiceSet(batch.candidates_as_list)
+        distinct_ballots = ProfileArray._from_arrays(rows, batch.candidates_as_list,
+                                                     np.ones(rows.shape[0], dtype=np.int64), None)
+        scores_of_rows = [self.scorer(ballot=self.converter(ballot, candidates=batch.candidates),
+                                      candidates=candidates).scores_ for ballot in distinct_ballots]
+        values = [value for scores in scores_of_rows for value in scores.values()]
+        if any(isinstance(value, float) for value in values):
+            return None
+        scale = _lcm([Fraction(value).denominator for value in values])
+        if (max(abs(value) for value in values) if values else 0) * scale * np.abs(batch.weights).sum() >= 2 ** 62:
+            return None
+        gross_of_rows = np.array([[int(scores.get(c, 0) * scale) for c in batch.candidates_as_list]
+                                  for scores in scores_of_rows], dtype=np.int64).reshape(rows.shape)
+        scored_of_rows = np.array([[c in scores for c in batch.candidates_as_list]
+                                   for scores in scores_of_rows], dtype=np.int64).reshape(rows.shape)
+        shape = (batch.n_candidates, )
+        gross = batch.weighted_sums(lambda r: gross_of_rows[inverse[r]], shape=shape)
+        weights = batch.weighted_sums(lambda r: scored_of_rows[inverse[r]], shape=shape)
+        cowinners = _best(gross)
+        # When the weights are not the same for all candidates (or are 0), compute the averages exactly.
+        for e in np.flatnonzero(np.any(weights != weights[:, :1], axis=1) | (weights[:, 0] <= 0)):
+            scores = np.array([my_division(convert_number(Fraction(int(g), scale)), int(w),
+                                           divide_by_zero=self.default_average)
+                               for g, w in zip(gross[e], weights[e])], dtype=object)
+            cowinners[e] = scores == max(scores)
+        return cowinners
+
+    @cached_property
+    def tally_(self) -> TallyScores:
+        """TallyScores: The tally of the election, made of :attr:`gross_scores_` and :attr:`weights_`. Cf.
+        :meth:`load_tally`.
+        """
+        return TallyScores(gross_scores=self.gross_scores_, weights=self.weights_)
+
+    def _load_tally(self, tally: TallyScores) -> None:
+        self._cached_properties['_gross_scores_and_weights_'] = {
+            'gross_scores': NiceDict({c: tally.gross_scores.get(c, 0) for c in self.candidates_}),
+            'weights': NiceDict({c: tally.weights.get(c, 0) for c in self.candidates_})}
 
     @cached_property
     def gross_scores_(self) -> NiceDict:
@@ -82,6 +174,19 @@ class RuleScoreNumAverage(RuleScoreNum):
         return NiceDict({c: my_division(score, self.weights_[c], divide_by_zero=self.default_average)
                          for c, score in self.gross_scores_.items()})
 
+    @cached_property
+    def average_score_(self) -> Number:
+        """Number: The average score. With the numeric policy ``'integer'``, it is computed from the exact scores
+        (cf. :func:`numeric_policy`).
+        """
+        if get_numeric_policy() != 'integer':
+            return my_division(sum(self.scores_.values()), self.n_candidates_)
+        gross_scores, weights = self.gross_scores_, self.weights_
+        with numeric_policy('exact'):
+            total = sum(my_division(score, weights[c], divide_by_zero=self.default_average)
+                        for c, score in gross_scores.items())
+        return my_division(total, self.n_candidates_)
+
     # Conversion to floats
     # --------------------
 
@@ -41,6 +41,8 @@ class RuleScoreNumRowSum(RuleScoreNum):
         Cf. parent class.
     """
 
+    _incremental_sub_objects = ('matrix_',)
+
     def __init__(self, *args, matrix: Matrix = None, **kwargs):
         self.matrix = matrix
         super().__init__(*args, **kwargs)
@@ -49,10 +51,8 @@ class RuleScoreNumRowSum(RuleScoreNum):
     def matrix_(self):
         """Matrix: The matrix (once computed with the given profile).
         """
-        return self.matrix(self.profile_converted_)
+        return self._call_sub_object(self.matrix)
 
     @cached_property
     def scores_(self) -> NiceDict:
-        m = self.matrix_
-        return NiceDict({c: sum([v for (i, j), v in m.as_dict_.items() if i == c and j != c])
-                         for c in m.candidates_})
+        return NiceDict(self.matrix_.row_sums_)
@@ -89,6 +89,9 @@ class RuleSequentialElimination(Rule):
         {'a': 2, 'b': 1, 'c': 0}
     """
 
+    # The tie-breaking rule may be propagated to the rounds, so it may affect all the cached properties.
+    _explicit_parameters = frozenset()
+
     def __init__(self, *args, rules: Union[list, Rule] = None, eliminations: Union[list, Elimination] = None,
                  propagate_tie_break=True, **kwargs):
         # Default values
@@ -144,7 +147,7 @@ class RuleSequentialElimination(Rule):
             rule = self.rules[i]
             if self.propagate_tie_break:
                 rule.tie_break = self.tie_break
-            rule(ballots=self.profile_converted_, candidates=candidates)
+            rule(ballots=self.profile_converted_, candidates=frozenset(candidates))
             elimination(rule=rule)
             candidates = elimination.qualified_
             if candidates:
@@ -156,7 +159,7 @@ class RuleSequentialElimination(Rule):
             rule = self.rules[-1]
             if self.propagate_tie_break:
                 rule.tie_break = self.tie_break
-            rule(ballots=self.profile_converted_, candidates=candidates)
+            rule(ballots=self.profile_converted_, candidates=frozenset(candidates))
             rounds.append(rule)
         return rounds
 
@@ -65,7 +65,7 @@ class RuleSequentialTieBreak(Rule):
     def rules_(self) -> list:
         """list: The rules (once applied to the profile).
         """
-        return [rule(self.profile_converted_) for rule in self.rules]
+        return [self._call_sub_object(rule) for rule in self.rules]
 
     @cached_property
     def order_(self) -> list:
@@ -18,9 +18,11 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
 """
+import numpy as np
+from fractions import Fraction
 from whalrus.rules.rule_score_num import RuleScoreNum
 from whalrus.converters_ballot.converter_ballot_to_order import ConverterBallotToOrder
-from whalrus.utils.utils import cached_property, NiceDict, convert_number
+from whalrus.utils.utils import cached_property, NiceDict, apply_numeric_policy
 from whalrus.converters_ballot.converter_ballot import ConverterBallot
 from whalrus.matrices.matrix import Matrix
 from whalrus.matrices.matrix_weighted_majority import MatrixWeightedMajority
@@ -58,6 +60,8 @@ class RuleSimplifiedDodgson(RuleScoreNum):
         'a'
     """
 
+    _incremental_sub_objects = ('matrix_weighted_majority_',)
+
     def __init__(self, *args, converter: ConverterBallot = None, matrix_weighted_majority: Matrix = None, **kwargs):
         if converter is None:
             converter = ConverterBallotToOrder()
@@ -70,11 +74,14 @@ class RuleSimplifiedDodgson(RuleScoreNum):
     def matrix_weighted_majority_(self):
         """Matrix: The weighted majority matrix (once computed with the given profile).
         """
-        return self.matrix_weighted_majority(self.profile_converted_)
+        return self._call_sub_object(self.matrix_weighted_majority)
 
     @cached_property
     def scores_(self) -> NiceDict:
         matrix = self.matrix_weighted_majority_
-        return NiceDict({
-            c: convert_number(sum([v for (i, j), v in matrix.as_dict_.items() if i == c and j != c and v < 0]))
-            for c in matrix.candidates_})
+        # With the numeric policy 'integer', the sums are computed exactly, over the denominator of the matrix.
+        off_diagonal, denominator = matrix._off_diagonal_scaled()
+        negative_sums = np.where(off_diagonal < 0, off_diagonal, 0).sum(axis=1).tolist()
+        return NiceDict(zip(matrix.candidates_as_list_, [apply_numeric_policy(Fraction(int(x), denominator))
+                                                         if denominator != 1 else apply_numeric_policy(x)
+                                                         for x in negative_sums]))
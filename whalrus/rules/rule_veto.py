@@ -25,6 +25,7 @@ from whalrus.scorers.scorer_veto import ScorerVeto
 from whalrus.converters_ballot.converter_ballot_to_veto import ConverterBallotToVeto
 from whalrus.utils.utils import cached_property, NiceDict
 from whalrus.converters_ballot.converter_ballot import ConverterBallot
+from whalrus.ballots.ballot import Ballot
 
 
 class RuleVeto(RuleScoreNumAverage):
@@ -59,10 +60,14 @@ class RuleVeto(RuleScoreNumAverage):
         if any([len(b.candidates) > 1 and b.candidates != candidates for b in self.profile_converted_]):
             logging.warning('Some ballots do not have the same set of candidates as the whole election.')
 
+    def _check_ballot(self, ballot: Ballot) -> None:
+        if len(ballot.candidates) > 1 and ballot.candidates != self.candidates_:
+            logging.warning('Some ballots do not have the same set of candidates as the whole election.')
+
     @cached_property
-    def _gross_scores_and_weights_quicker_(self) -> dict:
+    def _gross_scores_and_weights_(self) -> dict:
         if not isinstance(self.scorer, ScorerVeto):
-            return self._gross_scores_and_weights_
+            return super()._gross_scores_and_weights_
         # If it is a ScorerVeto, we have a quicker method.
         gross_scores = NiceDict({c: 0 for c in self.candidates_})
         total_weight = 0
@@ -75,11 +80,3 @@ class RuleVeto(RuleScoreNumAverage):
             total_weight += weight
         weights = NiceDict({c: total_weight for c in self.candidates_})
         return {'gross_scores': gross_scores, 'weights': weights}
-
-    @cached_property
-    def gross_scores_(self) -> NiceDict:
-        return self._gross_scores_and_weights_quicker_['gross_scores']
-
-    @cached_property
-    def weights_(self) -> NiceDict:
-        return self._gross_scores_and_weights_quicker_['weights']
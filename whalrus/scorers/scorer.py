@@ -19,8 +19,160 @@ You should have received a copy of the GNU General Public License
 along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
 """
 from whalrus.ballots.ballot import Ballot
+from whalrus.ballots.ballot_order import BallotOrder
 from whalrus.scales.scale import Scale
-from whalrus.utils.utils import DeleteCacheMixin, cached_property, NiceDict, NiceSet
+from whalrus.profiles.profile import Profile
+from whalrus.utils.utils import DeleteCacheMixin, cached_property, NiceDict, NiceSet, set_to_list, \
+    check_numeric_policy, get_numeric_policy, numeric_policy, apply_numeric_policy_to_total
+from copy import copy
+from fractions import Fraction
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    # Imported on demand, by the helpers of the vectorized scorers.
+    import numpy as np
+
+
+def _ranks_and_weights(profile: Profile, candidates: set) -> tuple:
+    """
+    Ranks and weights of a profile of :class:`BallotOrder`, for the vectorized versions of :meth:`Scorer.score_profile`.
+
+    Parameters
+    ----------
+    profile : Profile
+        A profile.
+    candidates : set
+        The candidates of the election.
+
+    Returns
+    -------
+    tuple or None
+        A triple (list of the candidates, array of dense ranks with one column per candidate, array of weights). None
+        if the ballots are not all :class:`BallotOrder` objects over these candidates, or if some weights are floats:
+        in that case, the ballots must be scored one by one (for floats, this preserves the order of the summation).
+    """
+    import numpy as np
+    from whalrus.profiles.profile_array import ProfileArray, _dense_ranks
+    if not candidates:
+        return None
+    candidates_as_list = set_to_list(candidates)
+    if not isinstance(profile, ProfileArray):
+        if not all(type(ballot) is BallotOrder for ballot in profile):
+            return None
+        if not profile.candidates <= set(candidates):
+            return None
+        profile = ProfileArray(profile, candidates=candidates_as_list)
+    weights = profile.weights_as_array
+    if weights.dtype.kind == 'f' or (weights.dtype == object and any(isinstance(w, float) for w in weights)):
+        return None
+    ranks = _dense_ranks(profile.ranks_over(candidates_as_list)).astype(np.int64)
+    return candidates_as_list, ranks, weights
+
+
+def _rank_counts(ranks: 'np.ndarray') -> dict:
+    """
+    Counts used by the vectorized scorers.
+
+    Parameters
+    ----------
+    ranks : np.ndarray
+        Dense ranks (one row per ballot, one column per candidate).
+
+    Returns
+    -------
+    dict
+        Masks ``'ordered'``, ``'unordered'``, ``'absent'`` (same shape as `ranks`), numbers of candidates of each kind
+        in each ballot ``'n_ordered'``, ``'n_unordered'``, ``'n_absent'`` (one column), and for each ordered candidate
+        of each ballot, the number of candidates ranked strictly before her (``'before'``) and the size of her
+        indifference class (``'same'``).
+
+    Examples
+    --------
+        >>> import numpy as np
+        >>> counts = _rank_counts(np.array([[0, 1, 1, -1], [-2, 0, 1, 2]]))
+        >>> counts['before']
+        array([[0, 1, 1, 0],
+               [0, 0, 1, 2]])
+        >>> counts['same']
+        array([[1, 2, 2, 0],
+               [0, 1, 1, 1]])
+    """
+    import numpy as np
+    from whalrus.profiles.profile_array import ProfileArray
+    n_ballots, n_candidates = ranks.shape
+    ordered = ranks >= 0
+    unordered = ranks == ProfileArray.UNORDERED
+    absent = ranks == ProfileArray.ABSENT
+    rows = np.broadcast_to(np.arange(n_ballots)[:, np.newaxis], ranks.shape)
+    sizes = np.bincount((rows * n_candidates + ranks)[ordered],
+                        minlength=n_ballots * n_candidates).reshape((n_ballots, n_candidates))
+    positive_ranks = np.where(ordered, ranks, 0)
+    before = np.take_along_axis(np.cumsum(sizes, axis=1) - sizes, positive_ranks, axis=1)
+    same = np.take_along_axis(sizes, positive_ranks, axis=1)
+    return {'ordered': ordered, 'unordered': unordered, 'absent': absent,
+            'n_ordered': ordered.sum(axis=1, keepdims=True), 'n_unordered': unordered.sum(axis=1, keepdims=True),
+            'n_absent': absent.sum(axis=1, keepdims=True),
+            'before': np.where(ordered, before, 0), 'same': np.where(ordered, same, 0)}
+
+
+def _exact_weighted_sums(candidates_as_list: list, weights: 'np.ndarray', numerators: 'np.ndarray',
+                         denominators: 'np.ndarray', mask: 'np.ndarray') -> dict:
+    """
+    Weighted sums of scores given as fractions, computed exactly (unless the numeric policy is ``'float'``).
+
+    Parameters
+    ----------
+    candidates_as_list : list
+        The candidates (one per column).
+    weights : np.ndarray
+        The weights of the ballots (integers or fractions).
+    numerators : np.ndarray
+        The numerators of the scores (integers, one row per ballot and one column per candidate).
+    denominators : np.ndarray
+        The denominators of the scores (positive integers, same shape).
+    mask : np.ndarray
+        True for the scores that are counted (i.e. that are not None).
+
+    Returns
+    -------
+    dict
+        As in :meth:`Scorer.score_profile`.
+
+    Examples
+    --------
+        >>> import numpy as np
+        >>> _exact_weighted_sums(['a', 'b'], np.array([1, 2]), np.array([[1, 3], [1, 0]]), np.array([[2, 2], [1, 1]]),
+        ...                      np.array([[True, True], [True, False]]))
+        {'gross_scores': {'a': Fraction(5, 2), 'b': Fraction(3, 2)}, 'weights': {'a': 3, 'b': 1}}
+
+    With the numeric policy ``'float'`` (cf. :func:`numeric_policy`), the sums are computed with floats:
+
+        >>> from whalrus.utils.utils import numeric_policy
+        >>> with numeric_policy('float'):
+        ...     _exact_weighted_sums(['a', 'b'], np.array([1, 2]), np.array([[1, 3], [1, 0]]),
+        ...                          np.array([[2, 2], [1, 1]]), np.array([[True, True], [True, False]]))
+        {'gross_scores': {'a': 2.5, 'b': 1.5}, 'weights': {'a': 3.0, 'b': 1.0}}
+    """
+    import numpy as np
+    if get_numeric_policy() == 'float':
+        w = weights.astype(float)[:, np.newaxis]
+        return {'gross_scores': NiceDict(zip(candidates_as_list,
+                                             np.where(mask, numerators / denominators * w, 0).sum(axis=0).tolist())),
+                'weights': NiceDict(zip(candidates_as_list, np.where(mask, w, 0).sum(axis=0).tolist()))}
+    if weights.dtype != object:
+        bound = float(np.abs(weights).sum()) * (1 + float(np.abs(numerators).max(initial=0)))
+        if bound >= 2 ** 62:
+            weights = weights.astype(object)
+    w = weights[:, np.newaxis]
+    total_weights = np.where(mask, w, 0).sum(axis=0)
+    gross_scores = [0] * len(candidates_as_list)
+    for d in np.unique(denominators[mask]):
+        sums = np.where(mask & (denominators == d), numerators.astype(weights.dtype) * w, 0).sum(axis=0)
+        gross_scores = [x + Fraction(int(y) if weights.dtype != object else y) / int(d)
+                        for x, y in zip(gross_scores, sums)]
+    return {'gross_scores': NiceDict({c: apply_numeric_policy_to_total(x)
+                                      for c, x in zip(candidates_as_list, gross_scores)}),
+            'weights': NiceDict({c: apply_numeric_policy_to_total(int(x) if weights.dtype != object else x)
+                                 for c, x in zip(candidates_as_list, total_weights)})}
 
 
 class Scorer(DeleteCacheMixin):
@@ -41,6 +193,9 @@ class Scorer(DeleteCacheMixin):
         If present, these parameters will be passed to ``__call__`` immediately after initialization.
     scale : Scale
         The scale in which scores are computed.
+    numeric_policy : str
+        The numeric policy used for the computed variables: ``'exact'``, ``'integer'`` or ``'float'`` (cf.
+        :func:`numeric_policy`). If None (default), the policy that is current when the scorer is called is used.
     kwargs
         If present, these parameters will be passed to ``__call__`` immediately after initialization.
 
@@ -52,18 +207,23 @@ class Scorer(DeleteCacheMixin):
         This attribute stores the voter given in argument of the ``__call__``.
     candidates_: NiceSet
         This attribute stores the candidates given in argument of the ``__call__``.
+    numeric_policy_ : str
+        The numeric policy of the computed variables (cf. the parameter ``numeric_policy``).
 
     Examples
     --------
     Cf. :class:`ScorerLevels` for some examples.
     """
 
-    def __init__(self, *args, scale: Scale = None, **kwargs):
+    def __init__(self, *args, scale: Scale = None, numeric_policy: str = None, **kwargs):
         if scale is None:
             scale = Scale()
+        check_numeric_policy(numeric_policy)
         # Parameters
         self.scale = scale
+        self.numeric_policy = numeric_policy
         # Computed variables
+        self.numeric_policy_ = None
         self.ballot_ = None
         self.voter_ = None
         self.candidates_ = None
@@ -85,6 +245,7 @@ class Scorer(DeleteCacheMixin):
         candidates : set
             The candidates.
         """
+        self.numeric_policy_ = get_numeric_policy() if self.numeric_policy is None else self.numeric_policy
         self.ballot_ = ballot
         self.voter_ = voter
         self.candidates_ = candidates
@@ -100,6 +261,52 @@ class Scorer(DeleteCacheMixin):
         """
         raise NotImplementedError
 
+    def score_profile(self, profile: Profile, candidates: set = None) -> dict:
+        """
+        Score a whole profile.
+
+        This gives the same result as calling the scorer on each ballot of the profile and summing the
+        :attr:`scores_`, but subclasses may compute it faster. By default, the ballots are indeed scored one by one.
+
+        Parameters
+        ----------
+        profile : Profile
+            The profile. We assume that its ballots are already in the correct subclass of :class:`Ballot` and
+            restricted to the candidates of the election (if necessary).
+        candidates : set
+            The candidates of the election. Default: the candidates of the profile.
+
+        Returns
+        -------
+        dict
+            The key ``'gross_scores'`` gives a :class:`NiceDict` that associates to each candidate the sum of its
+            scores, multiplied by the weights of the ballots. The key ``'weights'`` gives a :class:`NiceDict` that
+            associates to each candidate the total weight of the ballots that give her a score (i.e. not None).
+
+        Examples
+        --------
+            >>> from whalrus.scorers.scorer_borda import ScorerBorda
+            >>> ScorerBorda().score_profile(Profile(['a > b > c', 'b > a > c'], weights=[2, 1]))
+            {'gross_scores': {'a': 5, 'b': 4, 'c': 0}, 'weights': {'a': 3, 'b': 3, 'c': 3}}
+        """
+        if candidates is None:
+            candidates = profile.candidates
+        policy = get_numeric_policy() if self.numeric_policy is None else self.numeric_policy
+        scorer = self
+        if policy == 'integer':
+            # The scores are computed exactly, so that the totals are exact (cf. :func:`numeric_policy`).
+            scorer = copy(self)
+            scorer.numeric_policy = 'exact'
+        gross_scores = NiceDict({c: 0 for c in candidates})
+        weights = NiceDict({c: 0 for c in candidates})
+        for ballot, weight, voter in profile.items():
+            for c, value in scorer(ballot=ballot, voter=voter, candidates=candidates).scores_.items():
+                gross_scores[c] += weight * value
+                weights[c] += weight
+        with numeric_policy(policy):
+            return {'gross_scores': NiceDict({c: apply_numeric_policy_to_total(x) for c, x in gross_scores.items()}),
+                    'weights': NiceDict({c: apply_numeric_policy_to_total(x) for c, x in weights.items()})}
+
     @cached_property
     def scores_as_floats_(self) -> NiceDict:
         """NiceDict: The scores, given as floats. It is the same as :attr:`scores_`, but converted to floats.
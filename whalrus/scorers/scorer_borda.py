@@ -20,7 +20,9 @@ along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
 """
 from whalrus.ballots.ballot_order import BallotOrder
 from whalrus.utils.utils import cached_property, NiceDict, my_division
-from whalrus.scorers.scorer import Scorer
+from whalrus.scorers.scorer import Scorer, _ranks_and_weights, _rank_counts, _exact_weighted_sums
+from whalrus.profiles.profile import Profile
+import numpy as np
 from typing import Union
 
 
@@ -130,3 +132,43 @@ class ScorerBorda(Scorer):
             scores.update({c: points_temp for c in indifference_class})
             points_from_lower_candidates += n_indifference
         return scores
+
+    def score_profile(self, profile: Profile, candidates: set = None) -> dict:
+        """
+        Score a whole profile. Cf. :meth:`Scorer.score_profile`.
+
+        When the ballots are :class:`BallotOrder` objects and the weights are not floats, the profile is converted to
+        an array of ranks and all the ballots are scored at once with numpy.
+
+        Examples
+        --------
+            >>> ScorerBorda(absent_receive_points=None).score_profile(
+            ...     Profile(['a > b ~ c', 'c > a'], weights=[2, 1]), candidates={'a', 'b', 'c'})
+            {'gross_scores': {'a': 5, 'b': 1, 'c': 3}, 'weights': {'a': 3, 'b': 2, 'c': 3}}
+        """
+        if candidates is None:
+            candidates = profile.candidates
+        ranks_and_weights = _ranks_and_weights(profile, candidates) if type(self) is ScorerBorda else None
+        if ranks_and_weights is None:
+            return super().score_profile(profile, candidates)
+        candidates_as_list, ranks, weights = ranks_and_weights
+        counts = _rank_counts(ranks)
+        # Doubled Borda scores, so that they are integers.
+        points_absent = counts['n_absent'] if self.absent_give_points else 0
+        points_unordered = counts['n_unordered'] if self.unordered_give_points else 0
+        doubled_ordered = (2 * (points_absent + points_unordered + counts['n_ordered'] - counts['before']
+                                - counts['same']) + counts['same'] - 1)
+        doubled_unordered = 0
+        if self.unordered_receive_points is True:
+            doubled_unordered = 2 * points_absent + (counts['n_unordered'] - 1 if self.unordered_give_points else 0)
+        doubled_absent = 0
+        if self.absent_receive_points is True:
+            doubled_absent = counts['n_absent'] - 1 if self.absent_give_points else 0
+        numerators = np.where(counts['ordered'], doubled_ordered,
+                              np.where(counts['unordered'], doubled_unordered, doubled_absent))
+        mask = counts['ordered'].copy()
+        if self.unordered_receive_points is not None:
+            mask |= counts['unordered']
+        if self.absent_receive_points is not None:
+            mask |= counts['absent']
+        return _exact_weighted_sums(candidates_as_list, weights, numerators, np.full(ranks.shape, 2), mask)
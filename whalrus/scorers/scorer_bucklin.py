@@ -20,7 +20,9 @@ along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
 """
 from whalrus.ballots.ballot_order import BallotOrder
 from whalrus.utils.utils import cached_property, NiceDict, my_division
-from whalrus.scorers.scorer import Scorer
+from whalrus.scorers.scorer import Scorer, _ranks_and_weights, _rank_counts, _exact_weighted_sums
+from whalrus.profiles.profile import Profile
+import numpy as np
 from typing import Union
 
 
@@ -124,3 +126,44 @@ class ScorerBucklin(Scorer):
             else:
                 scores.update({c: my_division(points_remaining, n_absent) for c in absent})
         return scores
+
+    def score_profile(self, profile: Profile, candidates: set = None) -> dict:
+        """
+        Score a whole profile. Cf. :meth:`Scorer.score_profile`.
+
+        When the ballots are :class:`BallotOrder` objects and the weights are not floats, the profile is converted to
+        an array of ranks and all the ballots are scored at once with numpy.
+
+        Examples
+        --------
+            >>> ScorerBucklin(k=2).score_profile(Profile(['a > b ~ c', 'c > a > b'], weights=[2, 1]))
+            {'gross_scores': {'a': 3, 'b': 1, 'c': 2}, 'weights': {'a': 3, 'b': 3, 'c': 3}}
+        """
+        if candidates is None:
+            candidates = profile.candidates
+        ranks_and_weights = _ranks_and_weights(profile, candidates) if type(self) is ScorerBucklin else None
+        if ranks_and_weights is None:
+            return super().score_profile(profile, candidates)
+        candidates_as_list, ranks, weights = ranks_and_weights
+        counts = _rank_counts(ranks)
+        # Each score is a fraction: points received by the class of the candidate / size of the class.
+        numerators_ordered = np.clip(self.k - counts['before'], 0, counts['same'])
+        points_remaining = np.maximum(self.k - counts['n_ordered'], 0)
+        numerators_unordered = np.minimum(points_remaining, counts['n_unordered'])
+        if self.unordered_receive_points is True:
+            points_remaining = np.maximum(points_remaining - counts['n_unordered'], 0)
+        else:
+            numerators_unordered = 0 * numerators_unordered
+        numerators_absent = np.minimum(points_remaining, counts['n_absent'])
+        if self.absent_receive_points is not True:
+            numerators_absent = 0 * numerators_absent
+        numerators = np.where(counts['ordered'], numerators_ordered,
+                              np.where(counts['unordered'], numerators_unordered, numerators_absent))
+        denominators = np.where(counts['ordered'], counts['same'],
+                                np.where(counts['unordered'], counts['n_unordered'], counts['n_absent']))
+        mask = counts['ordered'].copy()
+        if self.unordered_receive_points is not None:
+            mask |= counts['unordered']
+        if self.absent_receive_points is not None:
+            mask |= counts['absent']
+        return _exact_weighted_sums(candidates_as_list, weights, numerators, np.maximum(denominators, 1), mask)
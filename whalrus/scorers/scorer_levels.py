@@ -19,8 +19,9 @@ You should have received a copy of the GNU General Public License
 along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
 """
 from whalrus.ballots.ballot_levels import BallotLevels
-from whalrus.utils.utils import cached_property, NiceDict
+from whalrus.utils.utils import cached_property, NiceDict, apply_numeric_policy_to_total
 from whalrus.scorers.scorer import Scorer
+from whalrus.profiles.profile import Profile
 
 
 class ScorerLevels(Scorer):
@@ -93,3 +94,38 @@ class ScorerLevels(Scorer):
         if self.level_ungraded is not None:
             scores.update({c: self.level_ungraded for c in self.ballot_.candidates_not_in_b})
         return scores
+
+    def score_profile(self, profile: Profile, candidates: set = None) -> dict:
+        """
+        Score a whole profile. Cf. :meth:`Scorer.score_profile`.
+
+        The levels of each ballot are added directly, without building the dictionary :attr:`scores_` of each ballot.
+
+        Examples
+        --------
+            >>> ScorerLevels(level_absent=0).score_profile(
+            ...     Profile([{'a': 10, 'b': 7}, {'a': 3}], weights=[1, 2]), candidates={'a', 'b', 'c'})
+            {'gross_scores': {'a': 16, 'b': 7, 'c': 0}, 'weights': {'a': 3, 'b': 3, 'c': 3}}
+        """
+        if candidates is None:
+            candidates = profile.candidates
+        if type(self) is not ScorerLevels:
+            return super().score_profile(profile, candidates)
+        gross_scores = NiceDict({c: 0 for c in candidates})
+        weights = NiceDict({c: 0 for c in candidates})
+        for ballot, weight in zip(profile.ballots, profile.weights):
+            if not ballot.candidates <= candidates:
+                return super().score_profile(profile, candidates)
+            for c, level in ballot.as_dict.items():
+                gross_scores[c] += weight * level
+                weights[c] += weight
+            if self.level_absent is not None:
+                for c in candidates - ballot.candidates:
+                    gross_scores[c] += weight * self.level_absent
+                    weights[c] += weight
+            if self.level_ungraded is not None:
+                for c in ballot.candidates_not_in_b:
+                    gross_scores[c] += weight * self.level_ungraded
+                    weights[c] += weight
+        return {'gross_scores': NiceDict({c: apply_numeric_policy_to_total(x) for c, x in gross_scores.items()}),
+                'weights': NiceDict({c: apply_numeric_policy_to_total(x) for c, x in weights.items()})}
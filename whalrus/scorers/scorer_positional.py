@@ -20,7 +20,11 @@ along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
 """
 from whalrus.ballots.ballot_order import BallotOrder
 from whalrus.utils.utils import cached_property, NiceDict, convert_number
-from whalrus.scorers.scorer import Scorer
+from whalrus.scorers.scorer import Scorer, _ranks_and_weights, _rank_counts, _exact_weighted_sums
+from whalrus.profiles.profile import Profile
+from fractions import Fraction
+from math import gcd
+import numpy as np
 from numbers import Number
 from typing import Union
 
@@ -105,3 +109,41 @@ class ScorerPositional(Scorer):
         if self.points_absent is not None:
             scores.update({c: self.points_absent for c in self.candidates_ - self.ballot_.candidates})
         return scores
+
+    def score_profile(self, profile: Profile, candidates: set = None) -> dict:
+        """
+        Score a whole profile. Cf. :meth:`Scorer.score_profile`.
+
+        When the ballots are strict :class:`BallotOrder` objects and the weights are not floats, the profile is
+        converted to an array of ranks and all the ballots are scored at once with numpy.
+
+        Examples
+        --------
+            >>> ScorerPositional(points_scheme=[2, 1]).score_profile(
+            ...     Profile(['a > b > c', 'c > a > b'], weights=[2, 1]))
+            {'gross_scores': {'a': 5, 'b': 2, 'c': 2}, 'weights': {'a': 3, 'b': 3, 'c': 3}}
+        """
+        if candidates is None:
+            candidates = profile.candidates
+        ranks_and_weights = _ranks_and_weights(profile, candidates) if type(self) is ScorerPositional else None
+        if ranks_and_weights is None:
+            return super().score_profile(profile, candidates)
+        candidates_as_list, ranks, weights = ranks_and_weights
+        counts = _rank_counts(ranks)
+        if np.any(counts['same'] > 1):
+            # Ballots that are not strict orders raise an error when scored one by one.
+            return super().score_profile(profile, candidates)
+        points = self.points_scheme + [self.points_fill, self.points_unordered, self.points_absent]
+        denominator = 1
+        for x in points:
+            if x is not None:
+                d = Fraction(x).denominator
+                denominator = denominator * d // gcd(denominator, d)
+        numerators = [0 if x is None else int(x * denominator) for x in points]
+        # Table of points: points scheme, then points fill, unordered and absent (at the end of the table).
+        n_scheme = len(self.points_scheme)
+        position = np.minimum(counts['before'], n_scheme)
+        position = np.where(counts['unordered'], n_scheme + 1, np.where(counts['absent'], n_scheme + 2, position))
+        mask = np.array([x is not None for x in points])[position]
+        return _exact_weighted_sums(candidates_as_list, weights, np.array(numerators, dtype=np.int64)[position],
+                                    np.full(ranks.shape, denominator), mask)
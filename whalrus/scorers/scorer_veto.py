@@ -19,8 +19,9 @@ You should have received a copy of the GNU General Public License
 along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
 """
 from whalrus.ballots.ballot_veto import BallotVeto
-from whalrus.utils.utils import cached_property, NiceDict
+from whalrus.utils.utils import cached_property, NiceDict, apply_numeric_policy_to_total
 from whalrus.scorers.scorer import Scorer
+from whalrus.profiles.profile import Profile
 
 
 class ScorerVeto(Scorer):
@@ -67,3 +68,34 @@ class ScorerVeto(Scorer):
         scores = NiceDict({c: 0 for c in self.candidates_})
         scores[self.ballot_.candidate] = -1
         return scores
+
+    def score_profile(self, profile: Profile, candidates: set = None) -> dict:
+        """
+        Score a whole profile. Cf. :meth:`Scorer.score_profile`.
+
+        Each ballot only changes the gross score of its candidate, and all the candidates receive the same weight.
+
+        Examples
+        --------
+            >>> profile = Profile([BallotVeto('a'), BallotVeto('b'), BallotVeto(None)], weights=[2, 1, 1])
+            >>> ScorerVeto().score_profile(profile, candidates={'a', 'b', 'c'})
+            {'gross_scores': {'a': -2, 'b': -1, 'c': 0}, 'weights': {'a': 3, 'b': 3, 'c': 3}}
+        """
+        if candidates is None:
+            candidates = profile.candidates
+        if type(self) is not ScorerVeto:
+            return super().score_profile(profile, candidates)
+        gross_scores = NiceDict({c: 0 for c in candidates})
+        total_weight = 0
+        for ballot, weight in zip(profile.ballots, profile.weights):
+            if ballot.candidate is None:
+                if self.count_abstention:
+                    total_weight += weight
+                continue
+            if ballot.candidate not in gross_scores:
+                return super().score_profile(profile, candidates)
+            gross_scores[ballot.candidate] -= weight
+            total_weight += weight
+        total_weight = apply_numeric_policy_to_total(total_weight)
+        return {'gross_scores': NiceDict({c: apply_numeric_policy_to_total(x) for c, x in gross_scores.items()}),
+                'weights': NiceDict({c: total_weight for c in candidates})}
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright Sylvain Bouveret, Yann Chevaleyre and François Durand
+sylvain.bouveret@imag.fr, yann.chevaleyre@dauphine.fr, fradurand@gmail.com
+
+This file is part of Whalrus.
+
+Whalrus is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Whalrus is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
+"""
+from whalrus.utils.utils import NiceSet
+from fractions import Fraction
+from numbers import Integral
+
+
+def _subclasses(cls: type) -> dict:
+    """Dictionary of the subclasses of a class (recursively). Key: name of the class. Value: the class."""
+    result = {}
+    for subclass in cls.__subclasses__():
+        result[subclass.__name__] = subclass
+        result.update(_subclasses(subclass))
+    return result
+
+
+def _encode_number(x: object) -> object:
+    """
+    Encode a number so that it is compatible with ``json`` (cf. :meth:`Tally.to_dict`).
+
+    Parameters
+    ----------
+    x : object
+        A number (or any other object, which is returned unchanged).
+
+    Returns
+    -------
+    object
+        A fraction is encoded as a dictionary ``{'fraction': [numerator, denominator]}``, an integer (e.g. from
+        numpy) as an ``int``. Other objects are unchanged.
+
+    Examples
+    --------
+        >>> _encode_number(Fraction(1, 2))
+        {'fraction': [1, 2]}
+        >>> _encode_number('Good')
+        'Good'
+    """
+    if isinstance(x, Fraction):
+        return {'fraction': [x.numerator, x.denominator]}
+    if isinstance(x, Integral) and not isinstance(x, int):
+        return int(x)
+    return x
+
+
+def _decode_number(x: object) -> object:
+    """
+    Decode a number encoded by :func:`_encode_number`.
+
+    Parameters
+    ----------
+    x : object
+        An encoded number (or any other object, which is returned unchanged).
+
+    Returns
+    -------
+    object
+        The number.
+
+    Examples
+    --------
+        >>> _decode_number({'fraction': [1, 2]})
+        Fraction(1, 2)
+        >>> _decode_number(3)
+        3
+    """
+    if isinstance(x, dict):
+        return Fraction(*x['fraction'])
+    return x
+
+
+class Tally:
+    """
+    A partial count of an election.
+
+    A tally gathers the information that a voting rule (or a matrix) needs about the ballots, such as the sums of the
+    scores given to the candidates. Tallies can be computed separately on several parts of the profile (e.g. on the
+    ballots of each polling station), merged (with :meth:`merge` or simply ``+``), serialized (with :meth:`to_dict`)
+    and finally loaded in a voting rule (cf. :meth:`Rule.load_tally`), which computes its usual results (scores,
+    winner, etc) as if it had been called on the whole profile.
+
+    Merging is associative and commutative (up to the usual approximations when the weights are floats). The parts
+    of the profile must be counted with the same candidates (given in the ``__call__``), since the contribution of a
+    ballot may depend on the candidates of the election.
+
+    Examples
+    --------
+    Cf. :class:`TallyScores`, :class:`TallyMatrix` or :class:`TallyLevels` for some examples.
+    """
+
+    @property
+    def candidates(self) -> NiceSet:
+        """NiceSet: The candidates that appear in the tally.
+        """
+        raise NotImplementedError
+
+    def copy(self) -> 'Tally':
+        """
+        Copy of the tally.
+
+        Returns
+        -------
+        Tally
+            A tally of the same class, with the same content.
+        """
+        return self.from_dict(self.to_dict())
+
+    def merge(self, other: 'Tally') -> 'Tally':
+        """
+        Merge with another tally.
+
+        Parameters
+        ----------
+        other : Tally
+            Another tally of the same class.
+
+        Returns
+        -------
+        Tally
+            A new tally, which counts the ballots of both tallies.
+        """
+        raise NotImplementedError
+
+    def __add__(self, other: 'Tally') -> 'Tally':
+        return self.merge(other)
+
+    def __radd__(self, other: object) -> 'Tally':
+        # This allows to use the built-in function ``sum``, which starts with 0.
+        if other == 0:
+            return self.copy()
+        return NotImplemented
+
+    def to_dict(self) -> dict:
+        """
+        Convert the tally to a dictionary.
+
+        Returns
+        -------
+        dict
+            A dictionary made only of lists and of the candidates, levels and numbers of the tally (whose keys are
+            strings), so that it can be serialized, e.g. with ``pickle``, or with ``json`` if the candidates and
+            levels are themselves compatible with ``json``. Fractions are encoded as dictionaries
+            ``{'fraction': [numerator, denominator]}``. The key ``'type'`` gives the name of the class.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def from_dict(cls, d: dict) -> 'Tally':
+        """
+        Convert a dictionary to a tally.
+
+        Parameters
+        ----------
+        d : dict
+            A dictionary, as given by :meth:`to_dict`.
+
+        Returns
+        -------
+        Tally
+            The tally. If this method is called on :class:`Tally` itself, the class of the result is given by the
+            key ``'type'`` of the dictionary.
+
+        Examples
+        --------
+            >>> from whalrus.tallies.tally_scores import TallyScores
+            >>> Tally.from_dict({'type': 'TallyScores', 'gross_scores': [['a', 3]], 'weights': [['a', 2]]})
+            TallyScores(gross_scores={'a': 3}, weights={'a': 2})
+        """
+        if cls is Tally:
+            return _subclasses(Tally)[d['type']].from_dict(d)
+        raise NotImplementedError
@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright Sylvain Bouveret, Yann Chevaleyre and François Durand
+sylvain.bouveret@imag.fr, yann.chevaleyre@dauphine.fr, fradurand@gmail.com
+
+This file is part of Whalrus.
+
+Whalrus is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Whalrus is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
+"""
+from whalrus.scales.scale import Scale
+from whalrus.tallies.tally import Tally, _encode_number, _decode_number
+from whalrus.utils.utils import NiceDict, NiceSet, my_division
+from numbers import Number
+
+
+class TallyLevels(Tally):
+    """
+    Weighted histograms of the levels given to the candidates.
+
+    For each candidate, the tally records the total weight of the ballots giving each level to this candidate (and
+    the number of these ballots). The weighted median of a candidate and the weights above and below it are then
+    computed in one pass over the levels of the histogram, instead of sorting all the ballots. Tallies can be merged,
+    so that they can be built incrementally or separately on several parts of a profile.
+
+    This is the tally of :class:`RuleMajorityJudgment` and :class:`RuleBucklinInstant`.
+
+    Parameters
+    ----------
+    scale : Scale
+        The scale of the levels. Default: :class:`Scale`.
+
+    Examples
+    --------
+        >>> tally = TallyLevels()
+        >>> tally.add({'a': 3, 'b': 1}, weight=2).add({'a': 1, 'b': 2}).add({'a': 2, 'b': 2}, weight=2)
+        TallyLevels(histograms={'a': {1: 1, 2: 2, 3: 2}, 'b': {1: 2, 2: 3}})
+        >>> tally.median('a')
+        2
+        >>> tally.weight_below('a', 2), tally.weight_above('a', 2)
+        (1, 2)
+
+    Tallies of different parts of a profile can be merged:
+
+        >>> other = TallyLevels().add({'a': 1, 'c': 0})
+        >>> tally + other
+        TallyLevels(histograms={'a': {1: 2, 2: 2, 3: 2}, 'b': {1: 2, 2: 3}, 'c': {0: 1}})
+    """
+
+    def __init__(self, scale: Scale = None):
+        if scale is None:
+            scale = Scale()
+        self.scale = scale
+        self.histograms = NiceDict()
+        self.counts = NiceDict()
+
+    def add(self, scores: dict, weight: Number = 1) -> 'TallyLevels':
+        """
+        Add the levels given by a ballot.
+
+        Parameters
+        ----------
+        scores : dict
+            Key: candidate. Value: the level given to this candidate (typically, the :attr:`Scorer.scores_` of the
+            ballot).
+        weight : Number
+            The weight of the ballot.
+
+        Returns
+        -------
+        TallyLevels
+            The tally itself.
+        """
+        for c, level in scores.items():
+            histogram = self.histograms.setdefault(c, {})
+            histogram[level] = histogram.get(level, 0) + weight
+            counts = self.counts.setdefault(c, {})
+            counts[level] = counts.get(level, 0) + 1
+        return self
+
+    def remove(self, scores: dict, weight: Number = 1) -> 'TallyLevels':
+        """
+        Remove the levels given by a ballot (that was previously added).
+
+        Parameters
+        ----------
+        scores : dict
+            Key: candidate. Value: the level given to this candidate.
+        weight : Number
+            The weight of the ballot.
+
+        Returns
+        -------
+        TallyLevels
+            The tally itself.
+
+        Examples
+        --------
+            >>> TallyLevels().add({'a': 1}).add({'a': 2}).remove({'a': 1})
+            TallyLevels(histograms={'a': {2: 1}})
+        """
+        for c, level in scores.items():
+            self.counts[c][level] -= 1
+            if self.counts[c][level] == 0:
+                del self.counts[c][level]
+                del self.histograms[c][level]
+            else:
+                self.histograms[c][level] -= weight
+        return self
+
+    def merge(self, other: 'TallyLevels') -> 'TallyLevels':
+        """
+        Merge with another tally.
+
+        Parameters
+        ----------
+        other : TallyLevels
+            Another tally (with the same scale).
+
+        Returns
+        -------
+        TallyLevels
+            A new tally, whose histograms are the sums of the histograms of both tallies. The scale is the one of
+            this tally.
+        """
+        result = self.copy()
+        for c, histogram in other.histograms.items():
+            result_histogram = result.histograms.setdefault(c, {})
+            result_counts = result.counts.setdefault(c, {})
+            for level, weight in histogram.items():
+                result_histogram[level] = result_histogram.get(level, 0) + weight
+                result_counts[level] = result_counts.get(level, 0) + other.counts[c][level]
+        return result
+
+    def copy(self) -> 'TallyLevels':
+        """
+        Copy of the tally.
+
+        Returns
+        -------
+        TallyLevels
+            A tally with the same scale and a copy of the histograms.
+        """
+        result = TallyLevels(scale=self.scale)
+        result.histograms = NiceDict({c: dict(histogram) for c, histogram in self.histograms.items()})
+        result.counts = NiceDict({c: dict(counts) for c, counts in self.counts.items()})
+        return result
+
+    @property
+    def candidates(self) -> NiceSet:
+        return NiceSet(self.histograms.keys())
+
+    def to_dict(self) -> dict:
+        """
+        Convert the tally to a dictionary. Cf. :meth:`Tally.to_dict`. The scale is not included.
+
+        Examples
+        --------
+            >>> TallyLevels().add({'a': 'Good', 'b': 'Bad'}).add({'a': 'Good'}, weight=2).to_dict()
+            {'type': 'TallyLevels', 'histograms': [['a', 'Good', 3, 2], ['b', 'Bad', 1, 1]]}
+        """
+        return {'type': 'TallyLevels',
+                'histograms': [[c, _encode_number(level), _encode_number(weight), self.counts[c][level]]
+                               for c, histogram in self.histograms.items() for level, weight in histogram.items()]}
+
+    @classmethod
+    def from_dict(cls, d: dict, scale: Scale = None) -> 'TallyLevels':
+        """
+        Convert a dictionary to a tally. Cf. :meth:`Tally.from_dict`.
+
+        Parameters
+        ----------
+        d : dict
+            A dictionary, as given by :meth:`to_dict`.
+        scale : Scale
+            The scale of the levels. Default: :class:`Scale`.
+
+        Returns
+        -------
+        TallyLevels
+            The tally.
+        """
+        tally = cls(scale=scale)
+        for c, level, weight, count in d['histograms']:
+            level, weight = _decode_number(level), _decode_number(weight)
+            tally.histograms.setdefault(c, {})[level] = weight
+            tally.counts.setdefault(c, {})[level] = count
+        return tally
+
+    def n_ballots(self, candidate: object) -> int:
+        """
+        Number of ballots giving a level to a candidate.
+
+        Parameters
+        ----------
+        candidate : object
+            A candidate.
+
+        Returns
+        -------
+        int
+            The number of ballots.
+
+        Examples
+        --------
+            >>> TallyLevels().add({'a': 1}).add({'a': 2}, weight=3).n_ballots('a')
+            2
+        """
+        return sum(self.counts.get(candidate, {}).values())
+
+    def total_weight(self, candidate: object) -> Number:
+        """
+        Total weight of the ballots giving a level to a candidate.
+
+        Parameters
+        ----------
+        candidate : object
+            A candidate.
+
+        Returns
+        -------
+        Number
+            The total weight.
+
+        Examples
+        --------
+            >>> TallyLevels().add({'a': 1}).add({'a': 2}, weight=3).total_weight('a')
+            4
+        """
+        return sum(self.histograms.get(candidate, {}).values())
+
+    def median(self, candidate: object, default: object = None) -> object:
+        """
+        Weighted median level of a candidate.
+
+        Parameters
+        ----------
+        candidate : object
+            A candidate.
+        default : object
+            The result when no ballot gives a level to the candidate.
+
+        Returns
+        -------
+        object
+            The median level. When there are two medians, the lower one is returned.
+
+        Examples
+        --------
+            >>> tally = TallyLevels().add({'a': 1}).add({'a': 2}).add({'a': 3}, weight=2)
+            >>> tally.median('a')
+            2
+            >>> print(tally.median('b'))
+            None
+        """
+        histogram = self.histograms.get(candidate, {})
+        if not histogram:
+            return default
+        levels = list(histogram.keys())
+        self.scale.sort(levels)
+        half_total_weight = my_division(sum(histogram.values()), 2)
+        cumulative_weight = 0
+        for level in levels:
+            cumulative_weight += histogram[level]
+            if cumulative_weight >= half_total_weight:
+                return level
+
+    def weight_above(self, candidate: object, level: object) -> Number:
+        """
+        Total weight of the ballots giving a candidate a level strictly above a given level.
+
+        Parameters
+        ----------
+        candidate : object
+            A candidate.
+        level : object
+            A level.
+
+        Returns
+        -------
+        Number
+            The total weight.
+        """
+        return sum([w for x, w in self.histograms.get(candidate, {}).items() if self.scale.gt(x, level)])
+
+    def weight_below(self, candidate: object, level: object) -> Number:
+        """
+        Total weight of the ballots giving a candidate a level strictly below a given level.
+
+        Parameters
+        ----------
+        candidate : object
+            A candidate.
+        level : object
+            A level.
+
+        Returns
+        -------
+        Number
+            The total weight.
+        """
+        return sum([w for x, w in self.histograms.get(candidate, {}).items() if self.scale.lt(x, level)])
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, TallyLevels) and self.histograms == other.histograms and self.counts == other.counts
+
+    def __repr__(self):
+        histograms = NiceDict({c: NiceDict(histogram) for c, histogram in self.histograms.items()})
+        return 'TallyLevels(histograms=%r)' % histograms
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright Sylvain Bouveret, Yann Chevaleyre and François Durand
+sylvain.bouveret@imag.fr, yann.chevaleyre@dauphine.fr, fradurand@gmail.com
+
+This file is part of Whalrus.
+
+Whalrus is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Whalrus is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
+"""
+from whalrus.tallies.tally import Tally, _encode_number, _decode_number
+from whalrus.utils.utils import NiceDict, NiceSet
+
+
+class TallyMatrix(Tally):
+    """
+    A tally of the sums of the points given to the pairs of candidates.
+
+    This is the tally of :class:`MatrixWeightedMajority`.
+
+    Parameters
+    ----------
+    gross : dict
+        Key: pair of candidates. Value: the weighted number of points (cf. :attr:`MatrixWeightedMajority.gross_`).
+    weights : dict
+        Key: pair of candidates. Value: the total weight (cf. :attr:`MatrixWeightedMajority.weights_`).
+
+    Examples
+    --------
+        >>> from whalrus.matrices.matrix_weighted_majority import MatrixWeightedMajority
+        >>> matrix = MatrixWeightedMajority()
+        >>> tally_north = matrix(['a > b', 'b > a'], candidates={'a', 'b'}).tally_
+        >>> tally_north
+        TallyMatrix(gross={('a', 'a'): 0, ('a', 'b'): 1, ('b', 'a'): 1, ('b', 'b'): 0}, \
+weights={('a', 'a'): 0, ('a', 'b'): 2, ('b', 'a'): 2, ('b', 'b'): 0})
+        >>> tally_south = matrix(['a > b'], candidates={'a', 'b'}).tally_
+        >>> matrix.load_tally(tally_north + tally_south).as_array_
+        array([[0, Fraction(2, 3)],
+               [Fraction(1, 3), 0]], dtype=object)
+    """
+
+    def __init__(self, gross: dict = None, weights: dict = None):
+        self.gross = NiceDict() if gross is None else NiceDict(gross)
+        self.weights = NiceDict() if weights is None else NiceDict(weights)
+
+    @property
+    def candidates(self) -> NiceSet:
+        return NiceSet(c for c, _ in self.weights.keys())
+
+    def merge(self, other: 'TallyMatrix') -> 'TallyMatrix':
+        gross = NiceDict(self.gross)
+        weights = NiceDict(self.weights)
+        for (c, d), weight in other.weights.items():
+            gross[(c, d)] = gross.get((c, d), 0) + other.gross[(c, d)]
+            weights[(c, d)] = weights.get((c, d), 0) + weight
+        return TallyMatrix(gross=gross, weights=weights)
+
+    def to_dict(self) -> dict:
+        """
+        Convert the tally to a dictionary. Cf. :meth:`Tally.to_dict`.
+
+        Examples
+        --------
+            >>> TallyMatrix(gross={('a', 'b'): 1, ('b', 'a'): 0}, weights={('a', 'b'): 1, ('b', 'a'): 1}).to_dict()
+            {'type': 'TallyMatrix', 'gross': [['a', 'b', 1], ['b', 'a', 0]], 'weights': [['a', 'b', 1], ['b', 'a', 1]]}
+        """
+        return {'type': 'TallyMatrix',
+                'gross': [[c, d, _encode_number(x)] for (c, d), x in self.gross.items()],
+                'weights': [[c, d, _encode_number(w)] for (c, d), w in self.weights.items()]}
+
+    @classmethod
+    def from_dict(cls, d: dict) -> 'TallyMatrix':
+        return cls(gross={(c, d_): _decode_number(x) for c, d_, x in d['gross']},
+                   weights={(c, d_): _decode_number(w) for c, d_, w in d['weights']})
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, TallyMatrix) and self.gross == other.gross and self.weights == other.weights
+
+    def __repr__(self):
+        return 'TallyMatrix(gross=%r, weights=%r)' % (self.gross, self.weights)
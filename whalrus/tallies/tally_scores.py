@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright Sylvain Bouveret, Yann Chevaleyre and François Durand
+sylvain.bouveret@imag.fr, yann.chevaleyre@dauphine.fr, fradurand@gmail.com
+
+This file is part of Whalrus.
+
+Whalrus is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Whalrus is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
+"""
+from whalrus.tallies.tally import Tally, _encode_number, _decode_number
+from whalrus.utils.utils import NiceDict, NiceSet
+
+
+class TallyScores(Tally):
+    """
+    A tally of the sums of the scores given to the candidates.
+
+    This is the tally of :class:`RuleScoreNumAverage` and its subclasses (such as :class:`RuleBorda` or
+    :class:`RuleRangeVoting`).
+
+    Parameters
+    ----------
+    gross_scores : dict
+        Key: candidate. Value: the sum of the scores given to the candidate, multiplied by the weights of the ballots.
+    weights : dict
+        Key: candidate. Value: the total weight of the ballots that give a score to the candidate.
+
+    Examples
+    --------
+    Count each polling station separately, with the same candidates:
+
+        >>> from whalrus.rules.rule_borda import RuleBorda
+        >>> rule = RuleBorda()
+        >>> tally_north = rule(['a > b > c', 'b > a > c'], candidates={'a', 'b', 'c'}).tally_
+        >>> tally_north
+        TallyScores(gross_scores={'a': 3, 'b': 3, 'c': 0}, weights={'a': 2, 'b': 2, 'c': 2})
+        >>> tally_south = rule(['c > a > b'], candidates={'a', 'b', 'c'}).tally_
+
+    Then merge the tallies and compute the result:
+
+        >>> rule.load_tally(tally_north + tally_south).scores_
+        {'a': Fraction(4, 3), 'b': 1, 'c': Fraction(2, 3)}
+        >>> rule.winner_
+        'a'
+    """
+
+    def __init__(self, gross_scores: dict = None, weights: dict = None):
+        self.gross_scores = NiceDict() if gross_scores is None else NiceDict(gross_scores)
+        self.weights = NiceDict() if weights is None else NiceDict(weights)
+
+    @property
+    def candidates(self) -> NiceSet:
+        return NiceSet(self.weights.keys())
+
+    def merge(self, other: 'TallyScores') -> 'TallyScores':
+        gross_scores = NiceDict(self.gross_scores)
+        weights = NiceDict(self.weights)
+        for c, weight in other.weights.items():
+            gross_scores[c] = gross_scores.get(c, 0) + other.gross_scores[c]
+            weights[c] = weights.get(c, 0) + weight
+        return TallyScores(gross_scores=gross_scores, weights=weights)
+
+    def to_dict(self) -> dict:
+        """
+        Convert the tally to a dictionary. Cf. :meth:`Tally.to_dict`.
+
+        Examples
+        --------
+            >>> TallyScores(gross_scores={'a': 3, 'b': 1}, weights={'a': 2, 'b': 2}).to_dict()
+            {'type': 'TallyScores', 'gross_scores': [['a', 3], ['b', 1]], 'weights': [['a', 2], ['b', 2]]}
+        """
+        return {'type': 'TallyScores',
+                'gross_scores': [[c, _encode_number(x)] for c, x in self.gross_scores.items()],
+                'weights': [[c, _encode_number(w)] for c, w in self.weights.items()]}
+
+    @classmethod
+    def from_dict(cls, d: dict) -> 'TallyScores':
+        return cls(gross_scores={c: _decode_number(x) for c, x in d['gross_scores']},
+                   weights={c: _decode_number(w) for c, w in d['weights']})
+
+    def __eq__(self, other: object) -> bool:
+        return (isinstance(other, TallyScores) and self.gross_scores == other.gross_scores
+                and self.weights == other.weights)
+
+    def __repr__(self):
+        return 'TallyScores(gross_scores=%r, weights=%r)' % (self.gross_scores, self.weights)
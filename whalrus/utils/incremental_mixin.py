@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright Sylvain Bouveret, Yann Chevaleyre and François Durand
+sylvain.bouveret@imag.fr, yann.chevaleyre@dauphine.fr, fradurand@gmail.com
+
+This file is part of Whalrus.
+
+Whalrus is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Whalrus is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import logging
+from collections import Counter
+from whalrus.utils.utils import DeleteCacheMixin, cached_property, get_numeric_policy
+from whalrus.ballots.ballot import Ballot
+from whalrus.profiles.profile import Profile
+from numbers import Number
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from whalrus.tallies.tally import Tally
+
+
+class IncrementalMixin(DeleteCacheMixin):
+    """
+    Mixin used to add, remove or replace ballots in an election that is already loaded.
+
+    This is used by :class:`Rule` and :class:`Matrix`. The class must have the attributes ``converter``,
+    ``numeric_policy``, ``profile_original_``, ``profile_converted_``, ``candidates_`` and ``election_``, and the method
+    ``_convert_profile``, which computes ``profile_converted_`` and ``candidates_`` from ``profile_original_``. Ballots
+    cannot be changed in an object called on an :class:`Election`.
+
+    When a ballot changes, the two profiles are updated, then the method :meth:`_update_ballot` is called. By default,
+    the cache is deleted, except the sub-objects listed in ``_incremental_sub_objects`` (typically, the matrix used by
+    a rule): these ones receive the same change, so that they can update themselves incrementally. Subclasses may also
+    override :meth:`_update_ballot` to update their own tallies.
+    """
+
+    #: Names of the cached properties that are computed from ``profile_converted_`` by calling another object
+    #: implementing :class:`IncrementalMixin`. They are updated instead of being deleted when a ballot changes.
+    _incremental_sub_objects = ()
+
+    def add_ballot(self, ballot: object, weight: Number = 1, voter: object = None) -> 'IncrementalMixin':
+        """
+        Add a ballot to the election.
+
+        This is equivalent to calling the object again with the ballot appended to the profile. The candidates of the
+        election are unchanged if they were given in the ``__call__``; otherwise, they are inferred again from the
+        profile. Some classes (e.g. :class:`RuleScoreNumAverage` or :class:`MatrixWeightedMajority`) update their
+        results incrementally, instead of computing them from scratch.
+
+        Parameters
+        ----------
+        ballot : object
+            A ballot or, more generally, an input that can be interpreted by :class:`ConverterBallotGeneral`.
+        weight : Number
+            The weight of the ballot.
+        voter : object
+            The voter.
+
+        Returns
+        -------
+        IncrementalMixin
+            The object itself.
+
+        Examples
+        --------
+            >>> from whalrus.rules.rule_plurality import RulePlurality
+            >>> rule = RulePlurality(['a', 'b', 'b'], candidates={'a', 'b', 'c'})
+            >>> rule.add_ballot('a', weight=2).winner_
+            'a'
+        """
+        self._check_not_in_election()
+        self.profile_original_.append(ballot, weight=weight, voter=voter)
+        try:
+            ballot_converted = self.converter(self.profile_original_[-1], self._candidates_for_conversion)
+        except Exception:
+            # Leave the object unchanged.
+            del self.profile_original_[-1]
+            raise
+        if self.profile_converted_ is not self.profile_original_:
+            self.profile_converted_.append(ballot_converted, weight=weight, voter=voter)
+        self._ballot_event(len(self.profile_converted_) - 1, None, ballot_converted, weight, voter)
+        return self
+
+    def remove_ballot(self, ballot: object = None, voter: object = None) -> 'IncrementalMixin':
+        """
+        Remove a ballot from the election.
+
+        The ballot to remove is chosen as in :meth:`Profile.remove`: it is searched in the original profile, in its own
+        representation (e.g. as an array of ranks for a :class:`ProfileArray`). If there is no such ballot, a
+        ValueError is raised. Cf. :meth:`add_ballot` for more information.
+
+        Parameters
+        ----------
+        ballot : object
+            The ballot or, more generally, an input that can be interpreted by :class:`ConverterBallotGeneral`.
+        voter : object
+            The voter.
+
+        Returns
+        -------
+        IncrementalMixin
+            The object itself.
+
+        Examples
+        --------
+            >>> from whalrus.rules.rule_plurality import RulePlurality
+            >>> rule = RulePlurality(['a', 'b', 'b'], voters=['Alice', 'Bob', 'Cate'], candidates={'a', 'b', 'c'})
+            >>> rule.remove_ballot(voter='Bob').cowinners_
+            {'a', 'b'}
+        """
+        return self._remove_ballot_at(self.profile_original_.index(ballot, voter))
+
+    def replace_ballot(self, key: int, ballot: object) -> 'IncrementalMixin':
+        """
+        Replace a ballot of the election.
+
+        As in :meth:`Profile.__setitem__`, the weight and the voter are unchanged. Cf. :meth:`add_ballot` for more
+        information.
+
+        Parameters
+        ----------
+        key : int
+            The index of the ballot in the profile.
+        ballot : object
+            The new ballot or, more generally, an input that can be interpreted by :class:`ConverterBallotGeneral`.
+
+        Returns
+        -------
+        IncrementalMixin
+            The object itself.
+
+        Examples
+        --------
+            >>> from whalrus.rules.rule_plurality import RulePlurality
+            >>> rule = RulePlurality(['a', 'b', 'b'], candidates={'a', 'b', 'c'})
+            >>> rule.replace_ballot(1, 'c').cowinners_
+            {'a', 'b', 'c'}
+        """
+        self._check_not_in_election()
+        key = range(len(self.profile_converted_))[key]
+        ballot_old = self.profile_converted_[key]
+        weight, voter = self.profile_converted_.weights[key], self.profile_converted_.voters[key]
+        ballot_original_old = self.profile_original_[key]
+        self.profile_original_[key] = ballot
+        try:
+            ballot_converted = self.converter(self.profile_original_[key], self._candidates_for_conversion)
+        except Exception:
+            # Leave the object unchanged.
+            self.profile_original_[key] = ballot_original_old
+            raise
+        if self.profile_converted_ is not self.profile_original_:
+            self.profile_converted_[key] = ballot_converted
+        self._ballot_event(key, ballot_old, ballot_converted, weight, voter)
+        return self
+
+    def _remove_ballot_at(self, i: int) -> 'IncrementalMixin':
+        """Remove the `i`-th ballot of the election. Cf. :meth:`remove_ballot`."""
+        self._check_not_in_election()
+        i = range(len(self.profile_converted_))[i]
+        ballot_converted = self.profile_converted_[i]
+        weight, voter = self.profile_converted_.weights[i], self.profile_converted_.voters[i]
+        del self.profile_original_[i]
+        if self.profile_converted_ is not self.profile_original_:
+            del self.profile_converted_[i]
+        self._ballot_event(i, ballot_converted, None, weight, voter)
+        return self
+
+    def load_tally(self, tally: 'Tally', candidates: set = None) -> 'IncrementalMixin':
+        """
+        Load a tally instead of a profile.
+
+        The computed variables (scores, winner, etc) are the same as if the object had been called on all the ballots
+        counted in the tally. Then the profile is empty, but ballots can still be added (cf. :meth:`add_ballot`).
+
+        Parameters
+        ----------
+        tally : Tally
+            A tally, typically the sum of the attributes ``tally_`` of the same object called on several parts of a
+            profile, with the same candidates.
+        candidates : set
+            The candidates of the election. Default: the candidates of the tally.
+
+        Returns
+        -------
+        IncrementalMixin
+            The object itself.
+
+        Examples
+        --------
+            >>> from whalrus.rules.rule_range_voting import RuleRangeVoting
+            >>> rule = RuleRangeVoting()
+            >>> tallies = [rule([{'a': 1, 'b': .5}, {'a': 0, 'b': 1}], candidates={'a', 'b'}).tally_,
+            ...            rule([{'a': 1, 'b': 0}], candidates={'a', 'b'}).tally_]
+            >>> rule.load_tally(sum(tallies)).scores_
+            {'a': Fraction(2, 3), 'b': Fraction(1, 2)}
+        """
+        if candidates is None:
+            candidates = tally.candidates
+        self.numeric_policy_ = get_numeric_policy() if self.numeric_policy is None else self.numeric_policy
+        self.election_ = None
+        self.profile_original_ = Profile([])
+        self._candidates_are_given = True
+        self._convert_profile(candidates)
+        self._load_tally(tally)
+        return self
+
+    @cached_property
+    def tally_(self) -> 'Tally':
+        """Tally: The tally of the election (cf. :meth:`load_tally`). By default, this is the tally of the sub-object
+        listed in ``_incremental_sub_objects`` (e.g. the weighted majority matrix of :class:`RuleMaximin`).
+        """
+        return getattr(self, self._tally_sub_object).tally_
+
+    def _load_tally(self, tally: 'Tally') -> None:
+        """Store the tally in the cache, once the (empty) profile and the candidates are loaded. Cf. :meth:`load_tally`.
+        By default, the tally is loaded in the sub-object listed in ``_incremental_sub_objects``.
+        """
+        getattr(self, self._tally_sub_object).load_tally(tally)
+
+    @property
+    def _tally_sub_object(self) -> str:
+        """Name of the sub-object that holds the tally, when there is no specific tally for this class."""
+        if len(self._incremental_sub_objects) != 1:
+            raise NotImplementedError('%s has no tally.' % type(self).__name__)
+        return self._incremental_sub_objects[0]
+
+    def _check_not_in_election(self) -> None:
+        """Raise an error if the object was called on an :class:`Election`, whose profile is shared."""
+        if self.election_ is not None:
+            raise ValueError('Ballots cannot be changed in an object called on an Election, since the profile is '
+                             'shared with other objects.')
+
+    @property
+    def _candidates_for_conversion(self) -> set:
+        """The candidates used to convert a new ballot (as in ``__call__``)."""
+        return self.candidates_ if self._candidates_are_given else None
+
+    @cached_property
+    def _candidates_counts_(self) -> Counter:
+        """Counter: for each candidate, the number of ballots of :attr:`profile_converted_` that contain it. This is
+        used to know whether the inferred candidates of the election change."""
+        return Counter(c for ballot in self.profile_converted_ for c in ballot.candidates)
+
+    def _ballot_event(self, i: int, ballot_removed: Ballot, ballot_added: Ballot, weight: Number,
+                      voter: object) -> None:
+        """Deal with the change of a ballot, once the profiles are updated. Cf. :meth:`_update_ballot`."""
+        counts = None
+        if not self._candidates_are_given:
+            if '_candidates_counts_' in self._cached_properties:
+                counts = self._candidates_counts_
+                if ballot_removed is not None:
+                    counts.subtract(ballot_removed.candidates)
+                if ballot_added is not None:
+                    counts.update(ballot_added.candidates)
+            else:
+                # Computed with the updated profile.
+                counts = self._candidates_counts_
+            if {c for c, n in counts.items() if n > 0} != self.candidates_:
+                self._convert_profile()
+                return
+        if ballot_added is not None:
+            self._check_ballot(ballot_added)
+        self._update_ballot(i, ballot_removed, ballot_added, weight, voter)
+        if counts is not None:
+            self._cached_properties['_candidates_counts_'] = counts
+
+    def _check_ballot(self, ballot: Ballot) -> None:
+        """Check a new ballot of :attr:`profile_converted_` (similar to ``_check_profile``)."""
+        if ballot.candidates != self.candidates_:
+            logging.warning('Some ballots do not have the same set of candidates as the whole election.')
+
+    def _update_ballot(self, i: int, ballot_removed: Ballot, ballot_added: Ballot, weight: Number,
+                       voter: object) -> None:
+        """
+        Update the computed variables when a ballot of :attr:`profile_converted_` changes.
+
+        By default, the sub-objects listed in ``_incremental_sub_objects`` receive the same change, and the rest of
+        the cache is deleted. Subclasses may override this method to update their computed variables incrementally.
+
+        Parameters
+        ----------
+        i : int
+            The index of the ballot in :attr:`profile_converted_`.
+        ballot_removed : Ballot or None
+            The former converted ballot (None if a ballot was added).
+        ballot_added : Ballot or None
+            The new converted ballot (None if a ballot was removed).
+        weight : Number
+            The weight of the ballot.
+        voter : object
+            The voter.
+        """
+        sub_objects = {name: self._cached_properties[name] for name in self._incremental_sub_objects
+                       if name in self._cached_properties}
+        for sub_object in sub_objects.values():
+            if ballot_removed is None:
+                sub_object.add_ballot(ballot_added, weight=weight, voter=voter)
+            elif ballot_added is None:
+                sub_object._remove_ballot_at(i)
+            else:
+                sub_object.replace_ballot(i, ballot_added)
+        self.delete_cache()
+        self._cached_properties.update(sub_objects)
@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright Sylvain Bouveret, Yann Chevaleyre and François Durand
+sylvain.bouveret@imag.fr, yann.chevaleyre@dauphine.fr, fradurand@gmail.com
+
+This file is part of Whalrus.
+
+Whalrus is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Whalrus is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import functools
+import json
+from time import perf_counter
+from whalrus.converters_ballot.converter_ballot import ConverterBallot
+from whalrus.matrices.matrix import Matrix
+from whalrus.rules.rule import Rule
+from whalrus.scorers.scorer import Scorer
+from whalrus.utils.utils import _CachedProperty
+
+# Classes whose ``__call__`` (and those of their subclasses) are instrumented.
+_INSTRUMENTED_BASES = (ConverterBallot, Scorer, Matrix, Rule)
+
+# Instrumentations that are currently active (they may be nested).
+_active_instrumentations = []
+
+# Original methods that are replaced while an instrumentation is active: list of (class, name, method).
+_originals = []
+
+# Ids of the objects whose ``__call__`` is currently running (so that ``super().__call__`` is not counted twice).
+_running_calls = set()
+
+_original_get = _CachedProperty.__get__
+
+
+def _record(cls: type, attribute: str, key: str, duration: float = 0.) -> None:
+    """Record an event in all the active instrumentations."""
+    for instrumentation in _active_instrumentations:
+        stats = instrumentation._stats.setdefault(cls.__name__, dict()).setdefault(
+            attribute, {'calls': 0, 'hits': 0, 'misses': 0, 'time': 0.})
+        stats[key] += 1
+        stats['time'] += duration
+
+
+def _instrumented_get(descriptor: _CachedProperty, instance: object, owner: type = None) -> object:
+    """Replacement of ``_CachedProperty.__get__``, which also sees the cache hits."""
+    if instance is None:
+        return descriptor
+    try:
+        value = instance.__dict__[descriptor.name]
+    except KeyError:
+        pass
+    else:
+        _record(type(instance), descriptor.name, 'hits')
+        return value
+    start = perf_counter()
+    try:
+        return _original_get(descriptor, instance, owner)
+    finally:
+        _record(type(instance), descriptor.name, 'misses', perf_counter() - start)
+
+
+def _instrumented_set(descriptor: _CachedProperty, instance: object, value: object) -> None:
+    instance.__dict__[descriptor.name] = value
+
+
+def _instrumented_delete(descriptor: _CachedProperty, instance: object) -> None:
+    del instance.__dict__[descriptor.name]
+
+
+def _instrumented_call(f):
+    """Wrap a method ``__call__`` to count the calls and measure their time."""
+    @functools.wraps(f)
+    def _f(self, *args, **kwargs):
+        if id(self) in _running_calls:
+            return f(self, *args, **kwargs)
+        _running_calls.add(id(self))
+        start = perf_counter()
+        try:
+            return f(self, *args, **kwargs)
+        finally:
+            _running_calls.discard(id(self))
+            _record(type(self), '__call__', 'calls', perf_counter() - start)
+    return _f
+
+
+def _subclasses(cls: type) -> list:
+    """The class and all its subclasses (direct or not)."""
+    result = [cls]
+    for subclass in cls.__subclasses__():
+        result.extend(c for c in _subclasses(subclass) if c not in result)
+    return result
+
+
+def _instrument(cls: type) -> None:
+    """Replace the method ``__call__`` of a class by its instrumented version, if the class defines it."""
+    if '__call__' in vars(cls):
+        _originals.append((cls, '__call__', vars(cls)['__call__']))
+        cls.__call__ = _instrumented_call(vars(cls)['__call__'])
+
+
+def _instrumented_init_subclass(base: type) -> classmethod:
+    """Hook ``__init_subclass__`` of a base, so that its subclasses that are created while an instrumentation is
+    active (e.g. when a module is imported lazily) are instrumented too."""
+    def __init_subclass__(cls, **kwargs):
+        super(base, cls).__init_subclass__(**kwargs)
+        _instrument(cls)
+    return classmethod(__init_subclass__)
+
+
+def _install() -> None:
+    """Replace the methods by their instrumented versions."""
+    classes = []
+    for base in _INSTRUMENTED_BASES:
+        classes.extend(c for c in _subclasses(base) if c not in classes)
+    for cls in classes:
+        _instrument(cls)
+    for base in _INSTRUMENTED_BASES:
+        base.__init_subclass__ = _instrumented_init_subclass(base)
+    # With ``__set__``, the descriptor becomes a data descriptor, hence it is also called when the value is cached.
+    _CachedProperty.__get__ = _instrumented_get
+    _CachedProperty.__set__ = _instrumented_set
+    _CachedProperty.__delete__ = _instrumented_delete
+
+
+def _uninstall() -> None:
+    """Restore the original methods."""
+    for base in _INSTRUMENTED_BASES:
+        del base.__init_subclass__
+    for cls, name, method in _originals:
+        setattr(cls, name, method)
+    _originals.clear()
+    _CachedProperty.__get__ = _original_get
+    del _CachedProperty.__set__
+    del _CachedProperty.__delete__
+
+
+class Instrumentation:
+    """
+    Context manager that records where the computation time goes.
+
+    While the context is active, it records, for each class and each attribute:
+
+    * For the method ``__call__`` of rules, matrices, scorers and ballot converters: the number of calls (in
+      ``'calls'``) and their cumulative wall time.
+    * For each cached property (cf. :func:`cached_property`): the number of cache hits and misses (in ``'hits'`` and
+      ``'misses'``) and the cumulative wall time of the misses, i.e. of the computations.
+
+    The classes that are defined while the context is active (e.g. the modules that are imported lazily, cf.
+    :mod:`whalrus`) are instrumented as well.
+
+    Times are in seconds and inclusive: the time of a rule includes the time of its matrix, for example. The
+    instrumentation hooks are installed when the context is entered and removed when it exits, so that there is no
+    overhead at all outside of the context. Instrumentations can be nested (each one records the events of its own
+    context), but they are not thread-safe.
+
+    Examples
+    --------
+        >>> from whalrus.rules.rule_borda import RuleBorda
+        >>> with Instrumentation() as instrumentation:
+        ...     rule = RuleBorda(['a > b > c', 'b > a > c', 'a > c > b'])
+        ...     rule.winner_, rule.winner_
+        ('a', 'a')
+        >>> report = instrumentation.report()
+        >>> report['RuleBorda']['__call__']['calls']
+        1
+        >>> stats = report['RuleBorda']['winner_']
+        >>> stats['hits'], stats['misses']
+        (1, 1)
+        >>> sorted(report)  # doctest: +NORMALIZE_WHITESPACE
+        ['BallotOrder', 'ConverterBallotGeneral', 'ConverterBallotToOrder', 'MatrixWeightedMajority', 'Profile',
+         'ProfileArray', 'RuleBorda']
+    """
+
+    def __init__(self):
+        self._stats = dict()
+
+    def __enter__(self) -> 'Instrumentation':
+        if not _active_instrumentations:
+            _install()
+        _active_instrumentations.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        _active_instrumentations.remove(self)
+        if not _active_instrumentations:
+            _uninstall()
+
+    def reset(self) -> None:
+        """Forget the events recorded so far."""
+        self._stats = dict()
+
+    def report(self) -> dict:
+        """
+        The recorded statistics.
+
+        Returns
+        -------
+        dict
+            A dictionary whose keys are the names of the classes. Each value is a dictionary whose keys are the names
+            of the attributes (``'__call__'`` or a cached property), and each value is a dictionary with keys
+            ``'calls'``, ``'hits'``, ``'misses'`` (numbers of events) and ``'time'`` (cumulative wall time, in
+            seconds).
+        """
+        return {cls: {attribute: dict(stats) for attribute, stats in attributes.items()}
+                for cls, attributes in self._stats.items()}
+
+    def to_json(self, **kwargs) -> str:
+        """
+        The recorded statistics, as a JSON string.
+
+        Parameters
+        ----------
+        kwargs
+            Keyword arguments passed to :func:`json.dumps` (by default, ``indent=2`` and ``sort_keys=True``).
+
+        Returns
+        -------
+        str
+            The JSON representation of :meth:`report`.
+
+        Examples
+        --------
+            >>> from whalrus.rules.rule_plurality import RulePlurality
+            >>> with Instrumentation() as instrumentation:
+            ...     rule = RulePlurality(['a', 'b', 'a'])
+            >>> print(instrumentation.to_json())  # doctest: +ELLIPSIS
+            {
+            ...
+              "RulePlurality": {
+                "__call__": {
+                  "calls": 1,
+                  "hits": 0,
+                  "misses": 0,
+                  "time": ...
+                }
+              }
+            }
+        """
+        kwargs.setdefault('indent', 2)
+        kwargs.setdefault('sort_keys', True)
+        return json.dumps(self.report(), **kwargs)
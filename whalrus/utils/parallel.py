@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright Sylvain Bouveret, Yann Chevaleyre and François Durand
+sylvain.bouveret@imag.fr, yann.chevaleyre@dauphine.fr, fradurand@gmail.com
+
+This file is part of Whalrus.
+
+Whalrus is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Whalrus is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import copy
+import os
+from concurrent.futures import ProcessPoolExecutor
+from whalrus.ballots.ballot_order import BallotOrder
+from whalrus.profiles.profile import Profile
+from whalrus.profiles.profile_array import ProfileArray
+from whalrus.utils.incremental_mixin import IncrementalMixin
+from whalrus.utils.utils import NiceSet, get_numeric_policy, numeric_policy
+from typing import Union
+
+
+def _blank_copy(x: IncrementalMixin) -> IncrementalMixin:
+    """Copy of an object with its parameters only (no profile, no cache), so that it is cheap to send to a worker. The
+    parameters that are rules or matrices (e.g. the ``matrix_schulze`` of :class:`RuleSchulze`) are themselves
+    replaced by blank copies, since they keep the profile they were called on."""
+    blank = copy.copy(x)
+    blank.profile_original_ = None
+    blank.profile_converted_ = None
+    blank.candidates_ = None
+    blank.election_ = None
+    blank._election_converted = None
+    blank.delete_cache()
+    for name, value in list(vars(blank).items()):
+        if isinstance(value, IncrementalMixin):
+            setattr(blank, name, _blank_copy(value))
+    return blank
+
+
+def _shards(ballots: Profile, candidates: set, n_jobs: int, chunk_size: int = None) -> list:
+    """Parts of the profile to send to the workers. A profile of :class:`BallotOrder` is stored as a
+    :class:`ProfileArray` over the candidates of the ballots and of the election, and each part is a slice of its array
+    of ranks. If there are no voters, equal ballots are grouped first (cf. :meth:`ProfileArray.compressed`). Other
+    profiles are sliced as they are."""
+    if isinstance(ballots, ProfileArray) or all(type(ballot) is BallotOrder for ballot in ballots):
+        array = ProfileArray(ballots, candidates=NiceSet(candidates) | ballots.candidates)
+        if not array.has_voters:
+            array = array.compressed(keep_voters=False)
+        if chunk_size is None:
+            chunk_size = max(1, -(-len(array) // n_jobs))
+        ranks, weights = array.ranks, array.weights_as_array
+        voters = array.voters if array.has_voters else None
+        return [ProfileArray._from_arrays(ranks[i:i + chunk_size], array.candidates_as_list, weights[i:i + chunk_size],
+                                          None if voters is None else voters[i:i + chunk_size])
+                for i in range(0, len(array), chunk_size)]
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(ballots) // n_jobs))
+    return [Profile(ballots.ballots[i:i + chunk_size], weights=ballots.weights[i:i + chunk_size],
+                    voters=ballots.voters[i:i + chunk_size])
+            for i in range(0, len(ballots), chunk_size)]
+
+
+def _tally_of_shard(x: IncrementalMixin, shard: Profile, candidates: set, policy: str) -> object:
+    """Tally of a part of the profile (computed in a worker, with the numeric policy of the caller)."""
+    with numeric_policy(policy):
+        return x(shard, candidates=candidates).tally_
+
+
+def evaluate_in_parallel(x: IncrementalMixin, ballots: Union[list, Profile], weights: list = None,
+                         voters: list = None, candidates: set = None, n_jobs: int = None,
+                         chunk_size: int = None) -> IncrementalMixin:
+    """
+    Call a rule or a matrix on a profile, using several processes.
+
+    The profile is split into parts, which are counted in parallel by a :class:`ProcessPoolExecutor`. Each worker
+    converts its ballots and computes the tally of its part (cf. :attr:`Rule.tally_`). Then the tallies are merged,
+    and loaded in the object (cf. :meth:`Rule.load_tally`).
+
+    When the ballots are orders, the workers receive slices of a :class:`ProfileArray`, i.e. arrays of ranks and
+    weights instead of :class:`BallotOrder` objects, and they count them with the vectorized tallies of the rules and
+    matrices (e.g. :meth:`Scorer.score_profile` or :class:`MatrixWeightedMajority`). If the profile has no voters,
+    equal ballots are grouped before the profile is split.
+
+    This is possible for the objects that have a tally, e.g. :class:`RuleScoreNumAverage` and its subclasses (such as
+    :class:`RuleBorda`, :class:`RulePlurality` or :class:`RuleRangeVoting`), :class:`RuleMajorityJudgment`,
+    :class:`RuleBucklinInstant`, :class:`MatrixWeightedMajority` and the rules and matrices based on it (such as
+    :class:`RuleMaximin`, :class:`RuleCopeland` or :class:`RuleSchulze`).
+
+    Parameters
+    ----------
+    x : IncrementalMixin
+        A rule or a matrix (its parameters are used, but the object itself is not sent to the workers).
+    ballots : list or Profile
+        The ballots. It can be a :class:`ProfileArray`.
+    weights : list
+        The weights (as in ``__call__``).
+    voters : list
+        The voters (as in ``__call__``).
+    candidates : set
+        The candidates. Default: the candidates of the ballots.
+    n_jobs : int
+        The number of processes. Default: the number of processors. If 1, then no process is launched.
+    chunk_size : int
+        The number of ballots of each part of the profile (after grouping equal ballots, if applicable). Default: the
+        number of ballots divided by ``n_jobs``.
+
+    Returns
+    -------
+    IncrementalMixin
+        The object `x` itself. Its results are the same as if it had been called on the profile, but its profile is
+        empty (cf. :meth:`Rule.load_tally`).
+
+    Examples
+    --------
+        >>> from whalrus.rules.rule_borda import RuleBorda
+        >>> rule = evaluate_in_parallel(RuleBorda(), ['a > b > c', 'b > a > c', 'a > c > b'], n_jobs=2)
+        >>> rule.scores_
+        {'a': Fraction(5, 3), 'b': 1, 'c': Fraction(1, 3)}
+        >>> rule.winner_
+        'a'
+    """
+    if not isinstance(ballots, ProfileArray) or weights is not None or voters is not None:
+        ballots = Profile(ballots, weights=weights, voters=voters)
+    if candidates is None:
+        candidates = ballots.candidates
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
+    if len(ballots) == 0:
+        return x(ballots, candidates=candidates)
+    shards = _shards(ballots, candidates, n_jobs, chunk_size)
+    blank = _blank_copy(x)
+    # The workers do not inherit the context of the caller, hence the policy is sent explicitly.
+    policy = get_numeric_policy() if x.numeric_policy is None else x.numeric_policy
+    if n_jobs == 1:
+        tallies = [_tally_of_shard(blank, shard, candidates, policy) for shard in shards]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            tallies = list(executor.map(_tally_of_shard, [blank] * len(shards), shards, [candidates] * len(shards),
+                                        [policy] * len(shards)))
+    return x.load_tally(sum(tallies), candidates=candidates)
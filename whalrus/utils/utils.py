@@ -1,55 +1,208 @@
 # -*- coding: utf-8 -*-
-from pyparsing import Group, Word, ZeroOrMore, alphas, nums, ParseException
+import re
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from contextvars import ContextVar
 from bisect import bisect_left
 from fractions import Fraction
 from decimal import Decimal
 from numbers import Number
+from typing import Iterable, Callable
 
 
-def _cache(f):
+#: The names of all the attributes on which a cached property declares that it depends (cf. :func:`cached_property`).
+_DECLARED_DEPENDENCIES = set()
+
+#: The names of the computed variables and private attributes that no cached property depends on: changing them does
+#: not invalidate any cache (cf. :meth:`DeleteCacheMixin.__setattr__`).
+_INERT_NAMES = set()
+
+
+class _CachedProperty:
     """
-    Auxiliary decorator used by ``cached_property``.
+    Descriptor returned by :func:`cached_property`.
+
+    The value is stored in the ``__dict__`` of the instance, under the name of the property. Since this descriptor
+    does not define ``__set__``, the later accesses find the value in the instance dictionary directly, without calling
+    the descriptor.
+    """
+
+    def __init__(self, f: Callable, depends_on: Iterable = None):
+        self.f = f
+        self.name = f.__name__
+        self.depends_on = None if depends_on is None else tuple(depends_on)
+        _DECLARED_DEPENDENCIES.update(self.depends_on or ())
+        _INERT_NAMES.difference_update(self.depends_on or ())
+        # Like ``functools.update_wrapper``, so that the docstring (and its doctests) are found.
+        self.__doc__ = f.__doc__
+        self.__module__ = f.__module__
+        self.__qualname__ = f.__qualname__
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, instance: object, owner: type = None) -> object:
+        if instance is None:
+            return self
+        # The value is computed with the numeric policy that the object recorded when it was called, if any.
+        d = instance.__dict__
+        policy = d.get('numeric_policy_')
+        if policy is None or policy == _numeric_policy.get():
+            value = self.f(instance)
+        else:
+            value = _compute(self.f, instance, policy)
+        d[self.name] = value
+        return value
+
+
+def _compute(f: Callable, instance: object, policy: str) -> object:
+    """Compute a cached property with a given numeric policy (cf. :func:`numeric_policy`)."""
+    token = _numeric_policy.set(policy)
+    try:
+        return f(instance)
+    finally:
+        _numeric_policy.reset(token)
+
+
+def cached_property(f: Callable = None, depends_on: Iterable = None):
+    """
+    Decorator used in replacement of @property to put the value in cache automatically.
+
+    The first time the attribute is used, it is computed on-demand and put in cache. Later accesses to the
+    attributes will use the cached value.
 
     Parameters
     ----------
     f : callable
         A method with no argument (except ``self``).
+    depends_on : iterable of str
+        The names of the attributes (parameters or other cached properties) that the value depends on. If None
+        (default), the value is considered to depend on all the parameters of the object. Cf. :class:`DeleteCacheMixin`.
 
-    Returns
-    -------
-    callable
-        The same function, but with a `caching' behavior.
+    Examples
+    --------
+    Cf. :class:`DeleteCacheMixin`.
+    """
+    if f is None:
+        return lambda g: _CachedProperty(g, depends_on=depends_on)
+    return _CachedProperty(f, depends_on=depends_on)
+
+
+class _CacheInfo:
     """
-    name = f.__name__
+    Cached properties of a class and their dependencies (computed once per class, cf. :func:`_cache_info`).
 
-    # noinspection PyProtectedMember
-    def _f(*args):
+    Parameters
+    ----------
+    cls : type
+        A class.
+    """
+
+    def __init__(self, cls: type):
+        depends_on = dict()
+        seen = set()
+        for klass in cls.__mro__:
+            for name, value in vars(klass).items():
+                if name not in seen:
+                    seen.add(name)
+                    if isinstance(value, _CachedProperty):
+                        depends_on[name] = value.depends_on
+        self.names = frozenset(depends_on)
+        self.depends_on = depends_on
+        self.explicit_parameters = getattr(cls, '_explicit_parameters', frozenset())
+        self.dependents = dict()
+        for name, dependencies in depends_on.items():
+            for dependency in dependencies or ():
+                self.dependents.setdefault(dependency, set()).add(name)
+        self._invalidated_by = dict()
+
+    def invalidated_by(self, name: str) -> frozenset:
+        """
+        Cached properties that become obsolete when an attribute changes.
+
+        Parameters
+        ----------
+        name : str
+            The name of an attribute.
+
+        Returns
+        -------
+        frozenset
+            The names of the cached properties that depend (directly or not) on this attribute. If the attribute is a
+            parameter (a public attribute that is not a cached property), it includes the cached properties that do not
+            declare their dependencies, unless the parameter is in ``_explicit_parameters``.
+        """
         try:
-            return args[0]._cached_properties[name]
+            return self._invalidated_by[name]
         except KeyError:
-            # Not stored in cache
-            value = f(*args)
-            args[0]._cached_properties[name] = value
-            return value
-        except AttributeError:
-            # cache does not even exist
-            value = f(*args)
-            args[0]._cached_properties = {name: value}
-            return value
-    _f.__doc__ = f.__doc__
-    return _f
+            pass
+        if (name not in self.names and not name.startswith('_') and not name.endswith('_')
+                and name not in self.explicit_parameters):
+            result = {n for n, dependencies in self.depends_on.items() if dependencies is None}
+        else:
+            result = set()
+        to_visit = [name] + list(result)
+        while to_visit:
+            for dependent in self.dependents.get(to_visit.pop(), ()):
+                if dependent not in result:
+                    result.add(dependent)
+                    to_visit.append(dependent)
+        result.discard(name)
+        self._invalidated_by[name] = frozenset(result)
+        return self._invalidated_by[name]
 
 
-def cached_property(f):
+_CACHE_INFOS = dict()
+
+
+def _cache_info(cls: type) -> _CacheInfo:
+    """The :class:`_CacheInfo` of a class."""
+    try:
+        return _CACHE_INFOS[cls]
+    except KeyError:
+        info = _CACHE_INFOS[cls] = _CacheInfo(cls)
+        return info
+
+
+class _CachedValues(MutableMapping):
     """
-    Decorator used in replacement of @property to put the value in cache automatically.
+    The values of the cached properties that are currently computed for an object (cf. :class:`DeleteCacheMixin`).
 
-    The first time the attribute is used, it is computed on-demand and put in cache. Later accesses to the
-    attributes will use the cached value.
+    This is a view: reading or writing it reads or writes the ``__dict__`` of the object.
 
-    Cf. :class:`DeleteCacheMixin` for an example.
+    Parameters
+    ----------
+    obj : object
+        An object with cached properties.
     """
-    return property(_cache(f))
+
+    def __init__(self, obj: object):
+        self._dict = obj.__dict__
+        self._names = _cache_info(type(obj)).names
+
+    def __getitem__(self, name: str) -> object:
+        if name not in self._names:
+            raise KeyError(name)
+        return self._dict[name]
+
+    def __setitem__(self, name: str, value: object) -> None:
+        if name not in self._names:
+            raise KeyError(name)
+        self._dict[name] = value
+
+    def __delitem__(self, name: str) -> None:
+        if name not in self._names:
+            raise KeyError(name)
+        del self._dict[name]
+
+    def __iter__(self):
+        return iter([name for name in self._dict if name in self._names])
+
+    def __len__(self) -> int:
+        return sum(name in self._names for name in self._dict)
 
 
 class DeleteCacheMixin:
@@ -75,11 +228,202 @@ class DeleteCacheMixin:
         >>> a.x
         Big computation...
         42
+
+    A cached property may declare the attributes it depends on. When a parameter (a public attribute) is changed, only
+    the cached properties that depend on it (directly or not) are deleted, as well as those that do not declare
+    their dependencies:
+
+        >>> class Example(DeleteCacheMixin):
+        ...     def __init__(self, factor, offset):
+        ...         self.factor = factor
+        ...         self.offset = offset
+        ...     @cached_property(depends_on=['factor'])
+        ...     def product_(self):
+        ...         print('Computing the product...')
+        ...         return 6 * self.factor
+        ...     @cached_property(depends_on=['product_', 'offset'])
+        ...     def total_(self):
+        ...         print('Computing the total...')
+        ...         return self.product_ + self.offset
+        >>> a = Example(factor=7, offset=1)
+        >>> a.total_
+        Computing the total...
+        Computing the product...
+        43
+        >>> a.offset = 2
+        >>> a.total_
+        Computing the total...
+        44
+        >>> a.factor = 1
+        >>> a.total_
+        Computing the total...
+        Computing the product...
+        8
+
+    A private attribute only affects the cached properties that explicitly depend on it. When an attribute is modified
+    in place (e.g. a list), the cache can be updated with :meth:`invalidate`.
     """
 
-    # noinspection PyAttributeOutsideInit
+    #: Parameters that only affect the cached properties that explicitly depend on them. For example, in a
+    #: :class:`Rule`, the tie-breaking rule does not affect the scores.
+    _explicit_parameters = frozenset()
+
+    def __setattr__(self, name: str, value: object) -> None:
+        object.__setattr__(self, name, value)
+        # Fast path: a computed variable or a private attribute only invalidates the cached properties that declare
+        # that they depend on it.
+        if name in _INERT_NAMES:
+            return
+        if (name.endswith('_') or name.startswith('_')) and name not in _DECLARED_DEPENDENCIES:
+            _INERT_NAMES.add(name)
+            return
+        names = _cache_info(type(self)).invalidated_by(name)
+        if names:
+            self._invalidate(names)
+
+    @property
+    def _cached_properties(self) -> _CachedValues:
+        """_CachedValues: The cached values, as a mapping from the names of the cached properties to their values."""
+        return _CachedValues(self)
+
+    def _invalidate(self, names: frozenset) -> None:
+        d = self.__dict__
+        if not names.isdisjoint(d):
+            for name in names.intersection(d):
+                del d[name]
+
+    def invalidate(self, *names: str) -> None:
+        """
+        Delete some cached properties, and those that depend on them.
+
+        Parameters
+        ----------
+        names : str
+            The names of cached properties, or of the attributes they depend on.
+        """
+        info = _cache_info(type(self))
+        for name in names:
+            self._invalidate(info.invalidated_by(name) | (info.names & {name}))
+
     def delete_cache(self) -> None:
-        self._cached_properties = dict()
+        """Delete all the cached properties."""
+        d = self.__dict__
+        names = _cache_info(type(self)).names
+        if not names.isdisjoint(d):
+            for name in names.intersection(d):
+                del d[name]
+
+
+class WeakOrderParseError(ValueError):
+    """
+    Exception raised when a string cannot be parsed as a weak order.
+
+    Parameters
+    ----------
+    s : str
+        The string.
+    loc : int
+        The position of the first unexpected character.
+    msg : str
+        A description of what was expected.
+
+    Examples
+    --------
+        >>> parse_weak_order('a > b * c')
+        Traceback (most recent call last):
+        ...
+        whalrus.utils.utils.WeakOrderParseError: Expected '>' or '~', found '*' (at char 6): 'a > b * c'
+
+    The exception can be pickled, e.g. to be sent back by a worker process (cf. :func:`evaluate_in_parallel`):
+
+        >>> import pickle
+        >>> try:
+        ...     parse_weak_order('a > b * c')
+        ... except WeakOrderParseError as e:
+        ...     print(pickle.loads(pickle.dumps(e)).loc)
+        6
+    """
+
+    def __init__(self, s: str, loc: int, msg: str):
+        self.s = s
+        self.loc = loc
+        self.msg = msg
+        super().__init__('%s (at char %d): %r' % (msg, loc, s))
+
+    def __reduce__(self):
+        return type(self), (self.s, self.loc, self.msg)
+
+
+# Characters allowed in the name of a candidate, and whitespace characters (the same as in ``str.split``, restricted to
+# ASCII, so that they can be removed safely once the string is validated).
+_CANDIDATE_CHARS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_')
+_WHITESPACE_CHARS = frozenset(' \t\n\r')
+_WEAK_ORDER_RE = re.compile(r'[ \t\n\r]*(?:\w+(?:[ \t\n\r]*(?:~+|>+)[ \t\n\r]*\w+)*)?[ \t\n\r]*', re.ASCII)
+_GREATER_RE = re.compile(r'>+')
+_TILDE_RE = re.compile(r'~+')
+
+
+def _weak_order_error(s: str) -> WeakOrderParseError:
+    """
+    Find the first unexpected character in a string that is not a valid weak order.
+
+    Parameters
+    ----------
+    s : str
+
+    Returns
+    -------
+    WeakOrderParseError
+        The exception describing the problem.
+    """
+    expect_candidate = True
+    first = True
+    i, n = 0, len(s)
+    while True:
+        while i < n and s[i] in _WHITESPACE_CHARS:
+            i += 1
+        if i == n:
+            if expect_candidate and not first:
+                return WeakOrderParseError(s, i, 'Expected a candidate, found end of text')
+            return WeakOrderParseError(s, i, 'Unexpected end of text')
+        if expect_candidate:
+            if s[i] not in _CANDIDATE_CHARS:
+                return WeakOrderParseError(s, i, 'Expected a candidate, found %r' % s[i])
+            while i < n and s[i] in _CANDIDATE_CHARS:
+                i += 1
+        else:
+            if s[i] not in '>~':
+                return WeakOrderParseError(s, i, "Expected '>' or '~', found %r" % s[i])
+            separator = s[i]
+            while i < n and s[i] == separator:
+                i += 1
+        expect_candidate = not expect_candidate
+        first = False
+
+
+def _parse_weak_order(s: str) -> tuple:
+    """
+    Parse a string representing a weak order.
+
+    Parameters
+    ----------
+    s : str
+
+    Returns
+    -------
+    tuple
+        A tuple of tuples, where each tuple is an indifference class.
+    """
+    if _WEAK_ORDER_RE.fullmatch(s) is None:
+        raise _weak_order_error(s)
+    # Once the string is validated, whitespace is irrelevant: two consecutive candidates are always separated.
+    s = ''.join(s.split())
+    if not s:
+        return ()
+    if '>>' in s or '~~' in s:
+        # Repeated separators are allowed (e.g. 'a >> b'), but they are rare: only use regular expressions in that case.
+        return tuple(tuple(_TILDE_RE.split(c)) for c in _GREATER_RE.split(s))
+    return tuple(tuple(c.split('~')) for c in s.split('>'))
 
 
 def parse_weak_order(s: str) -> list:
@@ -89,6 +433,8 @@ def parse_weak_order(s: str) -> list:
     Parameters
     ----------
     s : str
+        Names of candidates consist of letters, digits and underscores. They are separated by ``>`` (strict
+        preference) or ``~`` (indifference), with optional whitespace.
 
     Returns
     -------
@@ -96,28 +442,160 @@ def parse_weak_order(s: str) -> list:
         A list of sets, where each set is an indifference class. The first set of the list contains the top (= most
         liked) candidates, while the last set of the list contains the bottom (= most disliked) candidates.
 
+    Raises
+    ------
+    WeakOrderParseError
+        If the string does not represent a weak order.
+
     Examples
     --------
         >>> s = 'Alice ~ Bob ~ Catherine32 > me > you ~ us > them'
         >>> parse_weak_order(s) == [{'Alice', 'Bob', 'Catherine32'}, {'me'}, {'you', 'us'}, {'them'}]
         True
+        >>> parse_weak_order('')
+        []
     """
+    return [NiceSet(c) for c in _parse_weak_order(s)]
 
-    # Build the parser
-    candidate = Word(alphas.upper() + alphas.lower() + nums + '_')
-    equiv_class = Group(candidate + ZeroOrMore(Word('~').suppress() + candidate))
-    weak_preference = equiv_class + ZeroOrMore(Word('>').suppress() + equiv_class)
-    empty_preference = ZeroOrMore(' ')
 
-    # if s = 'Jean ~ Titi ~ tata32 > me > you ~ us > them', then
-    # parsed = [['Jean', 'Titi', 'tata32'], ['me'], ['you', 'us'], ['them']]
-    try:
-        parsed = empty_preference.parseString(s, parseAll=True).asList()
-    except ParseException:
-        parsed = weak_preference.parseString(s, parseAll=True).asList()
+def parse_weak_orders(strings: Iterable) -> list:
+    """
+    Convert strings representing weak orders to lists of sets.
+
+    This is equivalent to ``[parse_weak_order(s) for s in strings]``, but each distinct string is parsed only once,
+    which is much faster for large inputs, where the same ballots typically appear many times.
+
+    Parameters
+    ----------
+    strings : iterable
+        An iterable of str.
+
+    Returns
+    -------
+    list
+        A list of weak orders, in the format of :func:`parse_weak_order`. They are distinct objects, even if some input
+        strings are equal.
 
-    # Final conversion to format [{'Jean', 'tata32', 'Titi'}, {'me'}, {'us', 'you'}, {'them'}]
-    return [NiceSet(s) for s in parsed]
+    Raises
+    ------
+    WeakOrderParseError
+        If one of the strings does not represent a weak order.
+
+    Examples
+    --------
+        >>> parse_weak_orders(['a > b ~ c', 'c > a', 'a > b ~ c'])
+        [[{'a'}, {'b', 'c'}], [{'c'}, {'a'}], [{'a'}, {'b', 'c'}]]
+    """
+    memo = dict()
+    results = []
+    for s in strings:
+        try:
+            parsed = memo[s]
+        except KeyError:
+            parsed = memo[s] = _parse_weak_order(s)
+        results.append([NiceSet(c) for c in parsed])
+    return results
+
+
+class RestrictionCache:
+    """
+    A bounded cache for the restrictions of ballots to subsets of candidates.
+
+    An entry is identified by the identity of a ballot and the set of candidates. The entry only keeps a weak reference
+    to the ballot: it does not keep the ballot alive, and it is ignored if the identity is reused by another object
+    after the ballot is deleted. When there are more than :attr:`maxsize` entries, the least recently used one is
+    discarded.
+
+    The cache can be shared between threads: its entries are read and updated under a lock. A restriction that is not
+    in the cache is computed outside the lock, so two threads may compute the same restriction at the same time, in
+    which case they get equal (but possibly distinct) objects.
+
+    Parameters
+    ----------
+    maxsize : int
+        The maximal number of entries. If 0, nothing is stored.
+
+    Attributes
+    ----------
+    hits : int
+        The number of restrictions found in the cache.
+    misses : int
+        The number of restrictions that were computed.
+
+    Examples
+    --------
+    The ballots must support weak references:
+
+        >>> class Ballot(list):
+        ...     pass
+        >>> cache = RestrictionCache(maxsize=2)
+        >>> ballot = Ballot(['a', 'b', 'c'])
+        >>> def restrict(candidates):
+        ...     print('Restricting...')
+        ...     return [c for c in ballot if c in candidates]
+        >>> cache.get(ballot, {'a', 'b'}, restrict)
+        Restricting...
+        ['a', 'b']
+        >>> cache.get(ballot, {'a', 'b'}, restrict)
+        ['a', 'b']
+        >>> cache.hits, cache.misses
+        (1, 1)
+        >>> cache.clear()
+        >>> cache.get(ballot, {'a', 'b'}, restrict)
+        Restricting...
+        ['a', 'b']
+    """
+
+    def __init__(self, maxsize: int = 65536):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, ballot: object, candidates: set, restrict: Callable) -> object:
+        """
+        Get the restriction of a ballot.
+
+        Parameters
+        ----------
+        ballot : object
+            The ballot. It must support weak references and must not be modified afterwards.
+        candidates : set
+            The candidates.
+        restrict : callable
+            The function computing the restriction if it is not in the cache. Its input is `candidates`.
+
+        Returns
+        -------
+        object
+            The restriction of the ballot.
+        """
+        key = (id(ballot), candidates if isinstance(candidates, frozenset) else frozenset(candidates))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0]() is ballot:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry[1]
+            self.misses += 1
+        restricted = restrict(candidates)
+        if self.maxsize > 0:
+            with self._lock:
+                self._entries[key] = (weakref.ref(ballot), restricted)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return restricted
+
+    def clear(self) -> None:
+        """
+        Remove all the entries (and reset :attr:`hits` and :attr:`misses`).
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
 
 
 def set_to_list(s: set) -> list:
@@ -356,14 +834,195 @@ def my_division(x: Number, y: Number, divide_by_zero: Number = None):
 
         >>> my_division(1, 0, divide_by_zero=42)
         42
+
+    With the numeric policy ``'integer'`` (cf. :func:`numeric_policy`), the exact result is computed, then converted
+    to a float if it is not an integer. Hence two divisions with the same exact result give the same float:
+
+        >>> with numeric_policy('integer'):
+        ...     my_division(5, 2), my_division(4, 2), my_division(1, 10) == my_division(Fraction(1, 2), 5)
+        (2.5, 2, True)
+
+    With the numeric policy ``'float'``, the division is computed with floats:
+
+        >>> with numeric_policy('float'):
+        ...     my_division(4, 2)
+        2.0
     """
     if y == 0:
         if divide_by_zero is None:
             raise ZeroDivisionError
         return divide_by_zero
+    policy = _numeric_policy.get()
+    if policy == 'float':
+        return float(x) / float(y)
     if isinstance(x, float) or isinstance(y, float):
         return x / y
     try:
-        return convert_number(Fraction(x) / Fraction(y))
-    except ValueError:
+        result = Fraction(x) / Fraction(y)
+    except (TypeError, ValueError):
         raise NotImplementedError
+    if policy == 'integer':
+        return result.numerator if result.denominator == 1 else float(result)
+    return convert_number(result)
+
+
+# Numeric policy
+# ==============
+
+#: The possible numeric policies. Cf. :func:`numeric_policy`.
+NUMERIC_POLICIES = ('exact', 'integer', 'float')
+
+_numeric_policy = ContextVar('numeric_policy', default='exact')
+
+
+def check_numeric_policy(policy: str) -> None:
+    """
+    Check that a numeric policy is valid.
+
+    Parameters
+    ----------
+    policy : str or None
+        A numeric policy (cf. :func:`numeric_policy`). None is also accepted (it means that the current policy is
+        used).
+
+    Examples
+    --------
+        >>> check_numeric_policy('float')
+        >>> check_numeric_policy('double')
+        Traceback (most recent call last):
+        ValueError: Unknown numeric policy: 'double'. Possible values: 'exact', 'integer', 'float'.
+    """
+    if policy is not None and policy not in NUMERIC_POLICIES:
+        raise ValueError('Unknown numeric policy: %r. Possible values: %s.'
+                         % (policy, ', '.join(repr(p) for p in NUMERIC_POLICIES)))
+
+
+def get_numeric_policy() -> str:
+    """
+    The current numeric policy.
+
+    Returns
+    -------
+    str
+        The numeric policy (cf. :func:`numeric_policy`).
+
+    Examples
+    --------
+        >>> get_numeric_policy()
+        'exact'
+    """
+    return _numeric_policy.get()
+
+
+@contextmanager
+def numeric_policy(policy: str):
+    """
+    Context manager setting the numeric policy.
+
+    The numeric policy decides the type of the numbers that are computed by the rules, the matrices and the scorers:
+
+    * ``'exact'`` (default): results are integers or fractions (or floats if some inputs are floats). This is the
+      slowest, but it is exact, e.g. to certify a result.
+    * ``'integer'``: sums (such as the tallies of the rules and matrices) are accumulated exactly, as (scaled)
+      integers. The results of the divisions are floats, but they are computed from the exact values, and values
+      that are combined after a division (e.g. the sums of the rows of a weighted majority matrix) are computed with
+      a common denominator. Hence the values that are equal with the ``'exact'`` policy are equal with this one,
+      and the winners are the same. Matrices are arrays of native NumPy types (instead of arrays of objects).
+    * ``'float'``: all computations are done with floats. This is the fastest, but rounding errors may occur (e.g.
+      two candidates with the same score may be considered as not tied).
+
+    A :class:`Rule`, a :class:`Matrix` or a :class:`Scorer` records the current policy when it is called, and its
+    computed variables use this policy, even if they are computed later, outside of the context manager. The numeric
+    policy can also be set for a particular object with its parameter ``numeric_policy``: in that case, its computed
+    variables always use this policy.
+
+    Parameters
+    ----------
+    policy : str
+        ``'exact'``, ``'integer'`` or ``'float'``.
+
+    Examples
+    --------
+        >>> from whalrus import MatrixWeightedMajority
+        >>> ballots = ['a > b > c', 'b > a > c', 'c > a > b']
+        >>> MatrixWeightedMajority(ballots).as_array_
+        array([[0, Fraction(2, 3), Fraction(2, 3)],
+               [Fraction(1, 3), 0, Fraction(2, 3)],
+               [Fraction(1, 3), Fraction(1, 3), 0]], dtype=object)
+        >>> with numeric_policy('float'):
+        ...     matrix = MatrixWeightedMajority(ballots)
+        >>> matrix.as_array_
+        array([[0.        , 0.66666667, 0.66666667],
+               [0.33333333, 0.        , 0.66666667],
+               [0.33333333, 0.33333333, 0.        ]])
+    """
+    check_numeric_policy(policy)
+    token = _numeric_policy.set(policy)
+    try:
+        yield
+    finally:
+        _numeric_policy.reset(token)
+
+
+def apply_numeric_policy(x: Number) -> Number:
+    """
+    Convert the result of a computation according to the current numeric policy.
+
+    Parameters
+    ----------
+    x : Number
+        A number.
+
+    Returns
+    -------
+    Number
+        With the ``'exact'`` policy, ``convert_number(x)``. With the ``'integer'`` policy, `x` if it is an integer, and
+        ``float(x)`` otherwise. With the ``'float'`` policy, ``float(x)``. Cf. :func:`numeric_policy`.
+
+    Examples
+    --------
+        >>> apply_numeric_policy(Fraction(4, 2))
+        2
+        >>> with numeric_policy('integer'):
+        ...     apply_numeric_policy(Fraction(4, 2)), apply_numeric_policy(Fraction(1, 2))
+        (2, 0.5)
+        >>> with numeric_policy('float'):
+        ...     apply_numeric_policy(2)
+        2.0
+    """
+    policy = _numeric_policy.get()
+    if policy == 'exact' or x is None:
+        return convert_number(x)
+    if policy == 'integer':
+        x = convert_number(x)
+        return x if isinstance(x, int) else float(x)
+    return float(x)
+
+
+def apply_numeric_policy_to_total(x: Number) -> Number:
+    """
+    Convert a total (e.g. a gross score or a total weight) according to the current numeric policy.
+
+    Parameters
+    ----------
+    x : Number
+        A number.
+
+    Returns
+    -------
+    Number
+        With the ``'exact'`` and ``'integer'`` policies, ``convert_number(x)``: totals are exact (cf.
+        :func:`numeric_policy`). With the ``'float'`` policy, ``float(x)``.
+
+    Examples
+    --------
+        >>> with numeric_policy('integer'):
+        ...     apply_numeric_policy_to_total(Fraction(1, 2))
+        Fraction(1, 2)
+        >>> with numeric_policy('float'):
+        ...     apply_numeric_policy_to_total(Fraction(1, 2))
+        0.5
+    """
+    if _numeric_policy.get() != 'float' or x is None:
+        return convert_number(x)
+    return float(x)